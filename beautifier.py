@@ -1,4 +1,4 @@
-from django.db.models import Q, QuerySet
+from django.db.models import Model, Q, QuerySet
 
 from translations.models import TranslatableQuerySet
 
@@ -66,7 +66,11 @@ def q_iterator(obj, beautifier):
 
 
 def queryset_iterator(obj, beautifier):
-    return [beautifier(value) for value in sorted(obj, key=lambda x: x.pk)]
+    values = list(obj)
+    # the rows of `values` and `values_list` keep the queryset order
+    if all(isinstance(value, Model) for value in values):
+        values.sort(key=lambda x: x.pk)
+    return [beautifier(value) for value in values]
 
 
 def beautify_iter(obj, base, first, opener, closer, iterator):
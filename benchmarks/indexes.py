@@ -0,0 +1,146 @@
+"""
+Benchmark the `Translation` indexes on SQLite.
+
+Builds a table shaped like ``translations_translation``, fills it with
+a million rows and runs the read query of ``_get_translations`` and the
+filter query of ``_fetch_translations_query_getter`` before and after
+creating the indexes of the ``0003_translation_indexes`` migration,
+printing the query plans and the latencies.
+
+Run it from the root of the repo::
+
+    python benchmarks/indexes.py --rows 1000000
+"""
+
+import argparse
+import random
+import sqlite3
+import time
+
+
+TABLE = '''
+CREATE TABLE "translations_translation" (
+    "id" integer NOT NULL PRIMARY KEY AUTOINCREMENT,
+    "object_id" varchar(128) NOT NULL,
+    "field" varchar(64) NOT NULL,
+    "language" varchar(32) NOT NULL,
+    "text" text NOT NULL,
+    "content_type_id" integer NOT NULL
+)
+'''
+
+UNIQUE_INDEX = '''
+CREATE UNIQUE INDEX "translations_translation_unique"
+ON "translations_translation"
+("content_type_id", "object_id", "field", "language")
+'''
+
+INDEXES = [
+    '''
+    CREATE INDEX "translations_lang_ct_obj_idx"
+    ON "translations_translation"
+    ("language", "content_type_id", "object_id")
+    ''',
+    '''
+    CREATE INDEX "translations_ct_field_lang_idx"
+    ON "translations_translation"
+    ("content_type_id", "field", "language")
+    ''',
+]
+
+CONTENT_TYPES = 10
+FIELDS = ('name', 'denonym')
+LANGUAGES = ('de', 'tr')
+
+
+def create_table(connection, rows):
+    """Create the table and fill it with some rows."""
+    connection.execute(TABLE)
+    connection.execute(UNIQUE_INDEX)
+
+    per_content_type = rows // (CONTENT_TYPES * len(FIELDS) * len(LANGUAGES))
+
+    def generate():
+        for content_type_id in range(1, CONTENT_TYPES + 1):
+            for object_id in range(per_content_type):
+                for field in FIELDS:
+                    for language in LANGUAGES:
+                        yield (
+                            str(object_id),
+                            field,
+                            language,
+                            '{}-{}-{}'.format(field, object_id, language),
+                            content_type_id,
+                        )
+
+    connection.executemany(
+        'INSERT INTO "translations_translation" '
+        '("object_id", "field", "language", "text", "content_type_id") '
+        'VALUES (?, ?, ?, ?, ?)',
+        generate(),
+    )
+    connection.execute('ANALYZE')
+    connection.commit()
+
+    return per_content_type
+
+
+def get_queries(per_content_type):
+    """Return the benchmarked queries and their parameters."""
+    object_ids = [
+        str(x) for x in random.sample(range(per_content_type), 500)
+    ]
+    read = (
+        'SELECT * FROM "translations_translation" '
+        'WHERE "language" = ? AND "content_type_id" = ? '
+        'AND "object_id" IN ({})'.format(', '.join('?' * len(object_ids))),
+        ['de', 3] + object_ids,
+    )
+    filter = (
+        'SELECT "object_id" FROM "translations_translation" '
+        'WHERE "content_type_id" = ? AND "field" = ? '
+        'AND "language" = ? AND "text" = ?',
+        [3, 'name', 'tr', 'name-42-tr'],
+    )
+    return {'read': read, 'filter': filter}
+
+
+def benchmark(connection, queries, repeat):
+    """Print the plan and the average latency of some queries."""
+    for (name, (sql, params)) in queries.items():
+        plan = connection.execute('EXPLAIN QUERY PLAN ' + sql, params)
+        details = '; '.join(row[-1] for row in plan)
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            connection.execute(sql, params).fetchall()
+        elapsed = (time.perf_counter() - start) / repeat
+
+        print('  {:<7} {:>9.3f} ms  {}'.format(name, elapsed * 1000, details))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--repeat', type=int, default=20)
+    options = parser.parse_args()
+
+    random.seed(0)
+    connection = sqlite3.connect(':memory:')
+
+    per_content_type = create_table(connection, options.rows)
+    queries = get_queries(per_content_type)
+
+    print('Without the indexes:')
+    benchmark(connection, queries, options.repeat)
+
+    for index in INDEXES:
+        connection.execute(index)
+    connection.execute('ANALYZE')
+
+    print('With the indexes:')
+    benchmark(connection, queries, options.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark the per-filter overhead of the translated lookups.
+
+Builds translated ``filter()`` calls on the sample models with
+the lookup and getter caches cleared before every call (the old behaviour)
+and with them warm, printing the average time it takes to build each
+queryset. The querysets are never evaluated, so only the overhead of
+dissecting the lookups and building the query is measured.
+
+Run it from the root of the repo::
+
+    python benchmarks/lookups.py --repeat 10000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import django
+from django.conf import settings
+
+
+FILTERS = {
+    'field': {
+        'name': 'Europa',
+    },
+    'relation': {
+        'countries__name__icontains': 'Deutsch',
+    },
+    'nested': {
+        'code': 'EU',
+        'countries__cities__name__startswith': 'Kö',
+        'countries__cities__denonym__startswith': 'Kö',
+    },
+}
+
+
+def setup():
+    """Configure Django with the sample app on an in-memory database."""
+    sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+    settings.configure(
+        INSTALLED_APPS=[
+            'django.contrib.contenttypes',
+            'translations',
+            'sample',
+        ],
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:',
+            },
+        },
+        LANGUAGE_CODE='en',
+        LANGUAGES=[('en', 'English'), ('de', 'German'), ('tr', 'Turkish')],
+        DEFAULT_AUTO_FIELD='django.db.models.AutoField',
+    )
+    django.setup()
+
+    from django.core.management import call_command
+    call_command('migrate', verbosity=0)
+
+
+def benchmark(repeat, cached):
+    """Print the average time it takes to build the translated filters."""
+    from translations.query import _clear_query_caches
+    from sample.models import Continent
+
+    for (name, lookups) in FILTERS.items():
+        # warm up the content types and the caches
+        str(Continent.objects.probe('de').filter(**lookups).query)
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            if not cached:
+                _clear_query_caches()
+            Continent.objects.probe(['en', 'de']).filter(**lookups)
+        elapsed = (time.perf_counter() - start) / repeat
+
+        print('  {:<9} {:>9.1f} us'.format(name, elapsed * 1000000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=10000)
+    options = parser.parse_args()
+
+    setup()
+
+    print('Without the caches:')
+    benchmark(options.repeat, cached=False)
+
+    print('With the caches:')
+    benchmark(options.repeat, cached=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark building the purview of many instances.
+
+Builds the purview of the sample cities (and of their countries and
+continents) with the content type caches cleared before every build and
+with them warm, printing the average time it takes to build each purview.
+The relations are fetched before the measurement, so only the overhead of
+collecting the instances and snapshotting their fields is measured.
+
+Run it from the root of the repo::
+
+    python benchmarks/purview.py --instances 50000 --repeat 10
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import django
+from django.conf import settings
+
+
+HIERARCHIES = {
+    'flat': [],
+    'nested': ['country', 'country__continent'],
+}
+
+
+def setup():
+    """Configure Django with the sample app on an in-memory database."""
+    sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+    settings.configure(
+        INSTALLED_APPS=[
+            'django.contrib.contenttypes',
+            'translations',
+            'sample',
+        ],
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:',
+            },
+        },
+        LANGUAGE_CODE='en',
+        LANGUAGES=[('en', 'English'), ('de', 'German'), ('tr', 'Turkish')],
+        DEFAULT_AUTO_FIELD='django.db.models.AutoField',
+    )
+    django.setup()
+
+    from django.core.management import call_command
+    call_command('migrate', verbosity=0)
+
+
+def populate(instances):
+    """Create some cities in a single country."""
+    from sample.models import Continent, Country, City
+
+    europe = Continent.objects.create(code='EU', name='Europe')
+    germany = Country.objects.create(
+        code='DE', name='Germany', continent=europe
+    )
+    City.objects.bulk_create(
+        [
+            City(name='City {}'.format(i), country=germany)
+            for i in range(instances)
+        ],
+        batch_size=1000,
+    )
+
+
+def benchmark(repeat, cached):
+    """Print the average time it takes to build the purviews."""
+    from django.contrib.contenttypes.models import ContentType
+    from translations.utils import _get_relations_hierarchy, _get_purview, \
+        _clear_content_type_ids
+    from sample.models import City
+
+    for (name, relations) in HIERARCHIES.items():
+        hierarchy = _get_relations_hierarchy(*relations)
+        elapsed = 0
+        for _ in range(repeat):
+            cities = list(City.objects.select_related(*relations))
+            if not cached:
+                ContentType.objects.clear_cache()
+                _clear_content_type_ids()
+
+            start = time.perf_counter()
+            _get_purview(cities, hierarchy)
+            elapsed += time.perf_counter() - start
+        elapsed /= repeat
+
+        print('  {:<9} {:>9.1f} ms'.format(name, elapsed * 1000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--instances', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=10)
+    options = parser.parse_args()
+
+    setup()
+    populate(options.instances)
+
+    print('Without the caches:')
+    benchmark(options.repeat, cached=False)
+
+    print('With the caches:')
+    benchmark(options.repeat, cached=True)
+
+
+if __name__ == '__main__':
+    main()
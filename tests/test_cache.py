@@ -0,0 +1,307 @@
+import tempfile
+import warnings
+
+from django.test import TestCase, override_settings
+from django.core.cache import caches
+from django.core.cache.backends.base import CacheKeyWarning
+from django.db.models import Value
+from django.db.models.signals import post_delete
+from django.contrib.contenttypes.models import ContentType
+
+from translations.models import Translation
+from translations.context import Context
+
+from sample.models import Continent
+from sample.utils import create_samples
+
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'translations': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'translations',
+    },
+}
+
+
+@override_settings(CACHES=CACHES, TRANSLATIONS_CACHE='translations')
+class CacheTest(TestCase):
+    """Tests for the translations cache."""
+
+    def setUp(self):
+        caches['translations'].clear()
+
+    def read(self, lang='de'):
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read(lang)
+        return europe
+
+    def test_read(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        self.read()
+        europe = Continent.objects.get(code='EU')
+
+        with self.assertNumQueries(0):
+            with Context(europe) as context:
+                context.read('de')
+
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(europe.denonym, 'Europäisch')
+
+    def test_read_misses(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        self.read()
+        continents = list(Continent.objects.order_by('code'))
+
+        # only asia is missing
+        with self.assertNumQueries(1):
+            with Context(continents) as context:
+                context.read('de')
+
+        with self.assertNumQueries(0):
+            with Context(continents) as context:
+                context.read('de')
+
+        self.assertEqual(continents[0].name, 'Asien')
+        self.assertEqual(continents[1].name, 'Europa')
+
+    def test_read_no_translations(self):
+        create_samples(
+            continent_names=['europe'],
+        )
+
+        self.read()
+        europe = Continent.objects.get(code='EU')
+
+        with self.assertNumQueries(0):
+            with Context(europe) as context:
+                context.read('de')
+
+        self.assertEqual(europe.name, 'Europe')
+
+    @override_settings(TRANSLATIONS_FALLBACKS={'tr': ['de']})
+    def test_read_fallbacks(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        self.read('de')
+
+        # the instance and only turkish are missing
+        with self.assertNumQueries(2):
+            europe = self.read('tr')
+
+        with self.assertNumQueries(1):
+            self.read('tr')
+
+        self.assertEqual(europe.name, 'Europa')
+
+        translation = Translation.objects.create(
+            content_type=ContentType.objects.get_for_model(Continent),
+            object_id='EU',
+            field='name',
+            language='tr',
+            text='Avrupa',
+        )
+        self.assertEqual(self.read('tr').name, 'Avrupa')
+        translation.delete()
+        self.assertEqual(self.read('tr').name, 'Europa')
+
+    def test_translation_save(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        self.read()
+        translation = Translation.objects.get(field='name', language='de')
+        translation.text = 'Europa Name'
+        translation.save()
+
+        self.assertEqual(self.read().name, 'Europa Name')
+
+    def test_translation_delete(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        self.read()
+        Translation.objects.filter(field='name', language='de').delete()
+
+        self.assertEqual(self.read().name, 'Europe')
+
+    def test_translations_bulk_create(self):
+        create_samples(
+            continent_names=['europe'],
+        )
+
+        self.read()
+        Translation.objects.bulk_create([
+            Translation(
+                content_type=ContentType.objects.get_for_model(Continent),
+                object_id='EU',
+                field='name',
+                language='de',
+                text='Europa',
+            ),
+        ])
+
+        self.assertEqual(self.read().name, 'Europa')
+
+    def test_translations_bulk_update(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        self.read()
+        translation = Translation.objects.get(field='name', language='de')
+        translation.text = 'Europa Name'
+        Translation.objects.bulk_update([translation], ['text'])
+
+        self.assertEqual(self.read().name, 'Europa Name')
+
+    def test_translations_update(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        self.read()
+        Translation.objects.filter(field='name', language='de').update(
+            text='Europa Name'
+        )
+
+        self.assertEqual(self.read().name, 'Europa Name')
+
+    def test_translations_update_address(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        self.read('de')
+        self.read('tr')
+        Translation.objects.filter(language='tr').delete()
+        Translation.objects.filter(language='de').update(
+            language=Value('tr')
+        )
+
+        self.assertEqual(self.read('de').name, 'Europe')
+        self.assertEqual(self.read('tr').name, 'Europa')
+
+    def test_key_object_id(self):
+        europe = Continent.objects.create(
+            code='E ', name='Europe', denonym='European'
+        )
+        Translation.objects.create(
+            content_type=ContentType.objects.get_for_model(Continent),
+            object_id='E ',
+            field='name',
+            language='de',
+            text='Europa',
+        )
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', CacheKeyWarning)
+            with Context(europe) as context:
+                context.read('de')
+
+        self.assertEqual(europe.name, 'Europa')
+
+    def test_context_create(self):
+        create_samples(
+            continent_names=['europe'],
+        )
+
+        self.read()
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            europe.name = 'Europa'
+            context.create('de')
+
+        self.assertEqual(self.read().name, 'Europa')
+
+    def test_context_update(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        self.read()
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            europe.name = 'Europa Name'
+            context.update('de')
+
+        self.assertEqual(self.read().name, 'Europa Name')
+
+    def test_context_delete(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        self.read()
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.delete('de')
+
+        self.assertEqual(self.read().name, 'Europe')
+
+    def test_file_based(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        with tempfile.TemporaryDirectory() as location:
+            file_caches = {
+                'default': CACHES['default'],
+                'translations': {
+                    'BACKEND':
+                        'django.core.cache.backends.filebased.FileBasedCache',
+                    'LOCATION': location,
+                },
+            }
+            with self.settings(CACHES=file_caches):
+                self.read()
+                europe = Continent.objects.get(code='EU')
+
+                with self.assertNumQueries(0):
+                    with Context(europe) as context:
+                        context.read('de')
+
+        self.assertEqual(europe.name, 'Europa')
+
+    def test_receivers(self):
+        self.assertTrue(post_delete.has_listeners(Translation))
+
+        with self.settings(TRANSLATIONS_CACHE=None):
+            self.assertFalse(post_delete.has_listeners(Translation))
+
+        self.assertTrue(post_delete.has_listeners(Translation))
@@ -1,9 +1,18 @@
-from django.test import TestCase
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+
+from django.test import TestCase, override_settings
+from django.db import connection, DatabaseError
+from django.db.models.query import QuerySet
+from django.contrib.contenttypes.models import ContentType
 from django.utils.translation import override
 
 from translations.context import Context
+from translations.models import Translation
+from translations.utils import _clear_content_type_ids
 
-from sample.models import Continent
+from sample.models import Continent, Country, City
 from sample.utils import create_samples
 
 
@@ -2508,6 +2517,111 @@ class ContextTest(TestCase):
             '`xx` is not a supported language.'
         )
 
+    def test_create_queryset_integer_pk(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne', 'munich'],
+        )
+
+        cities = list(City.objects.all())
+
+        with Context(cities) as context:
+            for city in cities:
+                city.name = '{} Name'.format(city.name)
+            context.create('de')
+
+        self.assertListEqual(
+            sorted(
+                Translation.objects.filter(
+                    language='de'
+                ).values_list('object_id_int', flat=True)
+            ),
+            sorted(city.pk for city in cities)
+        )
+
+    def test_create_queryset_batch_size(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+        )
+
+        continents = list(Continent.objects.all())
+
+        with Context(continents) as context:
+            for continent in continents:
+                continent.name = '{} Name'.format(continent.code)
+                continent.denonym = '{} Denonym'.format(continent.code)
+
+            # one insert per batch
+            with self.assertNumQueries(2):
+                context.create('de', batch_size=2)
+
+        self.assertEqual(
+            Translation.objects.filter(language='de').count(),
+            4
+        )
+
+    def test_create_queryset_batch_size_default(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+        )
+
+        continents = list(Continent.objects.all())
+
+        with Context(continents) as context:
+            for continent in continents:
+                continent.name = '{} Name'.format(continent.code)
+                continent.denonym = '{} Denonym'.format(continent.code)
+
+            # like the databases which do not limit the batch size
+            with mock.patch.object(
+                connection.ops,
+                'bulk_batch_size',
+                side_effect=lambda fields, objs: len(objs),
+            ):
+                with mock.patch(
+                    'translations.utils._DEFAULT_BATCH_SIZE', 3
+                ):
+                    with self.assertNumQueries(2):
+                        context.create('de')
+
+        self.assertEqual(
+            Translation.objects.filter(language='de').count(),
+            4
+        )
+
+    def test_create_queryset_batch_size_failure(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+        )
+
+        continents = list(Continent.objects.all())
+        bulk_create = Translation.objects.bulk_create
+
+        def fail_after_first(objs):
+            if bulk_create_mock.call_count > 1:
+                raise DatabaseError('Failed.')
+            return bulk_create(objs)
+
+        with Context(continents) as context:
+            for continent in continents:
+                continent.name = '{} Name'.format(continent.code)
+                continent.denonym = '{} Denonym'.format(continent.code)
+
+            with mock.patch.object(
+                Translation.objects,
+                'bulk_create',
+                side_effect=fail_after_first,
+            ) as bulk_create_mock:
+                with self.assertRaises(DatabaseError):
+                    context.create('de', batch_size=2)
+
+        # the first batch is committed on its own
+        self.assertEqual(
+            Translation.objects.filter(language='de').count(),
+            2
+        )
+
     @override(language='de', deactivate=True)
     def test_read_instance_level_0_relation_no_lang(self):
         create_samples(
@@ -3553,6 +3667,53 @@ class ContextTest(TestCase):
             '`xx` is not a supported language.'
         )
 
+    def test_read_generator(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = list(Continent.objects.order_by('code'))
+
+        with Context(obj for obj in continents) as context:
+            context.read('de')
+
+        self.assertEqual(continents[0].name, 'Asien')
+        self.assertEqual(continents[1].name, 'Europa')
+
+    def test_read_heterogeneous(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            city_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        europe = Continent.objects.get(code='EU')
+        germany = Country.objects.get(code='DE')
+        cologne = City.objects.get(name='Cologne')
+
+        with Context([cologne, europe, germany], fields=['name']) as context:
+            # all the content types at once
+            with self.assertNumQueries(1):
+                context.read('de')
+
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(europe.denonym, 'European')
+        self.assertEqual(germany.name, 'Deutschland')
+        self.assertEqual(germany.denonym, 'German')
+        self.assertEqual(cologne.name, 'Köln')
+
+        context.reset()
+
+        self.assertEqual(europe.name, 'Europe')
+        self.assertEqual(germany.name, 'Germany')
+        self.assertEqual(cologne.name, 'Cologne')
+
     @override(language='de', deactivate=True)
     def test_update_instance_level_0_relation_no_lang(self):
         create_samples(
@@ -5477,6 +5638,102 @@ class ContextTest(TestCase):
             '`xx` is not a supported language.'
         )
 
+    def test_update_instance_existing_and_new_translations(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name'],
+            langs=['de']
+        )
+
+        europe = Continent.objects.get(code='EU')
+        existing = Translation.objects.get(field='name', language='de')
+
+        with Context(europe) as context:
+            europe.name = 'Europe Name'
+            europe.denonym = 'Europe Denonym'
+            context.update('de')
+
+        # the existing translation is updated in place
+        self.assertEqual(
+            Translation.objects.get(field='name', language='de').pk,
+            existing.pk
+        )
+        self.assertQuerysetEqual(
+            Translation.objects.filter(language='de').order_by('field'),
+            [
+                '<Translation: European: Europe Denonym>',
+                '<Translation: Europe: Europe Name>',
+            ]
+        )
+
+    def test_update_instance_existing_and_new_translations_fallback(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name'],
+            langs=['de']
+        )
+
+        europe = Continent.objects.get(code='EU')
+        existing = Translation.objects.get(field='name', language='de')
+
+        with mock.patch.multiple(
+            connection.features,
+            create=True,
+            supports_update_conflicts=False,
+            supports_update_conflicts_with_target=False,
+        ):
+            with Context(europe) as context:
+                europe.name = 'Europe Name'
+                europe.denonym = 'Europe Denonym'
+                context.update('de')
+
+        self.assertEqual(
+            Translation.objects.get(field='name', language='de').pk,
+            existing.pk
+        )
+        self.assertQuerysetEqual(
+            Translation.objects.filter(language='de').order_by('field'),
+            [
+                '<Translation: European: Europe Denonym>',
+                '<Translation: Europe: Europe Name>',
+            ]
+        )
+
+    def test_update_queryset_batch_size(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.all()
+
+        with Context(continents) as context:
+            for continent in continents:
+                continent.name = '{} Name'.format(continent.code)
+            context.update('de', batch_size=1)
+
+        self.assertQuerysetEqual(
+            Translation.objects.filter(language='de').order_by('text'),
+            [
+                '<Translation: Asia: AS Name>',
+                '<Translation: Europe: EU Name>',
+            ]
+        )
+
+    def test_update_instance_no_changes(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        europe = Continent.objects.get(code='EU')
+
+        with Context(europe) as context:
+            with self.assertNumQueries(0):
+                context.update('de')
+
     @override(language='de', deactivate=True)
     def test_delete_instance_level_0_relation_no_lang(self):
         create_samples(
@@ -6601,6 +6858,427 @@ class ContextTest(TestCase):
             '`xx` is not a supported language.'
         )
 
+    def test_delete_queryset_batch_size(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        continents = Continent.objects.all()
+
+        with Context(continents, 'countries') as context:
+            # one delete per batch of each content type
+            with self.assertNumQueries(4):
+                context.delete('de', batch_size=1)
+
+        self.assertFalse(Translation.objects.filter(language='de').exists())
+        self.assertEqual(
+            Translation.objects.filter(language='tr').count(),
+            8
+        )
+
+    def test_delete_queryset_batch_size_failure(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.all()
+        delete = QuerySet.delete
+
+        def fail_after_first(queryset):
+            if delete_mock.call_count > 1:
+                raise DatabaseError('Failed.')
+            return delete(queryset)
+
+        with Context(continents) as context:
+            with mock.patch.object(
+                QuerySet,
+                'delete',
+                autospec=True,
+                side_effect=fail_after_first,
+            ) as delete_mock:
+                with self.assertRaises(DatabaseError):
+                    context.delete('de', batch_size=1)
+
+        # the first batch is committed on its own
+        self.assertEqual(
+            Translation.objects.filter(language='de').count(),
+            2
+        )
+
+    @override_settings(TRANSLATIONS_FALLBACKS={'tr': ['de']})
+    def test_read_fallbacks(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+        Translation.objects.create(
+            content_type=ContentType.objects.get_for_model(Continent),
+            object_id='EU',
+            field='name',
+            language='tr',
+            text='Avrupa',
+        )
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            with self.assertNumQueries(1):
+                context.read('tr')
+
+        self.assertEqual(europe.name, 'Avrupa')
+        self.assertEqual(europe.denonym, 'Europäisch')
+
+    @override_settings(TRANSLATIONS_FALLBACKS={'tr': ['de']})
+    def test_switch_fallbacks(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            with self.assertNumQueries(1):
+                context.switch('tr')
+
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(europe.denonym, 'Europäisch')
+
+    async def test_abuild(self):
+        await sync_to_async(create_samples)(
+            continent_names=['europe'],
+            country_names=['germany'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            langs=['de']
+        )
+        # the content types are fetched while building the purview
+        _clear_content_type_ids()
+        ContentType.objects.clear_cache()
+
+        europe = await Continent.objects.aget(code='EU')
+        context = await Context.abuild(europe, 'countries')
+
+        self.assertIsInstance(context, Context)
+        self.assertEqual(
+            [obj.name for obj in context._get_objects()],
+            ['Europe', 'Germany']
+        )
+
+    async def test_aread(self):
+        await sync_to_async(create_samples)(
+            continent_names=['europe'],
+            country_names=['germany'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            langs=['de']
+        )
+        _clear_content_type_ids()
+        ContentType.objects.clear_cache()
+
+        europe = await Continent.objects.aget(code='EU')
+        with await Context.abuild(europe, 'countries') as context:
+            await context.aread('de')
+
+        germany = europe._prefetched_objects_cache['countries'][0]
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(europe.denonym, 'Europäisch')
+        self.assertEqual(germany.name, 'Deutschland')
+
+    async def test_acreate_aupdate_adelete(self):
+        await sync_to_async(create_samples)(
+            continent_names=['europe'],
+        )
+
+        europe = await Continent.objects.aget(code='EU')
+        with await Context.abuild(europe) as context:
+            europe.name = 'Europa'
+            await context.acreate('de')
+            europe.name = 'Europa Name'
+            await context.aupdate('de')
+
+        europe = await Continent.objects.translate('de').aget(code='EU')
+        self.assertEqual(europe.name, 'Europa Name')
+
+        with await Context.abuild(europe) as context:
+            await context.adelete('de')
+
+        europe = await Continent.objects.translate('de').aget(code='EU')
+        self.assertEqual(europe.name, 'Europe')
+
+    def test_read_deferred_fields(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = list(
+            Continent.objects.only('code', 'name').order_by('code')
+        )
+        with self.assertNumQueries(1):
+            with Context(continents) as context:
+                context.read('de')
+
+        self.assertEqual(continents[0].name, 'Asien')
+        self.assertEqual(continents[1].name, 'Europa')
+        for continent in continents:
+            self.assertSetEqual(continent.get_deferred_fields(), {'denonym'})
+
+        with self.assertNumQueries(0):
+            context.reset()
+
+        self.assertEqual(continents[0].name, 'Asia')
+
+    def test_read_deferred_fields_loaded_later(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        europe = Continent.objects.only('code').get(code='EU')
+        with Context(europe) as context:
+            # loaded after the context is initialized
+            self.assertEqual(europe.name, 'Europe')
+            context.read('de')
+            self.assertEqual(europe.name, 'Europa')
+            context.reset()
+
+        self.assertEqual(europe.name, 'Europe')
+        self.assertSetEqual(europe.get_deferred_fields(), {'denonym'})
+
+    def test_switch_deferred_fields_loaded_later(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        europe = Continent.objects.only('code').get(code='EU')
+        with Context(europe) as context:
+            context.read_many(['de', 'tr'])
+            # loaded after the overlays are read
+            self.assertEqual(europe.name, 'Europe')
+            context.switch('tr')
+            self.assertEqual(europe.name, 'Avrupa')
+            context.switch('en')
+
+        self.assertEqual(europe.name, 'Europe')
+
+    def test_update_deferred_fields(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        europe = Continent.objects.only('code', 'name').get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+            europe.name = 'Europa Name'
+            context.update('de')
+
+        # the deferred fields are not loaded
+        self.assertSetEqual(europe.get_deferred_fields(), {'denonym'})
+        self.assertEqual(
+            Translation.objects.get(field='denonym', language='de').text,
+            'Europäisch'
+        )
+
+    def test_read_fields(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        europe = Continent.objects.prefetch_related('countries').get(code='EU')
+        germany = europe.countries.all()[0]
+        with Context(
+            europe, 'countries', fields=['name'], related_fields=['denonym']
+        ) as context:
+            context.read('de')
+
+        self.assertDictEqual(
+            europe._default_translatable_fields,
+            {'name': 'Europe'}
+        )
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(europe.denonym, 'European')
+        self.assertEqual(germany.name, 'Germany')
+        self.assertEqual(germany.denonym, 'Deutsche')
+
+        with Context(europe) as context:
+            context.read('de')
+            self.assertEqual(europe.denonym, 'Europäisch')
+            context.reset()
+
+        self.assertEqual(europe.name, 'Europe')
+        self.assertEqual(europe.denonym, 'European')
+
+    def test_switch_fields(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe, fields=['name']) as context:
+            context.read_many(['de'])
+            context.switch('de')
+
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(europe.denonym, 'European')
+
+        # the overlay lacks the other fields
+        with Context(europe) as context:
+            with self.assertNumQueries(1):
+                context.switch('de')
+
+        self.assertEqual(europe.denonym, 'Europäisch')
+
+    def test_read_many(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        europe = Continent.objects.prefetch_related('countries').get(code='EU')
+        germany = europe.countries.all()[0]
+        with Context(europe, 'countries') as context:
+            with self.assertNumQueries(1):
+                context.read_many(['de', 'tr', 'de'])
+
+        self.assertEqual(europe.name, 'Europe')
+        self.assertDictEqual(
+            europe._trans_overlay,
+            {
+                'de': {'name': 'Europa', 'denonym': 'Europäisch'},
+                'tr': {'name': 'Avrupa', 'denonym': 'Avrupalı'},
+            }
+        )
+        self.assertDictEqual(
+            germany._trans_overlay,
+            {
+                'de': {'name': 'Deutschland', 'denonym': 'Deutsche'},
+                'tr': {'name': 'Almanya', 'denonym': 'Almanca'},
+            }
+        )
+
+    def test_read_many_all_languages(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            with self.assertNumQueries(1):
+                context.read_many()
+
+        self.assertListEqual(
+            sorted(europe._trans_overlay),
+            ['de', 'en-gb', 'tr']
+        )
+        self.assertDictEqual(
+            europe._trans_overlay['en-gb'],
+            {'name': None, 'denonym': None}
+        )
+
+    def test_read_many_default_language(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            with self.assertNumQueries(0):
+                context.read_many(['en'])
+
+        self.assertFalse(hasattr(europe, '_trans_overlay'))
+
+    def test_switch(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name'],
+            langs=['de', 'tr']
+        )
+
+        europe = Continent.objects.prefetch_related('countries').get(code='EU')
+        germany = europe.countries.all()[0]
+        with Context(europe, 'countries') as context:
+            context.read_many(['de', 'tr'])
+            with self.assertNumQueries(0):
+                context.switch('de')
+                self.assertEqual(europe.name, 'Europa')
+                self.assertEqual(germany.name, 'Deutschland')
+                self.assertEqual(germany.denonym, 'German')
+
+                context.switch('tr')
+                self.assertEqual(europe.name, 'Avrupa')
+                self.assertEqual(europe.denonym, 'Avrupalı')
+                self.assertEqual(germany.name, 'Almanya')
+
+                context.switch('en')
+                self.assertEqual(europe.name, 'Europe')
+                self.assertEqual(germany.name, 'Germany')
+
+    def test_switch_reads_missing(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read_many(['de'])
+            with self.assertNumQueries(1):
+                context.switch('tr')
+            with self.assertNumQueries(0):
+                context.switch('tr')
+
+        self.assertEqual(europe.name, 'Avrupa')
+
+    def test_update_discards_overlays(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read_many(['de', 'tr'])
+            context.switch('de')
+            europe.name = 'Europa Name'
+            context.update('de')
+            context.switch('tr')
+            context.switch('de')
+
+        self.assertEqual(europe.name, 'Europa Name')
+        self.assertIn('tr', europe._trans_overlay)
+
     @override(language='de', deactivate=True)
     def test_reset_instance_level_0_relation_no_lang(self):
         create_samples(
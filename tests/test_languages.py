@@ -2,10 +2,11 @@ from django.test import TestCase, override_settings
 from django.utils.translation import override
 
 from translations.languages import _get_supported_language, \
+    _resolve_language, \
     _get_default_language, _get_active_language, \
     _get_all_languages, _get_all_choices, \
     _get_translation_languages, _get_translation_choices, \
-    _get_translate_language, _get_probe_language, \
+    _get_translate_language, _get_language_chain, _get_probe_language, \
     translate, probe
 
 
@@ -39,6 +40,29 @@ class GetsupportedLanguageTest(TestCase):
             '`xx` is not a supported language.'
         )
 
+    def test_variants(self):
+        self.assertEqual(_get_supported_language('EN-GB'), 'en-gb')
+        self.assertEqual(_get_supported_language('en_gb'), 'en-gb')
+        self.assertEqual(_get_supported_language('en_US'), 'en')
+        self.assertEqual(_get_supported_language('DE'), 'de')
+
+    def test_bounded(self):
+        _resolve_language.cache_clear()
+        for index in range(1000):
+            with self.assertRaises(ValueError):
+                _get_supported_language('x{}'.format(index))
+
+        self.assertEqual(_resolve_language.cache_info().currsize, 256)
+
+    def test_settings_changed(self):
+        self.assertEqual(_get_supported_language('en-gb'), 'en-gb')
+
+        with override_settings(LANGUAGES=(('en', 'English'),)):
+            self.assertEqual(_get_supported_language('en-gb'), 'en')
+            self.assertListEqual(_get_all_languages(), ['en'])
+
+        self.assertEqual(_get_supported_language('en-gb'), 'en-gb')
+
 
 class GetDefaultLanguageTest(TestCase):
     """Tests for `_get_default_language`."""
@@ -300,6 +324,77 @@ class GetTranslateLanguageTest(TestCase):
         )
 
 
+class GetLanguageChainTest(TestCase):
+    """Tests for `_get_language_chain`."""
+
+    def test_unaccented(self):
+        self.assertListEqual(
+            _get_language_chain('de'),
+            ['de']
+        )
+
+    def test_accented_default_code(self):
+        self.assertListEqual(
+            _get_language_chain('en-gb'),
+            ['en-gb']
+        )
+
+    @override_settings(LANGUAGE_CODE='de')
+    def test_accented(self):
+        self.assertListEqual(
+            _get_language_chain('en-gb'),
+            ['en-gb']
+        )
+
+    @override_settings(LANGUAGE_CODE='de', TRANSLATIONS_FALLBACKS=True)
+    def test_accented_region(self):
+        self.assertListEqual(
+            _get_language_chain('en-gb'),
+            ['en-gb', 'en']
+        )
+
+    @override_settings(TRANSLATIONS_FALLBACKS=True)
+    def test_unaccented_region(self):
+        self.assertListEqual(
+            _get_language_chain('de'),
+            ['de']
+        )
+
+    @override_settings(TRANSLATIONS_FALLBACKS={'tr': ['de', 'en', 'tr']})
+    def test_custom(self):
+        self.assertListEqual(
+            _get_language_chain('tr'),
+            ['tr', 'de']
+        )
+
+    @override_settings(
+        LANGUAGE_CODE='de',
+        TRANSLATIONS_FALLBACKS={'tr': ['de']}
+    )
+    def test_custom_other(self):
+        self.assertListEqual(
+            _get_language_chain('en-gb'),
+            ['en-gb']
+        )
+
+    @override_settings(LANGUAGE_CODE='de', TRANSLATIONS_FALLBACKS=False)
+    def test_disabled(self):
+        self.assertListEqual(
+            _get_language_chain('en-gb'),
+            ['en-gb']
+        )
+
+    @override_settings(TRANSLATIONS_FALLBACKS={'tr': ['xx']})
+    def test_invalid(self):
+        with self.assertRaises(ValueError) as error:
+            _get_language_chain('tr')
+
+        self.assertEqual(
+            error.exception.args[0],
+            '`xx` is not a supported language.'
+        )
+
+
 class GetProbeLanguageTest(TestCase):
     """Tests for `_get_probe_language`."""
 
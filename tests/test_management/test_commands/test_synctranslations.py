@@ -3,6 +3,7 @@ from contextlib import ContextDecorator
 from unittest.mock import patch
 
 from django.test import TransactionTestCase
+from django.test.utils import isolate_apps
 from django.core.management import call_command
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.auth.models import User
@@ -303,6 +304,36 @@ class CommandTest(TransactionTestCase):
             ]
         )
 
+    @isolate_apps('sample')
+    def test_get_obsolete_translations_proxy_content_type(self):
+        class ProxyCity(City):
+            class Meta:
+                proxy = True
+
+            class TranslatableMeta:
+                fields = ['name']
+
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+            city_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        content_type = ContentType.objects.get_for_model(
+            ProxyCity, for_concrete_model=False
+        )
+        command = Command()
+        # the isolated model is not in the registry of the content types
+        with patch.object(content_type, 'model_class', return_value=ProxyCity):
+            obsolete_translations = command.get_obsolete_translations(
+                [content_type]
+            )
+
+        # the translations belong to the content type of the concrete model
+        self.assertFalse(obsolete_translations.exists())
+
     @override_tmeta(Continent, fields=['name'])
     @override_tmeta(Country, fields=['name'])
     @override_tmeta(City, fields=['name'])
@@ -1018,6 +1049,26 @@ class CommandTest(TransactionTestCase):
             ) + '\n'
         )
 
+    def test_log_obsolete_translations_cached_content_types(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        stdout = StringIO()
+        command = Command(stdout=stdout)
+        obsolete_translations = command.get_obsolete_translations(
+            ContentType.objects.get_for_models(Continent, Country).values()
+        )
+        command.verbosity = 1
+
+        # only the translations are fetched
+        with self.assertNumQueries(1):
+            command.log_obsolete_translations(obsolete_translations)
+
     @patch('builtins.input', new=lambda *args: 'yes')
     def test_ask_yes_no_input_yes(self):
         command = Command()
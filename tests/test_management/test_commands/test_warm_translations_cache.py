@@ -0,0 +1,37 @@
+from io import StringIO
+
+from django.test import TestCase
+from django.core.management import call_command
+from django.contrib.contenttypes.models import ContentType
+
+from translations.utils import _get_content_type_id, _clear_content_type_ids
+
+from sample.models import Continent, Timezone
+
+
+class WarmTranslationsCacheTest(TestCase):
+    """Tests for `warm_translations_cache`."""
+
+    def setUp(self):
+        _clear_content_type_ids()
+        ContentType.objects.clear_cache()
+
+    def test_warm(self):
+        stdout = StringIO()
+        with self.assertNumQueries(1):
+            call_command('warm_translations_cache', stdout=stdout)
+
+        self.assertEqual(
+            stdout.getvalue(),
+            'Warmed the content types of 4 translatable model(s).\n'
+        )
+
+        with self.assertNumQueries(0):
+            _get_content_type_id(Continent)
+            _get_content_type_id(Timezone)
+
+    def test_warm_quiet(self):
+        stdout = StringIO()
+        call_command('warm_translations_cache', verbosity=0, stdout=stdout)
+
+        self.assertEqual(stdout.getvalue(), '')
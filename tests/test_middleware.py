@@ -0,0 +1,215 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+
+from django.test import TestCase, RequestFactory, override_settings
+from django.http import HttpResponse
+from django.db.models.signals import post_save
+
+from translations.models import Translation
+from translations.context import Context
+from translations.cache import _request_translations
+from translations.utils import _warm_content_type_ids
+from translations.middleware import TranslationCacheMiddleware
+
+from sample.models import Continent
+from sample.utils import create_samples
+
+
+class TranslationCacheMiddlewareTest(TestCase):
+    """Tests for `TranslationCacheMiddleware`."""
+
+    def get_response(self, view):
+        middleware = TranslationCacheMiddleware(view)
+        return middleware(RequestFactory().get('/'))
+
+    def test_read(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        def view(request):
+            europe = Continent.objects.get(code='EU')
+            with Context(europe) as context:
+                with self.assertNumQueries(1):
+                    context.read('de')
+
+            continents = list(Continent.objects.order_by('code'))
+            # only asia is missing
+            with Context(continents) as context:
+                with self.assertNumQueries(1):
+                    context.read('de')
+
+            with self.assertNumQueries(0):
+                with Context(continents) as context:
+                    context.read('de')
+
+            self.assertEqual(continents[0].name, 'Asien')
+            self.assertEqual(continents[1].name, 'Europa')
+            return HttpResponse()
+
+        self.get_response(view)
+
+    def test_update(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        def view(request):
+            europe = Continent.objects.get(code='EU')
+            with Context(europe) as context:
+                context.read('de')
+                europe.name = 'Europa Name'
+                context.update('de')
+
+            europe = Continent.objects.get(code='EU')
+            with Context(europe) as context:
+                context.read('de')
+
+            self.assertEqual(europe.name, 'Europa Name')
+            return HttpResponse()
+
+        self.get_response(view)
+
+    @override_settings(
+        TRANSLATIONS_CACHE=None,
+        MIDDLEWARE=['translations.middleware.TranslationCacheMiddleware'],
+    )
+    def test_translation_save(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        def view(request):
+            europe = Continent.objects.get(code='EU')
+            with Context(europe) as context:
+                context.read('de')
+
+            translation = Translation.objects.get(
+                field='name', language='de'
+            )
+            translation.text = 'Europa Name'
+            translation.save()
+
+            europe = Continent.objects.get(code='EU')
+            with Context(europe) as context:
+                context.read('de')
+
+            self.assertEqual(europe.name, 'Europa Name')
+            return HttpResponse()
+
+        self.get_response(view)
+
+    def test_translations_update(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        def view(request):
+            europe = Continent.objects.get(code='EU')
+            with Context(europe) as context:
+                context.read('de')
+
+            Translation.objects.filter(field='name', language='de').update(
+                text='Europa Name'
+            )
+
+            europe = Continent.objects.get(code='EU')
+            with Context(europe) as context:
+                context.read('de')
+
+            self.assertEqual(europe.name, 'Europa Name')
+            return HttpResponse()
+
+        self.get_response(view)
+
+    def test_receivers(self):
+        with self.settings(TRANSLATIONS_CACHE=None, MIDDLEWARE=[]):
+            self.assertFalse(post_save.has_listeners(Translation))
+
+            with self.settings(MIDDLEWARE=[
+                'translations.middleware.TranslationCacheMiddleware',
+            ]):
+                self.assertTrue(post_save.has_listeners(Translation))
+
+            self.assertFalse(post_save.has_listeners(Translation))
+
+    def test_capabilities(self):
+        self.assertTrue(TranslationCacheMiddleware.sync_capable)
+        self.assertTrue(TranslationCacheMiddleware.async_capable)
+
+    def test_sync(self):
+        def view(request):
+            return HttpResponse()
+
+        self.assertFalse(
+            asyncio.iscoroutinefunction(TranslationCacheMiddleware(view))
+        )
+
+    async def test_async(self):
+        await sync_to_async(_warm_content_type_ids)()
+        await sync_to_async(create_samples)(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        async def view(request):
+            europe = await Continent.objects.aget(code='EU')
+            with Context(europe) as context:
+                await context.aread('de')
+            self.assertIn(
+                (europe._get_content_type_id(), 'EU', 'de'),
+                _request_translations.get(),
+            )
+            self.assertEqual(europe.name, 'Europa')
+            return HttpResponse()
+
+        middleware = TranslationCacheMiddleware(view)
+
+        self.assertTrue(asyncio.iscoroutinefunction(middleware))
+        await middleware(RequestFactory().get('/'))
+        self.assertIsNone(_request_translations.get())
+
+    def test_discarded(self):
+        def view(request):
+            self.assertDictEqual(_request_translations.get(), {})
+            return HttpResponse()
+
+        self.get_response(view)
+
+        self.assertIsNone(_request_translations.get())
+
+    def test_discarded_error(self):
+        def view(request):
+            raise ValueError
+
+        with self.assertRaises(ValueError):
+            self.get_response(view)
+
+        self.assertIsNone(_request_translations.get())
+
+    def test_not_shared(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        def view(request):
+            europe = Continent.objects.get(code='EU')
+            with Context(europe) as context:
+                with self.assertNumQueries(1):
+                    context.read('de')
+            return HttpResponse()
+
+        self.get_response(view)
+        self.get_response(view)
@@ -1,8 +1,11 @@
 from django.test import TestCase
+from django.test.utils import isolate_apps
 from django.contrib.contenttypes.models import ContentType
-from django.db import connection, utils
+from django.core import serializers
+from django.db import connection, utils, models
 
-from translations.models import Translation
+from translations.models import Translation, Translatable
+from translations.utils import _clear_content_type_ids
 
 from sample.models import Timezone, Continent, City
 from sample.utils import create_samples
@@ -160,6 +163,187 @@ class TranslationTest(TestCase):
             'Europe: Europa'
         )
 
+    def test_object_id_int_integer_pk(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+        )
+        cologne = City.objects.get(name='Cologne')
+        city_ct = ContentType.objects.get_for_model(City)
+        translation = Translation.objects.create(
+            content_type=city_ct,
+            object_id=cologne.pk,
+            field='name',
+            language='de',
+            text='Köln'
+        )
+
+        self.assertEqual(translation.object_id_int, cologne.pk)
+
+    def test_object_id_int_char_pk(self):
+        europe = Continent.objects.create(name='Europe', code='EU')
+        continent_ct = ContentType.objects.get_for_model(Continent)
+        translation = Translation.objects.create(
+            content_type=continent_ct,
+            object_id=europe.pk,
+            field='name',
+            language='de',
+            text='Europa'
+        )
+
+        self.assertIsNone(translation.object_id_int)
+
+    def test_object_id_int_bulk_create(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+        )
+        cologne = City.objects.get(name='Cologne')
+        city_ct = ContentType.objects.get_for_model(City)
+        Translation.objects.bulk_create([
+            Translation(
+                content_type=city_ct,
+                object_id=cologne.pk,
+                field='name',
+                language='de',
+                text='Köln'
+            ),
+        ])
+
+        self.assertEqual(
+            Translation.objects.get().object_id_int,
+            cologne.pk
+        )
+        self.assertEqual(
+            City.objects.probe('de').get(name='Köln').pk,
+            cologne.pk
+        )
+        self.assertEqual(
+            City.objects.translate('de', strategy='sql').get().name,
+            'Köln'
+        )
+
+    def test_object_id_int_bulk_update(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne', 'munich'],
+            city_fields=['name'],
+            langs=['de'],
+        )
+        cologne = City.objects.get(name='Cologne')
+        munich = City.objects.get(name='Munich')
+        translation = Translation.objects.get(object_id=cologne.pk)
+        translation.object_id = munich.pk
+        Translation.objects.filter(object_id=munich.pk).delete()
+        Translation.objects.bulk_update([translation], ['object_id'])
+
+        self.assertEqual(
+            Translation.objects.get().object_id_int,
+            munich.pk
+        )
+
+    def test_object_id_int_update(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne', 'munich'],
+            city_fields=['name'],
+            langs=['de'],
+        )
+        cologne = City.objects.get(name='Cologne')
+        munich = City.objects.get(name='Munich')
+        Translation.objects.filter(object_id=munich.pk).delete()
+        Translation.objects.filter(object_id=cologne.pk).update(
+            object_id=munich.pk
+        )
+
+        self.assertEqual(
+            Translation.objects.get().object_id_int,
+            munich.pk
+        )
+
+    def test_object_id_int_update_expression(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+            city_fields=['name'],
+            langs=['de'],
+        )
+        cologne = City.objects.get(name='Cologne')
+        Translation.objects.update(object_id_int=None)
+        Translation.objects.update(object_id=models.F('object_id'))
+
+        self.assertEqual(
+            Translation.objects.get().object_id_int,
+            cologne.pk
+        )
+
+    def test_object_id_int_update_fields(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne', 'munich'],
+            city_fields=['name'],
+            langs=['de'],
+        )
+        cologne = City.objects.get(name='Cologne')
+        munich = City.objects.get(name='Munich')
+        translation = Translation.objects.get(object_id=cologne.pk)
+        Translation.objects.filter(object_id=munich.pk).delete()
+        translation.object_id = munich.pk
+        translation.save(update_fields=['object_id'])
+
+        self.assertEqual(
+            Translation.objects.get().object_id_int,
+            munich.pk
+        )
+
+    def test_object_id_int_generic_relation_add(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne', 'munich'],
+            city_fields=['name'],
+            langs=['de'],
+        )
+        cologne = City.objects.get(name='Cologne')
+        munich = City.objects.get(name='Munich')
+        translation = Translation.objects.get(object_id=cologne.pk)
+        Translation.objects.filter(object_id=munich.pk).delete()
+        munich.translations.add(translation, bulk=True)
+
+        self.assertEqual(
+            Translation.objects.get().object_id_int,
+            munich.pk
+        )
+
+    def test_object_id_int_raw_save(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+            city_fields=['name'],
+            langs=['de'],
+        )
+        data = serializers.serialize('json', Translation.objects.all())
+        Translation.objects.all().delete()
+        for obj in serializers.deserialize('json', data):
+            obj.object.object_id_int = None
+            obj.save()
+
+        self.assertEqual(
+            Translation.objects.get().object_id_int,
+            City.objects.get().pk
+        )
+        self.assertEqual(
+            City.objects.probe('de').filter(name='Köln').count(),
+            1
+        )
+
     def test_uniqueness(self):
         europe = Continent.objects.create(name='Europe', code='EU')
         continent_ct = ContentType.objects.get_for_model(Continent)
@@ -233,6 +417,43 @@ class TranslatableTest(TestCase):
             ]
         )
 
+    def test_translations_rel_integer_pk_join(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne', 'munich'],
+            city_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        cities = City.objects.filter(translations__text='Köln')
+
+        self.assertNotIn('CAST', str(cities.query).upper())
+        self.assertIn('object_id_int', str(cities.query))
+        self.assertQuerysetEqual(
+            cities,
+            [
+                '<City: Cologne>',
+            ]
+        )
+
+    def test_translations_rel_char_pk_join(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.filter(translations__text='Europa')
+
+        self.assertNotIn('object_id_int', str(continents.query))
+        self.assertQuerysetEqual(
+            continents,
+            [
+                '<Continent: Europe>',
+            ]
+        )
+
     def test_get_translatable_fields_automatic(self):
         self.assertListEqual(
             City.get_translatable_fields(),
@@ -275,6 +496,57 @@ class TranslatableTest(TestCase):
             ['name', 'denonym']
         )
 
+    def test_get_translatable_fields_set(self):
+        self.assertEqual(
+            Continent._get_translatable_fields_set(),
+            frozenset(['name', 'denonym'])
+        )
+
+    def test_translatable_fields_prepared(self):
+        self.assertIn('_cached_translatable_fields', Continent.__dict__)
+        self.assertIn('_cached_translatable_fields_names', Continent.__dict__)
+        self.assertIn('_cached_translatable_fields_set', Continent.__dict__)
+
+    @isolate_apps('sample')
+    def test_translatable_fields_not_inherited(self):
+        class Place(Translatable):
+            name = models.CharField(max_length=64)
+
+        class Park(Place):
+            area = models.CharField(max_length=64)
+
+        self.assertListEqual(Place._get_translatable_fields_names(), ['name'])
+        self.assertListEqual(
+            Park._get_translatable_fields_names(),
+            ['name', 'area']
+        )
+        self.assertEqual(
+            Park._get_translatable_fields_set(),
+            frozenset(['name', 'area'])
+        )
+
+    def test_get_content_type_id(self):
+        _clear_content_type_ids()
+        self.assertNotIn('_cached_content_type_id', City.__dict__)
+
+        self.assertEqual(
+            City._get_content_type_id(),
+            ContentType.objects.get_for_model(City).id
+        )
+        self.assertIn('_cached_content_type_id', City.__dict__)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                Continent._get_content_type_id(),
+                ContentType.objects.get_for_model(Continent).id
+            )
+
+    def test_get_content_type_id_cleared(self):
+        City._get_content_type_id()
+        _clear_content_type_ids()
+
+        self.assertNotIn('_cached_content_type_id', City.__dict__)
+
     def test_get_translatable_fields_choices_automatic(self):
         self.assertListEqual(
             City._get_translatable_fields_choices(),
@@ -287,6 +559,25 @@ class TranslatableTest(TestCase):
             [(None, '---------')]
         )
 
+    def test_translated(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        europe = Continent.objects.get(code='EU')
+
+        with self.assertNumQueries(1):
+            self.assertIs(europe.translated('de'), europe)
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(europe.denonym, 'Europäisch')
+
+        with self.assertNumQueries(0):
+            europe.translated('de')
+            europe.translated('en')
+        self.assertEqual(europe.name, 'Europe')
+
     def test_get_translatable_fields_choices_explicit(self):
         self.assertListEqual(
             Continent._get_translatable_fields_choices(),
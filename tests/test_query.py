@@ -1,17 +1,36 @@
 import copy
 
 from django.test import TestCase
-from django.db.models import Q
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db.models import Q, F, Value, Exists, OuterRef
+from django.db.models.functions import Concat
+from django.contrib.contenttypes.models import ContentType
 from django.utils.translation import override
 
+from translations.models import Translation
 from translations.query import _fetch_translations_query_getter, TQ
 
-from sample.models import Continent
+from sample.models import Continent, Country, City
+from sample.utils import create_samples
 
 
 class FetchTranslationsQueryGetterTest(TestCase):
     """Tests for `_fetch_translations_query_getter`."""
 
+    def assertQueryChildrenEqual(self, children, expected):
+        """Assert the children of a query, comparing subqueries by SQL."""
+        self.assertEqual(len(children), len(expected))
+        for child, expected_child in zip(children, expected):
+            if isinstance(expected_child, Exists):
+                self.assertIsInstance(child, Exists)
+                self.assertEqual(
+                    str(Continent.objects.filter(child).query),
+                    str(Continent.objects.filter(expected_child).query),
+                )
+            else:
+                self.assertEqual(child, expected_child)
+
     def test_lookup_nrel_yfield_ntrans_nsupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
@@ -27,14 +46,18 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_lookup_nrel_yfield_ytrans_nsupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 name='Europa'
             ).children[0].children,
             [
-                ('translations__field', 'name'),
-                ('translations__language', 'de'),
-                ('translations__text', 'Europa'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Continent),
+                    field='name',
+                    language='de',
+                    text='Europa',
+                    object_id=OuterRef('pk'),
+                )),
             ]
         )
 
@@ -53,14 +76,18 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_lookup_nrel_yfield_ytrans_ysupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 name__icontains='Europa'
             ).children[0].children,
             [
-                ('translations__field', 'name'),
-                ('translations__language', 'de'),
-                ('translations__text__icontains', 'Europa'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Continent),
+                    field='name',
+                    language='de',
+                    text__icontains='Europa',
+                    object_id=OuterRef('pk'),
+                )),
             ]
         )
 
@@ -103,14 +130,18 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_lookup_yrel_yfield_ytrans_nsupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 countries__name='Deutschland'
             ).children[0].children,
             [
-                ('countries__translations__field', 'name'),
-                ('countries__translations__language', 'de'),
-                ('countries__translations__text', 'Deutschland'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Country),
+                    field='name',
+                    language='de',
+                    text='Deutschland',
+                    object_id=OuterRef('countries__pk'),
+                )),
             ]
         )
 
@@ -129,14 +160,18 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_lookup_yrel_yfield_ytrans_ysupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 countries__name__icontains='Deutsch'
             ).children[0].children,
             [
-                ('countries__translations__field', 'name'),
-                ('countries__translations__language', 'de'),
-                ('countries__translations__text__icontains', 'Deutsch'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Country),
+                    field='name',
+                    language='de',
+                    text__icontains='Deutsch',
+                    object_id=OuterRef('countries__pk'),
+                )),
             ]
         )
 
@@ -155,14 +190,18 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_lookup_yrelnested_yfield_ytrans_nsupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 countries__cities__name='Köln'
             ).children[0].children,
             [
-                ('countries__cities__translations__field', 'name'),
-                ('countries__cities__translations__language', 'de'),
-                ('countries__cities__translations__text', 'Köln'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(City),
+                    field='name',
+                    language='de',
+                    text='Köln',
+                    object_id_int=OuterRef('countries__cities__pk'),
+                )),
             ]
         )
 
@@ -181,14 +220,18 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_lookup_yrelnested_yfield_ytrans_ysupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 countries__cities__name__icontains='Kö'
             ).children[0].children,
             [
-                ('countries__cities__translations__field', 'name'),
-                ('countries__cities__translations__language', 'de'),
-                ('countries__cities__translations__text__icontains', 'Kö'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(City),
+                    field='name',
+                    language='de',
+                    text__icontains='Kö',
+                    object_id_int=OuterRef('countries__cities__pk'),
+                )),
             ]
         )
 
@@ -375,14 +418,18 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_lookup_nrel_yfield_ytrans_nsupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 name='Europa'
             ).children[0].children,
             [
-                ('translations__field', 'name'),
-                ('translations__language__in', ['de', 'tr']),
-                ('translations__text', 'Europa'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Continent),
+                    field='name',
+                    language__in=['de', 'tr'],
+                    text='Europa',
+                    object_id=OuterRef('pk'),
+                )),
             ]
         )
 
@@ -401,14 +448,18 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_lookup_nrel_yfield_ytrans_ysupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 name__icontains='Europa'
             ).children[0].children,
             [
-                ('translations__field', 'name'),
-                ('translations__language__in', ['de', 'tr']),
-                ('translations__text__icontains', 'Europa'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Continent),
+                    field='name',
+                    language__in=['de', 'tr'],
+                    text__icontains='Europa',
+                    object_id=OuterRef('pk'),
+                )),
             ]
         )
 
@@ -451,14 +502,18 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_lookup_yrel_yfield_ytrans_nsupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 countries__name='Deutschland'
             ).children[0].children,
             [
-                ('countries__translations__field', 'name'),
-                ('countries__translations__language__in', ['de', 'tr']),
-                ('countries__translations__text', 'Deutschland'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Country),
+                    field='name',
+                    language__in=['de', 'tr'],
+                    text='Deutschland',
+                    object_id=OuterRef('countries__pk'),
+                )),
             ]
         )
 
@@ -477,14 +532,18 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_lookup_yrel_yfield_ytrans_ysupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 countries__name__icontains='Deutsch'
             ).children[0].children,
             [
-                ('countries__translations__field', 'name'),
-                ('countries__translations__language__in', ['de', 'tr']),
-                ('countries__translations__text__icontains', 'Deutsch'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Country),
+                    field='name',
+                    language__in=['de', 'tr'],
+                    text__icontains='Deutsch',
+                    object_id=OuterRef('countries__pk'),
+                )),
             ]
         )
 
@@ -503,17 +562,18 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_lookup_yrelnested_yfield_ytrans_nsupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 countries__cities__name='Köln'
             ).children[0].children,
             [
-                ('countries__cities__translations__field', 'name'),
-                (
-                    'countries__cities__translations__language__in',
-                    ['de', 'tr']
-                ),
-                ('countries__cities__translations__text', 'Köln'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(City),
+                    field='name',
+                    language__in=['de', 'tr'],
+                    text='Köln',
+                    object_id_int=OuterRef('countries__cities__pk'),
+                )),
             ]
         )
 
@@ -532,17 +592,18 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_lookup_yrelnested_yfield_ytrans_ysupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 countries__cities__name__icontains='Kö'
             ).children[0].children,
             [
-                ('countries__cities__translations__field', 'name'),
-                (
-                    'countries__cities__translations__language__in',
-                    ['de', 'tr']
-                ),
-                ('countries__cities__translations__text__icontains', 'Kö'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(City),
+                    field='name',
+                    language__in=['de', 'tr'],
+                    text__icontains='Kö',
+                    object_id_int=OuterRef('countries__cities__pk'),
+                )),
             ]
         )
 
@@ -561,17 +622,19 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_lookup_nrel_yfield_ytrans_nsupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 name='Europa'
             ).children[0].children,
             [
                 ('name', 'Europa'),
-                Q(
-                    ('translations__field', 'name'),
-                    ('translations__language__in', ['de']),
-                    ('translations__text', 'Europa'),
-                ),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Continent),
+                    field='name',
+                    language__in=['de'],
+                    text='Europa',
+                    object_id=OuterRef('pk'),
+                )),
             ]
         )
 
@@ -590,17 +653,19 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_lookup_nrel_yfield_ytrans_ysupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 name__icontains='Europa'
             ).children[0].children,
             [
                 ('name__icontains', 'Europa'),
-                Q(
-                    ('translations__field', 'name'),
-                    ('translations__language__in', ['de']),
-                    ('translations__text__icontains', 'Europa'),
-                ),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Continent),
+                    field='name',
+                    language__in=['de'],
+                    text__icontains='Europa',
+                    object_id=OuterRef('pk'),
+                )),
             ]
         )
 
@@ -643,17 +708,19 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_lookup_yrel_yfield_ytrans_nsupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 countries__name='Deutschland'
             ).children[0].children,
             [
                 ('countries__name', 'Deutschland'),
-                Q(
-                    ('countries__translations__field', 'name'),
-                    ('countries__translations__language__in', ['de']),
-                    ('countries__translations__text', 'Deutschland'),
-                ),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Country),
+                    field='name',
+                    language__in=['de'],
+                    text='Deutschland',
+                    object_id=OuterRef('countries__pk'),
+                )),
             ]
         )
 
@@ -672,17 +739,19 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_lookup_yrel_yfield_ytrans_ysupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 countries__name__icontains='Deutsch'
             ).children[0].children,
             [
                 ('countries__name__icontains', 'Deutsch'),
-                Q(
-                    ('countries__translations__field', 'name'),
-                    ('countries__translations__language__in', ['de']),
-                    ('countries__translations__text__icontains', 'Deutsch'),
-                ),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Country),
+                    field='name',
+                    language__in=['de'],
+                    text__icontains='Deutsch',
+                    object_id=OuterRef('countries__pk'),
+                )),
             ]
         )
 
@@ -701,17 +770,19 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_lookup_yrelnested_yfield_ytrans_nsupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 countries__cities__name='Köln'
             ).children[0].children,
             [
                 ('countries__cities__name', 'Köln'),
-                Q(
-                    ('countries__cities__translations__field', 'name'),
-                    ('countries__cities__translations__language__in', ['de']),
-                    ('countries__cities__translations__text', 'Köln'),
-                ),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(City),
+                    field='name',
+                    language__in=['de'],
+                    text='Köln',
+                    object_id_int=OuterRef('countries__cities__pk'),
+                )),
             ]
         )
 
@@ -730,17 +801,19 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_lookup_yrelnested_yfield_ytrans_ysupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 countries__cities__name__icontains='Kö'
             ).children[0].children,
             [
                 ('countries__cities__name__icontains', 'Kö'),
-                Q(
-                    ('countries__cities__translations__field', 'name'),
-                    ('countries__cities__translations__language__in', ['de']),
-                    ('countries__cities__translations__text__icontains', 'Kö'),
-                ),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(City),
+                    field='name',
+                    language__in=['de'],
+                    text__icontains='Kö',
+                    object_id_int=OuterRef('countries__cities__pk'),
+                )),
             ]
         )
 
@@ -761,16 +834,20 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_q_nrel_yfield_ytrans_nsupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 Q(
                     name='Europa'
                 )
             ).children[0].children[0].children,
             [
-                ('translations__field', 'name'),
-                ('translations__language', 'de'),
-                ('translations__text', 'Europa'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Continent),
+                    field='name',
+                    language='de',
+                    text='Europa',
+                    object_id=OuterRef('pk'),
+                )),
             ]
         )
 
@@ -791,16 +868,20 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_q_nrel_yfield_ytrans_ysupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 Q(
                     name__icontains='Europa'
                 )
             ).children[0].children[0].children,
             [
-                ('translations__field', 'name'),
-                ('translations__language', 'de'),
-                ('translations__text__icontains', 'Europa'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Continent),
+                    field='name',
+                    language='de',
+                    text__icontains='Europa',
+                    object_id=OuterRef('pk'),
+                )),
             ]
         )
 
@@ -849,16 +930,20 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_q_yrel_yfield_ytrans_nsupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 Q(
                     countries__name='Deutschland'
                 )
             ).children[0].children[0].children,
             [
-                ('countries__translations__field', 'name'),
-                ('countries__translations__language', 'de'),
-                ('countries__translations__text', 'Deutschland'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Country),
+                    field='name',
+                    language='de',
+                    text='Deutschland',
+                    object_id=OuterRef('countries__pk'),
+                )),
             ]
         )
 
@@ -879,16 +964,20 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_q_yrel_yfield_ytrans_ysupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 Q(
                     countries__name__icontains='Deutsch'
                 )
             ).children[0].children[0].children,
             [
-                ('countries__translations__field', 'name'),
-                ('countries__translations__language', 'de'),
-                ('countries__translations__text__icontains', 'Deutsch'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Country),
+                    field='name',
+                    language='de',
+                    text__icontains='Deutsch',
+                    object_id=OuterRef('countries__pk'),
+                )),
             ]
         )
 
@@ -909,16 +998,20 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_q_yrelnested_yfield_ytrans_nsupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 Q(
                     countries__cities__name='Köln'
                 )
             ).children[0].children[0].children,
             [
-                ('countries__cities__translations__field', 'name'),
-                ('countries__cities__translations__language', 'de'),
-                ('countries__cities__translations__text', 'Köln'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(City),
+                    field='name',
+                    language='de',
+                    text='Köln',
+                    object_id_int=OuterRef('countries__cities__pk'),
+                )),
             ]
         )
 
@@ -939,16 +1032,20 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_q_yrelnested_yfield_ytrans_ysupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 Q(
                     countries__cities__name__icontains='Kö'
                 )
             ).children[0].children[0].children,
             [
-                ('countries__cities__translations__field', 'name'),
-                ('countries__cities__translations__language', 'de'),
-                ('countries__cities__translations__text__icontains', 'Kö'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(City),
+                    field='name',
+                    language='de',
+                    text__icontains='Kö',
+                    object_id_int=OuterRef('countries__cities__pk'),
+                )),
             ]
         )
 
@@ -1165,16 +1262,20 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_q_nrel_yfield_ytrans_nsupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 Q(
                     name='Europa'
                 )
             ).children[0].children[0].children,
             [
-                ('translations__field', 'name'),
-                ('translations__language__in', ['de', 'tr']),
-                ('translations__text', 'Europa'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Continent),
+                    field='name',
+                    language__in=['de', 'tr'],
+                    text='Europa',
+                    object_id=OuterRef('pk'),
+                )),
             ]
         )
 
@@ -1195,16 +1296,20 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_q_nrel_yfield_ytrans_ysupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 Q(
                     name__icontains='Europa'
                 )
             ).children[0].children[0].children,
             [
-                ('translations__field', 'name'),
-                ('translations__language__in', ['de', 'tr']),
-                ('translations__text__icontains', 'Europa'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Continent),
+                    field='name',
+                    language__in=['de', 'tr'],
+                    text__icontains='Europa',
+                    object_id=OuterRef('pk'),
+                )),
             ]
         )
 
@@ -1253,16 +1358,20 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_q_yrel_yfield_ytrans_nsupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 Q(
                     countries__name='Deutschland'
                 )
             ).children[0].children[0].children,
             [
-                ('countries__translations__field', 'name'),
-                ('countries__translations__language__in', ['de', 'tr']),
-                ('countries__translations__text', 'Deutschland'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Country),
+                    field='name',
+                    language__in=['de', 'tr'],
+                    text='Deutschland',
+                    object_id=OuterRef('countries__pk'),
+                )),
             ]
         )
 
@@ -1283,16 +1392,20 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_q_yrel_yfield_ytrans_ysupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 Q(
                     countries__name__icontains='Deutsch'
                 )
             ).children[0].children[0].children,
             [
-                ('countries__translations__field', 'name'),
-                ('countries__translations__language__in', ['de', 'tr']),
-                ('countries__translations__text__icontains', 'Deutsch'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Country),
+                    field='name',
+                    language__in=['de', 'tr'],
+                    text__icontains='Deutsch',
+                    object_id=OuterRef('countries__pk'),
+                )),
             ]
         )
 
@@ -1313,19 +1426,20 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_q_yrelnested_yfield_ytrans_nsupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 Q(
                     countries__cities__name='Köln'
                 )
             ).children[0].children[0].children,
             [
-                ('countries__cities__translations__field', 'name'),
-                (
-                    'countries__cities__translations__language__in',
-                    ['de', 'tr']
-                ),
-                ('countries__cities__translations__text', 'Köln'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(City),
+                    field='name',
+                    language__in=['de', 'tr'],
+                    text='Köln',
+                    object_id_int=OuterRef('countries__cities__pk'),
+                )),
             ]
         )
 
@@ -1346,19 +1460,20 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_q_yrelnested_yfield_ytrans_ysupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 Q(
                     countries__cities__name__icontains='Kö'
                 )
             ).children[0].children[0].children,
             [
-                ('countries__cities__translations__field', 'name'),
-                (
-                    'countries__cities__translations__language__in',
-                    ['de', 'tr']
-                ),
-                ('countries__cities__translations__text__icontains', 'Kö'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(City),
+                    field='name',
+                    language__in=['de', 'tr'],
+                    text__icontains='Kö',
+                    object_id_int=OuterRef('countries__cities__pk'),
+                )),
             ]
         )
 
@@ -1379,7 +1494,7 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_q_nrel_yfield_ytrans_nsupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 Q(
                     name='Europa'
@@ -1387,11 +1502,13 @@ class FetchTranslationsQueryGetterTest(TestCase):
             ).children[0].children[0].children,
             [
                 ('name', 'Europa'),
-                Q(
-                    ('translations__field', 'name'),
-                    ('translations__language__in', ['de']),
-                    ('translations__text', 'Europa'),
-                ),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Continent),
+                    field='name',
+                    language__in=['de'],
+                    text='Europa',
+                    object_id=OuterRef('pk'),
+                )),
             ]
         )
 
@@ -1412,7 +1529,7 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_q_nrel_yfield_ytrans_ysupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 Q(
                     name__icontains='Europa'
@@ -1420,11 +1537,13 @@ class FetchTranslationsQueryGetterTest(TestCase):
             ).children[0].children[0].children,
             [
                 ('name__icontains', 'Europa'),
-                Q(
-                    ('translations__field', 'name'),
-                    ('translations__language__in', ['de']),
-                    ('translations__text__icontains', 'Europa'),
-                ),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Continent),
+                    field='name',
+                    language__in=['de'],
+                    text__icontains='Europa',
+                    object_id=OuterRef('pk'),
+                )),
             ]
         )
 
@@ -1473,7 +1592,7 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_q_yrel_yfield_ytrans_nsupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 Q(
                     countries__name='Deutschland'
@@ -1481,11 +1600,13 @@ class FetchTranslationsQueryGetterTest(TestCase):
             ).children[0].children[0].children,
             [
                 ('countries__name', 'Deutschland'),
-                Q(
-                    ('countries__translations__field', 'name'),
-                    ('countries__translations__language__in', ['de']),
-                    ('countries__translations__text', 'Deutschland'),
-                ),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Country),
+                    field='name',
+                    language__in=['de'],
+                    text='Deutschland',
+                    object_id=OuterRef('countries__pk'),
+                )),
             ]
         )
 
@@ -1506,7 +1627,7 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_q_yrel_yfield_ytrans_ysupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 Q(
                     countries__name__icontains='Deutsch'
@@ -1514,11 +1635,13 @@ class FetchTranslationsQueryGetterTest(TestCase):
             ).children[0].children[0].children,
             [
                 ('countries__name__icontains', 'Deutsch'),
-                Q(
-                    ('countries__translations__field', 'name'),
-                    ('countries__translations__language__in', ['de']),
-                    ('countries__translations__text__icontains', 'Deutsch'),
-                )
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Country),
+                    field='name',
+                    language__in=['de'],
+                    text__icontains='Deutsch',
+                    object_id=OuterRef('countries__pk'),
+                ))
             ]
         )
 
@@ -1539,7 +1662,7 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_q_yrelnested_yfield_ytrans_nsupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 Q(
                     countries__cities__name='Köln'
@@ -1547,11 +1670,13 @@ class FetchTranslationsQueryGetterTest(TestCase):
             ).children[0].children[0].children,
             [
                 ('countries__cities__name', 'Köln'),
-                Q(
-                    ('countries__cities__translations__field', 'name'),
-                    ('countries__cities__translations__language__in', ['de']),
-                    ('countries__cities__translations__text', 'Köln'),
-                )
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(City),
+                    field='name',
+                    language__in=['de'],
+                    text='Köln',
+                    object_id_int=OuterRef('countries__cities__pk'),
+                ))
             ]
         )
 
@@ -1572,7 +1697,7 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_q_yrelnested_yfield_ytrans_ysupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 Q(
                     countries__cities__name__icontains='Kö'
@@ -1580,11 +1705,13 @@ class FetchTranslationsQueryGetterTest(TestCase):
             ).children[0].children[0].children,
             [
                 ('countries__cities__name__icontains', 'Kö'),
-                Q(
-                    ('countries__cities__translations__field', 'name'),
-                    ('countries__cities__translations__language__in', ['de']),
-                    ('countries__cities__translations__text__icontains', 'Kö'),
-                )
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(City),
+                    field='name',
+                    language__in=['de'],
+                    text__icontains='Kö',
+                    object_id_int=OuterRef('countries__cities__pk'),
+                ))
             ]
         )
 
@@ -1607,7 +1734,7 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_tq_nrel_yfield_ytrans_nsupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 TQ(
                     name='Europa',
@@ -1616,9 +1743,13 @@ class FetchTranslationsQueryGetterTest(TestCase):
                 )
             ).children[0].children[0].children,
             [
-                ('translations__field', 'name'),
-                ('translations__language', 'de'),
-                ('translations__text', 'Europa'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Continent),
+                    field='name',
+                    language='de',
+                    text='Europa',
+                    object_id=OuterRef('pk'),
+                )),
             ]
         )
 
@@ -1641,7 +1772,7 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_tq_nrel_yfield_ytrans_ysupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 TQ(
                     name__icontains='Europa',
@@ -1650,9 +1781,13 @@ class FetchTranslationsQueryGetterTest(TestCase):
                 )
             ).children[0].children[0].children,
             [
-                ('translations__field', 'name'),
-                ('translations__language', 'de'),
-                ('translations__text__icontains', 'Europa'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Continent),
+                    field='name',
+                    language='de',
+                    text__icontains='Europa',
+                    object_id=OuterRef('pk'),
+                )),
             ]
         )
 
@@ -1707,7 +1842,7 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_tq_yrel_yfield_ytrans_nsupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 TQ(
                     countries__name='Deutschland',
@@ -1716,9 +1851,13 @@ class FetchTranslationsQueryGetterTest(TestCase):
                 )
             ).children[0].children[0].children,
             [
-                ('countries__translations__field', 'name'),
-                ('countries__translations__language', 'de'),
-                ('countries__translations__text', 'Deutschland'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Country),
+                    field='name',
+                    language='de',
+                    text='Deutschland',
+                    object_id=OuterRef('countries__pk'),
+                )),
             ]
         )
 
@@ -1741,7 +1880,7 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_tq_yrel_yfield_ytrans_ysupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 TQ(
                     countries__name__icontains='Deutsch',
@@ -1750,9 +1889,13 @@ class FetchTranslationsQueryGetterTest(TestCase):
                 )
             ).children[0].children[0].children,
             [
-                ('countries__translations__field', 'name'),
-                ('countries__translations__language', 'de'),
-                ('countries__translations__text__icontains', 'Deutsch'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Country),
+                    field='name',
+                    language='de',
+                    text__icontains='Deutsch',
+                    object_id=OuterRef('countries__pk'),
+                )),
             ]
         )
 
@@ -1775,7 +1918,7 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_tq_yrelnested_yfield_ytrans_nsupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 TQ(
                     countries__cities__name='Köln',
@@ -1784,9 +1927,13 @@ class FetchTranslationsQueryGetterTest(TestCase):
                 )
             ).children[0].children[0].children,
             [
-                ('countries__cities__translations__field', 'name'),
-                ('countries__cities__translations__language', 'de'),
-                ('countries__cities__translations__text', 'Köln'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(City),
+                    field='name',
+                    language='de',
+                    text='Köln',
+                    object_id_int=OuterRef('countries__cities__pk'),
+                )),
             ]
         )
 
@@ -1809,7 +1956,7 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_tq_yrelnested_yfield_ytrans_ysupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 TQ(
                     countries__cities__name__icontains='Kö',
@@ -1818,9 +1965,13 @@ class FetchTranslationsQueryGetterTest(TestCase):
                 )
             ).children[0].children[0].children,
             [
-                ('countries__cities__translations__field', 'name'),
-                ('countries__cities__translations__language', 'de'),
-                ('countries__cities__translations__text__icontains', 'Kö'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(City),
+                    field='name',
+                    language='de',
+                    text__icontains='Kö',
+                    object_id_int=OuterRef('countries__cities__pk'),
+                )),
             ]
         )
 
@@ -2067,7 +2218,7 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_tq_nrel_yfield_ytrans_nsupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 TQ(
                     name='Europa',
@@ -2076,9 +2227,13 @@ class FetchTranslationsQueryGetterTest(TestCase):
                 )
             ).children[0].children[0].children,
             [
-                ('translations__field', 'name'),
-                ('translations__language__in', ['de', 'tr']),
-                ('translations__text', 'Europa'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Continent),
+                    field='name',
+                    language__in=['de', 'tr'],
+                    text='Europa',
+                    object_id=OuterRef('pk'),
+                )),
             ]
         )
 
@@ -2101,7 +2256,7 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_tq_nrel_yfield_ytrans_ysupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 TQ(
                     name__icontains='Europa',
@@ -2110,9 +2265,13 @@ class FetchTranslationsQueryGetterTest(TestCase):
                 )
             ).children[0].children[0].children,
             [
-                ('translations__field', 'name'),
-                ('translations__language__in', ['de', 'tr']),
-                ('translations__text__icontains', 'Europa'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Continent),
+                    field='name',
+                    language__in=['de', 'tr'],
+                    text__icontains='Europa',
+                    object_id=OuterRef('pk'),
+                )),
             ]
         )
 
@@ -2167,7 +2326,7 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_tq_yrel_yfield_ytrans_nsupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 TQ(
                     countries__name='Deutschland',
@@ -2176,9 +2335,13 @@ class FetchTranslationsQueryGetterTest(TestCase):
                 )
             ).children[0].children[0].children,
             [
-                ('countries__translations__field', 'name'),
-                ('countries__translations__language__in', ['de', 'tr']),
-                ('countries__translations__text', 'Deutschland'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Country),
+                    field='name',
+                    language__in=['de', 'tr'],
+                    text='Deutschland',
+                    object_id=OuterRef('countries__pk'),
+                )),
             ]
         )
 
@@ -2201,7 +2364,7 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_tq_yrel_yfield_ytrans_ysupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 TQ(
                     countries__name__icontains='Deutsch',
@@ -2210,9 +2373,13 @@ class FetchTranslationsQueryGetterTest(TestCase):
                 )
             ).children[0].children[0].children,
             [
-                ('countries__translations__field', 'name'),
-                ('countries__translations__language__in', ['de', 'tr']),
-                ('countries__translations__text__icontains', 'Deutsch'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Country),
+                    field='name',
+                    language__in=['de', 'tr'],
+                    text__icontains='Deutsch',
+                    object_id=OuterRef('countries__pk'),
+                )),
             ]
         )
 
@@ -2235,7 +2402,7 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_tq_yrelnested_yfield_ytrans_nsupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 TQ(
                     countries__cities__name='Köln',
@@ -2244,12 +2411,13 @@ class FetchTranslationsQueryGetterTest(TestCase):
                 )
             ).children[0].children[0].children,
             [
-                ('countries__cities__translations__field', 'name'),
-                (
-                    'countries__cities__translations__language__in',
-                    ['de', 'tr']
-                ),
-                ('countries__cities__translations__text', 'Köln'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(City),
+                    field='name',
+                    language__in=['de', 'tr'],
+                    text='Köln',
+                    object_id_int=OuterRef('countries__cities__pk'),
+                )),
             ]
         )
 
@@ -2272,7 +2440,7 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_tq_yrelnested_yfield_ytrans_ysupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 TQ(
                     countries__cities__name__icontains='Kö',
@@ -2281,12 +2449,13 @@ class FetchTranslationsQueryGetterTest(TestCase):
                 )
             ).children[0].children[0].children,
             [
-                ('countries__cities__translations__field', 'name'),
-                (
-                    'countries__cities__translations__language__in',
-                    ['de', 'tr']
-                ),
-                ('countries__cities__translations__text__icontains', 'Kö'),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(City),
+                    field='name',
+                    language__in=['de', 'tr'],
+                    text__icontains='Kö',
+                    object_id_int=OuterRef('countries__cities__pk'),
+                )),
             ]
         )
 
@@ -2309,7 +2478,7 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_tq_nrel_yfield_ytrans_nsupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 TQ(
                     name='Europa',
@@ -2319,11 +2488,13 @@ class FetchTranslationsQueryGetterTest(TestCase):
             ).children[0].children[0].children,
             [
                 ('name', 'Europa'),
-                Q(
-                    ('translations__field', 'name'),
-                    ('translations__language__in', ['de']),
-                    ('translations__text', 'Europa'),
-                ),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Continent),
+                    field='name',
+                    language__in=['de'],
+                    text='Europa',
+                    object_id=OuterRef('pk'),
+                )),
             ]
         )
 
@@ -2346,7 +2517,7 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_tq_nrel_yfield_ytrans_ysupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 TQ(
                     name__icontains='Europa',
@@ -2356,11 +2527,13 @@ class FetchTranslationsQueryGetterTest(TestCase):
             ).children[0].children[0].children,
             [
                 ('name__icontains', 'Europa'),
-                Q(
-                    ('translations__field', 'name'),
-                    ('translations__language__in', ['de']),
-                    ('translations__text__icontains', 'Europa'),
-                ),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Continent),
+                    field='name',
+                    language__in=['de'],
+                    text__icontains='Europa',
+                    object_id=OuterRef('pk'),
+                )),
             ]
         )
 
@@ -2415,7 +2588,7 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_tq_yrel_yfield_ytrans_nsupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 TQ(
                     countries__name='Deutschland',
@@ -2425,11 +2598,13 @@ class FetchTranslationsQueryGetterTest(TestCase):
             ).children[0].children[0].children,
             [
                 ('countries__name', 'Deutschland'),
-                Q(
-                    ('countries__translations__field', 'name'),
-                    ('countries__translations__language__in', ['de']),
-                    ('countries__translations__text', 'Deutschland'),
-                ),
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Country),
+                    field='name',
+                    language__in=['de'],
+                    text='Deutschland',
+                    object_id=OuterRef('countries__pk'),
+                )),
             ]
         )
 
@@ -2452,7 +2627,7 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_tq_yrel_yfield_ytrans_ysupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 TQ(
                     countries__name__icontains='Deutsch',
@@ -2462,11 +2637,13 @@ class FetchTranslationsQueryGetterTest(TestCase):
             ).children[0].children[0].children,
             [
                 ('countries__name__icontains', 'Deutsch'),
-                Q(
-                    ('countries__translations__field', 'name'),
-                    ('countries__translations__language__in', ['de']),
-                    ('countries__translations__text__icontains', 'Deutsch'),
-                )
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Country),
+                    field='name',
+                    language__in=['de'],
+                    text__icontains='Deutsch',
+                    object_id=OuterRef('countries__pk'),
+                ))
             ]
         )
 
@@ -2489,7 +2666,7 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_tq_yrelnested_yfield_ytrans_nsupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 TQ(
                     countries__cities__name='Köln',
@@ -2499,11 +2676,13 @@ class FetchTranslationsQueryGetterTest(TestCase):
             ).children[0].children[0].children,
             [
                 ('countries__cities__name', 'Köln'),
-                Q(
-                    ('countries__cities__translations__field', 'name'),
-                    ('countries__cities__translations__language__in', ['de']),
-                    ('countries__cities__translations__text', 'Köln'),
-                )
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(City),
+                    field='name',
+                    language__in=['de'],
+                    text='Köln',
+                    object_id_int=OuterRef('countries__cities__pk'),
+                ))
             ]
         )
 
@@ -2526,7 +2705,7 @@ class FetchTranslationsQueryGetterTest(TestCase):
     def test_tq_yrelnested_yfield_ytrans_ysupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertQueryChildrenEqual(
             getter(
                 TQ(
                     countries__cities__name__icontains='Kö',
@@ -2536,14 +2715,111 @@ class FetchTranslationsQueryGetterTest(TestCase):
             ).children[0].children[0].children,
             [
                 ('countries__cities__name__icontains', 'Kö'),
-                Q(
-                    ('countries__cities__translations__field', 'name'),
-                    ('countries__cities__translations__language__in', ['de']),
-                    ('countries__cities__translations__text__icontains', 'Kö'),
-                )
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(City),
+                    field='name',
+                    language__in=['de'],
+                    text__icontains='Kö',
+                    object_id_int=OuterRef('countries__cities__pk'),
+                ))
             ]
         )
 
+    def test_lookup_outer_expression(self):
+        getter = _fetch_translations_query_getter(Continent, 'de')
+
+        self.assertQueryChildrenEqual(
+            getter(
+                countries__name=F('name')
+            ).children[0].children,
+            [
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Country),
+                    field='name',
+                    language='de',
+                    text=OuterRef('name'),
+                    object_id=OuterRef('countries__pk'),
+                )),
+            ]
+        )
+
+    def test_lookup_outer_expression_combined(self):
+        getter = _fetch_translations_query_getter(Continent, 'de')
+
+        self.assertQueryChildrenEqual(
+            getter(
+                name=Concat(F('denonym'), Value('!'))
+            ).children[0].children,
+            [
+                Exists(Translation.objects.filter(
+                    content_type=ContentType.objects.get_for_model(Continent),
+                    field='name',
+                    language='de',
+                    text=Concat(OuterRef('denonym'), Value('!')),
+                    object_id=OuterRef('pk'),
+                )),
+            ]
+        )
+
+    def test_lookup_outer_expression_results(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        self.assertListEqual(
+            list(Continent.objects.probe('de').filter(name=F('denonym'))),
+            []
+        )
+
+        Continent.objects.filter(code='EU').update(denonym='Europa')
+
+        self.assertListEqual(
+            list(Continent.objects.probe('de').filter(
+                name=F('denonym')
+            ).values_list('code', flat=True)),
+            ['EU']
+        )
+
+    def test_cached_getter(self):
+        self.assertIs(
+            _fetch_translations_query_getter(Continent, ['en', 'de']),
+            _fetch_translations_query_getter(Continent, ['en', 'de']),
+        )
+
+    def test_cached_getter_default_language(self):
+        getter = _fetch_translations_query_getter(Continent, 'de')
+
+        with self.settings(LANGUAGE_CODE='de'):
+            self.assertIsNot(
+                _fetch_translations_query_getter(Continent, 'de'),
+                getter,
+            )
+            self.assertListEqual(
+                _fetch_translations_query_getter(Continent, 'de')(
+                    name='Europa'
+                ).children[0].children,
+                [
+                    ('name', 'Europa'),
+                ]
+            )
+
+    def test_cached_getter_installed_apps_changed(self):
+        getter = _fetch_translations_query_getter(Continent, 'de')
+
+        setting_changed.send(
+            sender=self.__class__,
+            setting='INSTALLED_APPS',
+            value=settings.INSTALLED_APPS,
+            enter=True,
+        )
+
+        self.assertIsNot(
+            _fetch_translations_query_getter(Continent, 'de'),
+            getter,
+        )
+
 
 class TQTest(TestCase):
     """Tests for `_fetch_translations_query_getter`."""
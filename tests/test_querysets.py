@@ -1,8 +1,20 @@
+import pickle
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+
 from django.test import TestCase, override_settings
-from django.db.models import Q
+from django.test.utils import CaptureQueriesContext, isolate_apps
+from django.db import connection, models
+from django.db.models import Q, Prefetch, Value
+from django.db.models.query_utils import DeferredAttribute
 from django.utils.translation import override
+from django.contrib.contenttypes.models import ContentType
 
-from sample.models import Continent
+from translations.models import Translation, Translatable
+from translations.batch import _get_lazy_fields
+
+from sample.models import Continent, Country, City
 from sample.utils import create_samples
 
 
@@ -2281,6 +2293,139 @@ class TranslatableQuerySetTest(TestCase):
             ('countries', 'countries__cities',)
         )
 
+    def test_translate_related_prefetch_related(self):
+        continents = Continent.objects.translate('de').translate_related(
+            'countries', 'countries__cities')
+
+        self.assertTupleEqual(continents._prefetch_related_lookups, ())
+        list(continents)
+        self.assertTupleEqual(
+            continents._prefetch_related_lookups,
+            ('countries', 'countries__cities',)
+        )
+        self.assertIs(continents.query.select_related, False)
+
+    def test_translate_related_select_related(self):
+        cities = City.objects.translate('de').translate_related(
+            'country', 'country__continent')
+
+        self.assertIs(cities.query.select_related, False)
+        list(cities)
+        self.assertDictEqual(
+            cities.query.select_related,
+            {'country': {'continent': {}}}
+        )
+        self.assertTupleEqual(cities._prefetch_related_lookups, ())
+
+    def test_translate_related_select_related_iterator(self):
+        cities = City.objects.translate('de').translate_related('country')
+
+        list(cities.iterator())
+        self.assertDictEqual(cities.query.select_related, {'country': {}})
+
+    def test_translate_related_default_language(self):
+        cities = City.objects.translate_related('country')
+
+        list(cities)
+        self.assertIs(cities.query.select_related, False)
+
+    def test_translate_related_deferred(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            city_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        cities = City.objects.only('name').translate('de').translate_related(
+            'country')
+
+        self.assertEqual(cities[0].name, 'Köln')
+        self.assertEqual(cities[0].country.name, 'Deutschland')
+        list(cities)
+        self.assertIs(cities.query.select_related, False)
+        self.assertTupleEqual(cities._prefetch_related_lookups, ('country',))
+
+    def test_translate_related_deferred_later(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            city_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        cities = City.objects.translate('de').translate_related(
+            'country').only('name')
+
+        self.assertEqual(cities[0].name, 'Köln')
+        self.assertEqual(cities[0].country.name, 'Deutschland')
+        list(cities)
+        self.assertIs(cities.query.select_related, False)
+        self.assertTupleEqual(cities._prefetch_related_lookups, ('country',))
+
+    def test_translate_related_deferred_nested(self):
+        cities = City.objects.only(
+            'name', 'country', 'country__name'
+        ).translate('de').translate_related('country__continent')
+
+        # the deferred fields are not traversed
+        list(cities)
+        self.assertDictEqual(cities.query.select_related, {'country': {}})
+        self.assertTupleEqual(
+            cities._prefetch_related_lookups,
+            ('country__continent',)
+        )
+
+    def test_translate_related_already_prefetched(self):
+        queryset = Country.objects.exclude(name='')
+        continents = Continent.objects.prefetch_related(
+            Prefetch('countries', queryset=queryset),
+        ).translate('de').translate_related('countries')
+
+        list(continents)
+        self.assertEqual(len(continents._prefetch_related_lookups), 1)
+        self.assertIs(
+            continents._prefetch_related_lookups[0].queryset,
+            queryset
+        )
+
+    def test_translate_related_none(self):
+        continents = Continent.objects.translate_related(
+            'countries').translate_related(None)
+
+        self.assertTupleEqual(continents._trans_rels, ())
+
+    def test_translate_related_queries(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+            city_names=['cologne', 'seoul'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            city_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        continents = Continent.objects.translate_related(
+            'countries', 'countries__cities').translate('de')
+
+        # continents, countries, cities and translations
+        with self.assertNumQueries(4):
+            continents = list(continents)
+            europe = [x for x in continents if x.code == 'EU'][0]
+            germany = europe.countries.all()[0]
+            cologne = germany.cities.all()[0]
+
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(germany.name, 'Deutschland')
+        self.assertEqual(cologne.name, 'Köln')
+
     def test_probe_str(self):
         continents = Continent.objects.probe('de')
 
@@ -2306,6 +2451,62 @@ class TranslatableQuerySetTest(TestCase):
             '`xx` is not a supported language.'
         )
 
+    def test_probe_filter_many_fields(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.probe('de').filter(
+            name='Europa',
+            denonym='Europäisch',
+        )
+
+        self.assertQuerysetEqual(
+            continents,
+            [
+                '<Continent: Europe>',
+            ]
+        )
+
+    def test_probe_filter_many_langs_no_duplicates(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        continents = Continent.objects.probe(['de', 'tr']).filter(
+            name__startswith='As',
+        )
+
+        self.assertQuerysetEqual(
+            continents,
+            [
+                '<Continent: Asia>',
+            ]
+        )
+
+    def test_probe_exclude_many_fields(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.probe('de').exclude(
+            name='Europa',
+            denonym='Europäisch',
+        )
+
+        self.assertQuerysetEqual(
+            continents,
+            [
+                '<Continent: Asia>',
+            ]
+        )
+
     def test_fetch_latest(self):
         create_samples(
             continent_names=['europe'],
@@ -2321,3 +2522,966 @@ class TranslatableQuerySetTest(TestCase):
             langs=['de']
         )
         Continent.objects.earliest('pk')
+
+    def test_iterator_normal_mode(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = list(Continent.objects.order_by('code').iterator())
+
+        self.assertEqual(continents[0].name, 'Asia')
+        self.assertEqual(continents[1].name, 'Europe')
+
+    def test_iterator_with_lang(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = list(
+            Continent.objects.order_by('code').translate('de').iterator()
+        )
+
+        self.assertEqual(continents[0].name, 'Asien')
+        self.assertEqual(continents[0].denonym, 'Asiatisch')
+        self.assertEqual(continents[1].name, 'Europa')
+        self.assertEqual(continents[1].denonym, 'Europäisch')
+
+    def test_iterator_chunks_with_lang(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.order_by('code').translate_related(
+            'countries'
+        ).translate('de')
+
+        # continents, then countries and translations per chunk
+        with self.assertNumQueries(5):
+            continents = list(continents.iterator(chunk_size=1))
+            asia = continents[0]
+            south_korea = asia.countries.all()[0]
+            europe = continents[1]
+            germany = europe.countries.all()[0]
+
+        self.assertEqual(asia.name, 'Asien')
+        self.assertEqual(south_korea.name, 'Südkorea')
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(germany.name, 'Deutschland')
+
+    def test_iterator_values_with_lang(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.order_by('code').translate(
+            'de'
+        ).values('code', 'name')
+
+        # continents, then translations per chunk
+        with self.assertNumQueries(3):
+            continents = list(continents.iterator(chunk_size=1))
+
+        self.assertListEqual(
+            continents,
+            [
+                {'code': 'AS', 'name': 'Asien'},
+                {'code': 'EU', 'name': 'Europa'},
+            ]
+        )
+
+    def test_values_with_lang(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.order_by('code').translate(
+            'de'
+        ).values('name')
+
+        with self.assertNumQueries(2):
+            continents = list(continents)
+
+        self.assertListEqual(
+            continents,
+            [
+                {'name': 'Asien'},
+                {'name': 'Europa'},
+            ]
+        )
+
+    def test_values_all_fields_with_lang(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.translate('de').values()
+
+        self.assertListEqual(
+            list(continents),
+            [
+                {'code': 'EU', 'name': 'Europa', 'denonym': 'European'},
+            ]
+        )
+
+    def test_values_no_translatable_fields_with_lang(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.order_by('code').translate(
+            'de'
+        ).values('code')
+
+        with self.assertNumQueries(1):
+            continents = list(continents)
+
+        self.assertListEqual(continents, [{'code': 'AS'}, {'code': 'EU'}])
+
+    def test_values_list_with_lang(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.order_by('code').translate(
+            'de'
+        ).values_list('denonym', 'code')
+
+        self.assertListEqual(
+            list(continents),
+            [
+                ('Asiatisch', 'AS'),
+                ('Europäisch', 'EU'),
+            ]
+        )
+
+    def test_values_list_all_fields_with_lang(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.translate('de').values_list()
+
+        self.assertListEqual(
+            list(continents),
+            [
+                ('Europa', 'Europäisch', 'EU'),
+            ]
+        )
+
+    def test_values_list_flat_with_lang(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.order_by('code').translate(
+            'de'
+        ).values_list('name', flat=True)
+
+        self.assertListEqual(list(continents), ['Asien', 'Europa'])
+
+    def test_values_list_named_with_lang(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.translate('de').values_list(
+            'code', 'name', named=True
+        )
+
+        europe = list(continents)[0]
+
+        self.assertEqual(europe.code, 'EU')
+        self.assertEqual(europe.name, 'Europa')
+
+    def test_values_list_named_annotated_with_lang(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.translate('de').values_list(
+            'name', named=True
+        ).annotate(number=Value(1))
+
+        europe = list(continents)[0]
+
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(europe.number, 1)
+
+    def test_values_integer_pk_with_lang(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne', 'munich'],
+            city_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        cities = City.objects.order_by('name').translate(
+            'de'
+        ).values_list('name', flat=True)
+
+        self.assertListEqual(list(cities), ['Köln', 'München'])
+
+    def test_values_distinct_with_lang(self):
+        continents = Continent.objects.translate('de').values(
+            'name'
+        ).distinct()
+
+        with self.assertRaises(TypeError) as error:
+            list(continents)
+
+        self.assertEqual(
+            error.exception.args[0],
+            'Translations does not support grouped, distinct or ' +
+            'combined values (yet). ' +
+            'If necessary you can translate the instances instead.'
+        )
+
+    def test_translate_sql_strategy(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.order_by('code').translate(
+            'de', strategy='sql'
+        )
+
+        with self.assertNumQueries(1):
+            continents = list(continents)
+
+        self.assertEqual(continents[0].name, 'Asien')
+        self.assertEqual(continents[0].denonym, 'Asiatisch')
+        self.assertEqual(continents[1].name, 'Europa')
+        self.assertEqual(continents[1].denonym, 'Europäisch')
+        self.assertDictEqual(
+            continents[1]._default_translatable_fields,
+            {'name': 'Europe', 'denonym': 'European'}
+        )
+
+    def test_translate_sql_strategy_fallback(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name'],
+            langs=['de']
+        )
+
+        continents = list(
+            Continent.objects.order_by('code').translate('de', strategy='sql')
+        )
+
+        self.assertEqual(continents[0].name, 'Asien')
+        self.assertEqual(continents[0].denonym, 'Asian')
+        self.assertEqual(continents[1].name, 'Europa')
+        self.assertEqual(continents[1].denonym, 'European')
+
+    def test_translate_sql_strategy_integer_pk(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne', 'munich'],
+            city_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        cities = list(
+            City.objects.order_by('name').translate('de', strategy='sql')
+        )
+
+        self.assertEqual(cities[0].name, 'Köln')
+        self.assertEqual(cities[1].name, 'München')
+
+    def test_translate_sql_strategy_order_by(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['tr']
+        )
+
+        continents = Continent.objects.translate(
+            'tr', strategy='sql'
+        ).order_by('-translated_name')
+
+        self.assertListEqual(
+            [continent.name for continent in continents],
+            ['Avrupa', 'Asya']
+        )
+
+    def test_translate_sql_strategy_values(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.translate(
+            'de', strategy='sql'
+        ).order_by('code').values('code', 'translated_name')
+
+        self.assertListEqual(
+            list(continents),
+            [
+                {'code': 'AS', 'translated_name': 'Asien'},
+                {'code': 'EU', 'translated_name': 'Europa'},
+            ]
+        )
+
+    def test_translate_sql_strategy_values_fields(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.translate(
+            'de', strategy='sql'
+        ).order_by('code')
+
+        with self.assertNumQueries(1):
+            self.assertListEqual(
+                list(continents.values('code', 'name')),
+                [
+                    {'code': 'AS', 'name': 'Asien'},
+                    {'code': 'EU', 'name': 'Europa'},
+                ]
+            )
+
+        with self.assertNumQueries(1):
+            self.assertListEqual(
+                list(continents.values_list('name', 'code', 'denonym')),
+                [
+                    ('Asien', 'AS', 'Asiatisch'),
+                    ('Europa', 'EU', 'Europäisch'),
+                ]
+            )
+
+        self.assertListEqual(
+            list(continents.values_list('name', flat=True).iterator()),
+            ['Asien', 'Europa']
+        )
+
+    def test_translate_sql_strategy_after_values(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.order_by('code')
+
+        self.assertListEqual(
+            list(continents.values('code', 'name').translate(
+                'de', strategy='sql'
+            )),
+            [
+                {'code': 'AS', 'name': 'Asien'},
+                {'code': 'EU', 'name': 'Europa'},
+            ]
+        )
+        self.assertListEqual(
+            list(continents.values_list('name').translate(
+                'de', strategy='sql'
+            )),
+            [('Asien',), ('Europa',)]
+        )
+        self.assertListEqual(
+            list(continents.values_list('name', named=True).translate(
+                'de', strategy='sql'
+            )),
+            [('Asien',), ('Europa',)]
+        )
+        self.assertListEqual(
+            list(continents.values_list('code', flat=True).translate(
+                'de', strategy='sql'
+            )),
+            ['AS', 'EU']
+        )
+
+    def test_translate_sql_strategy_retranslate(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        continents = Continent.objects.translate(
+            'de', strategy='sql'
+        ).order_by('code')
+
+        self.assertNotIn(
+            'translated_name',
+            continents.translate('de').query.annotations
+        )
+        self.assertListEqual(
+            list(continents.translate('tr', strategy='sql').values_list(
+                'translated_name', flat=True
+            )),
+            ['Asya', 'Avrupa']
+        )
+        self.assertListEqual(
+            [continent.name for continent in continents.translate('tr')],
+            ['Asya', 'Avrupa']
+        )
+
+    def test_translate_sql_strategy_related(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        europe = Continent.objects.translate_related(
+            'countries'
+        ).translate('de', strategy='sql').get(code='EU')
+
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(europe.countries.all()[0].name, 'Deutschland')
+
+    def test_translate_sql_strategy_iterator(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.order_by('code').translate(
+            'de', strategy='sql'
+        )
+
+        with self.assertNumQueries(1):
+            continents = list(continents.iterator(chunk_size=1))
+
+        self.assertEqual(continents[0].name, 'Asien')
+        self.assertEqual(continents[1].name, 'Europa')
+
+    def test_translate_lazy_strategy(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        with self.assertNumQueries(1):
+            continents = list(
+                Continent.objects.order_by('code').translate(
+                    'de', strategy='lazy'
+                )
+            )
+
+        # the whole batch is translated on the first access
+        with self.assertNumQueries(1):
+            self.assertEqual(continents[0].name, 'Asien')
+
+        with self.assertNumQueries(0):
+            self.assertEqual(continents[0].denonym, 'Asiatisch')
+            self.assertEqual(continents[1].name, 'Europa')
+            self.assertEqual(continents[1].denonym, 'Europäisch')
+
+        self.assertDictEqual(
+            continents[1]._default_translatable_fields,
+            {'name': 'Europe', 'denonym': 'European'}
+        )
+
+    def test_translate_lazy_strategy_set_before_access(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        europe = Continent.objects.translate('de', strategy='lazy').get()
+        europe.name = 'Europe Name'
+
+        self.assertEqual(europe.name, 'Europe Name')
+        self.assertEqual(europe.denonym, 'Europäisch')
+
+    def test_translate_lazy_strategy_traversal(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+            city_names=['cologne', 'munich', 'seoul'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            city_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        cities = list(
+            City.objects.order_by('id').translate('de', strategy='lazy')
+        )
+
+        # a query per level for the relations and one for the translations
+        with self.assertNumQueries(5):
+            names = [
+                (city.name, city.country.name, city.country.continent.name)
+                for city in cities
+            ]
+
+        self.assertListEqual(
+            names,
+            [
+                ('Köln', 'Deutschland', 'Europa'),
+                ('München', 'Deutschland', 'Europa'),
+                ('Seül', 'Südkorea', 'Asien'),
+            ]
+        )
+
+    def test_translate_lazy_strategy_related(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.translate(
+            'de', strategy='lazy'
+        ).translate_related('countries')
+        germany = list(continents)[0].countries.all()[0]
+
+        with self.assertNumQueries(1):
+            self.assertEqual(germany.name, 'Deutschland')
+
+    def test_translate_lazy_strategy_default_language(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        europe = Continent.objects.translate('en', strategy='lazy').get()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(europe.name, 'Europe')
+
+    def test_translate_lazy_strategy_released(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            city_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        europe = Continent.objects.translate('de', strategy='lazy').get()
+        self.assertEqual(europe.name, 'Europa')
+        # it has no forward relations to load
+        self.assertNotIn('_trans_batch', europe.__dict__)
+
+        cologne = City.objects.translate('de', strategy='lazy').get()
+        self.assertEqual(cologne.name, 'Köln')
+        self.assertIn('_trans_batch', cologne.__dict__)
+        self.assertEqual(cologne.country.name, 'Deutschland')
+        self.assertNotIn('_trans_batch', cologne.__dict__)
+
+    def test_translate_lazy_strategy_pickle(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        europe = Continent.objects.translate('de', strategy='lazy').get()
+        europe = pickle.loads(pickle.dumps(europe))
+
+        self.assertNotIn('_trans_batch', europe.__dict__)
+        with self.assertNumQueries(0):
+            self.assertEqual(europe.name, 'Europa')
+            self.assertEqual(europe.denonym, 'Europäisch')
+
+    def test_translate_lazy_strategy_eager_fallback(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        # like a model whose `denonym` has a custom descriptor
+        with mock.patch(
+            'translations.batch._get_lazy_fields',
+            return_value=(frozenset(['name']), ()),
+        ):
+            with self.assertNumQueries(2):
+                europe = Continent.objects.translate(
+                    'de', strategy='lazy'
+                ).get()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(europe.name, 'Europa')
+            self.assertEqual(europe.denonym, 'Europäisch')
+        self.assertNotIn('_trans_batch', europe.__dict__)
+
+    @isolate_apps('sample')
+    def test_translate_lazy_strategy_descriptors(self):
+        class CustomAttribute(DeferredAttribute):
+            pass
+
+        class CustomField(models.CharField):
+            descriptor_class = CustomAttribute
+
+        class Place(Translatable):
+            name = models.CharField(max_length=64)
+            code = CustomField(max_length=64)
+
+        class Park(Place):
+            area = models.CharField(max_length=64)
+
+        self.assertIs(type(Place.__dict__['name']), DeferredAttribute)
+
+        fields, relations = _get_lazy_fields(Park)
+
+        # the inherited fields are wrapped and the custom ones are not
+        self.assertEqual(fields, frozenset(['name', 'area']))
+        self.assertListEqual(
+            [field.name for field in relations],
+            ['place_ptr']
+        )
+        self.assertIsInstance(Park.__dict__['name'], DeferredAttribute)
+        self.assertIsNot(type(Park.__dict__['name']), DeferredAttribute)
+        self.assertIs(type(Place.__dict__['code']), CustomAttribute)
+        # nothing is installed before the first use
+        self.assertIs(type(Place.__dict__['name']), DeferredAttribute)
+
+    def test_translate_all(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        with self.assertNumQueries(2):
+            continents = list(
+                Continent.objects.order_by('-code').translate_all(['de', 'tr'])
+            )
+
+        self.assertEqual(continents[0].name, 'Europe')
+        with self.assertNumQueries(0):
+            self.assertEqual(continents[0].translated('de').name, 'Europa')
+            self.assertEqual(continents[1].translated('de').name, 'Asien')
+            self.assertEqual(continents[0].translated('tr').name, 'Avrupa')
+            self.assertEqual(continents[0].translated('en').name, 'Europe')
+
+    def test_translate_all_translate(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        with self.assertNumQueries(3):
+            europe = Continent.objects.translate_related(
+                'countries'
+            ).translate('de').translate_all(['tr']).get()
+            germany = europe.countries.all()[0]
+
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(germany.name, 'Deutschland')
+        with self.assertNumQueries(0):
+            self.assertEqual(germany.translated('tr').name, 'Almanya')
+
+    def test_translate_all_iterator(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        continents = list(
+            Continent.objects.translate_all().order_by('-code').iterator()
+        )
+
+        with self.assertNumQueries(0):
+            self.assertEqual(continents[0].translated('tr').name, 'Avrupa')
+            self.assertEqual(continents[1].translated('de').name, 'Asien')
+
+    @override_settings(TRANSLATIONS_FALLBACKS={'tr': ['de']})
+    def test_translate_fallbacks_python(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+        Translation.objects.create(
+            content_type=ContentType.objects.get_for_model(Continent),
+            object_id='EU',
+            field='name',
+            language='tr',
+            text='Avrupa',
+        )
+
+        with self.assertNumQueries(2):
+            europe = Continent.objects.translate('tr').get()
+
+        self.assertEqual(europe.name, 'Avrupa')
+        self.assertEqual(europe.denonym, 'Europäisch')
+
+    @override_settings(TRANSLATIONS_FALLBACKS={'tr': ['de']})
+    def test_translate_fallbacks_sql(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+        Translation.objects.create(
+            content_type=ContentType.objects.get_for_model(Continent),
+            object_id='EU',
+            field='name',
+            language='tr',
+            text='Avrupa',
+        )
+
+        with self.assertNumQueries(1):
+            europe = Continent.objects.translate('tr', strategy='sql').get()
+
+        self.assertEqual(europe.name, 'Avrupa')
+        self.assertEqual(europe.denonym, 'Europäisch')
+
+    @override_settings(TRANSLATIONS_FALLBACKS={'tr': ['de']})
+    def test_translate_fallbacks_values(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+        Translation.objects.create(
+            content_type=ContentType.objects.get_for_model(Continent),
+            object_id='EU',
+            field='name',
+            language='tr',
+            text='Avrupa',
+        )
+
+        with self.assertNumQueries(2):
+            values = list(
+                Continent.objects.translate('tr').values('name', 'denonym')
+            )
+
+        self.assertListEqual(
+            values,
+            [{'name': 'Avrupa', 'denonym': 'Europäisch'}]
+        )
+
+    async def test_translate_aiter(self):
+        await sync_to_async(create_samples)(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.translate('de').order_by('code')
+
+        self.assertListEqual(
+            [continent.name async for continent in continents],
+            ['Asien', 'Europa']
+        )
+
+    async def test_translate_aiterator(self):
+        await sync_to_async(create_samples)(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.translate('de').order_by('code')
+
+        self.assertListEqual(
+            [
+                continent.name
+                async for continent in continents.aiterator(chunk_size=1)
+            ],
+            ['Asien', 'Europa']
+        )
+
+    async def test_translate_aget(self):
+        await sync_to_async(create_samples)(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        europe = await Continent.objects.translate('de').aget(code='EU')
+
+        self.assertEqual(europe.name, 'Europa')
+
+    async def test_translate_afirst_alast(self):
+        await sync_to_async(create_samples)(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.translate('de').order_by('code')
+
+        self.assertEqual((await continents.afirst()).name, 'Asien')
+        self.assertEqual((await continents.alast()).name, 'Europa')
+
+    def test_translate_deferred_fields(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        with self.assertNumQueries(2):
+            europe = Continent.objects.translate('de').only(
+                'code', 'name'
+            ).get()
+
+        self.assertEqual(europe.name, 'Europa')
+        self.assertSetEqual(europe.get_deferred_fields(), {'denonym'})
+
+    def test_translate_deferred_fields_sql_strategy(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        with self.assertNumQueries(1):
+            europe = Continent.objects.translate('de', strategy='sql').defer(
+                'denonym'
+            ).get()
+
+        self.assertEqual(europe.name, 'Europa')
+        self.assertSetEqual(europe.get_deferred_fields(), {'denonym'})
+
+    def test_translate_fields(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        with CaptureQueriesContext(connection) as captured:
+            europe = Continent.objects.translate('de', fields=['name']).get()
+
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(europe.denonym, 'European')
+        self.assertIn('"field" IN', captured[1]['sql'])
+
+    def test_translate_fields_sql_strategy(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        europe = Continent.objects.translate(
+            'de', strategy='sql', fields=['name']
+        ).get()
+
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(europe.denonym, 'European')
+        self.assertFalse(hasattr(europe, 'translated_denonym'))
+
+    def test_translate_fields_lazy_strategy(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        europe = Continent.objects.translate(
+            'de', strategy='lazy', fields=['name']
+        ).get()
+
+        self.assertEqual(europe.denonym, 'European')
+        self.assertEqual(europe.name, 'Europa')
+
+    def test_translate_fields_values(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        values = list(
+            Continent.objects.translate('de', fields=['name']).values(
+                'name', 'denonym'
+            )
+        )
+
+        self.assertListEqual(
+            values,
+            [{'name': 'Europa', 'denonym': 'European'}]
+        )
+
+    def test_translate_related_fields(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        europe = Continent.objects.translate('de').translate_related(
+            'countries', fields=['denonym']
+        ).get()
+        germany = europe.countries.all()[0]
+
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(europe.denonym, 'Europäisch')
+        self.assertEqual(germany.name, 'Germany')
+        self.assertEqual(germany.denonym, 'Deutsche')
+
+    def test_translate_invalid_field(self):
+        with self.assertRaises(ValueError) as error:
+            Continent.objects.translate('de', fields=['code'])
+
+        self.assertEqual(
+            error.exception.args[0],
+            '`code` is not a translatable field.'
+        )
+
+    def test_translate_invalid_strategy(self):
+        with self.assertRaises(ValueError) as error:
+            Continent.objects.translate('de', strategy='xx')
+
+        self.assertEqual(
+            error.exception.args[0],
+            '`xx` is not a supported strategy.'
+        )
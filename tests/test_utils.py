@@ -1,15 +1,78 @@
+from unittest import mock
+
 from django.test import TestCase
+from django.db import connection
 from django.core.exceptions import FieldDoesNotExist
 from django.contrib.contenttypes.models import ContentType
 
-from translations.utils import _get_reverse_relation, _get_dissected_lookup, \
-    _get_relations_hierarchy, _get_entity_details, \
+from translations.utils import _get_content_type_id, \
+    _clear_content_type_ids, _get_reverse_relation, _get_dissected_lookup, \
+    _get_relations_hierarchy, _get_relations_lookups, _get_entity_groups, \
     _get_purview, _get_translations
 
 from sample.models import Continent, Country, City
 from sample.utils import create_samples
 
 
+def create_bulk_samples(count):
+    """Create some continents each with a country and a city in bulk."""
+    # two characters codes which are unique for up to 10,000 instances
+    codes = [
+        chr(0x4E00 + index // 100) + chr(0x4E00 + index % 100)
+        for index in range(count)
+    ]
+    Continent.objects.bulk_create([
+        Continent(code=code, name='Continent', denonym='Continental')
+        for code in codes
+    ])
+    Country.objects.bulk_create([
+        Country(
+            code=code, name='Country', denonym='National', continent_id=code
+        )
+        for code in codes
+    ])
+    City.objects.bulk_create([
+        City(name='City', denonym='Citizen', country_id=code)
+        for code in codes
+    ])
+    # cache the content types so that only the instances are queried
+    _get_content_type_id(Continent)
+
+
+class GetContentTypeIdTest(TestCase):
+    """Tests for `_get_content_type_id`."""
+
+    def setUp(self):
+        _clear_content_type_ids()
+        ContentType.objects.clear_cache()
+
+    def test_translatable(self):
+        # all the translatable models at once
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                _get_content_type_id(Continent),
+                ContentType.objects.get_for_model(Continent).id
+            )
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                _get_content_type_id(City),
+                ContentType.objects.get_for_model(City).id
+            )
+
+    def test_not_translatable(self):
+        _get_content_type_id(Continent)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                _get_content_type_id(ContentType),
+                ContentType.objects.get_for_model(ContentType).id
+            )
+
+        with self.assertNumQueries(0):
+            _get_content_type_id(ContentType)
+
+
 class GetReverseRelationTest(TestCase):
     """Tests for `_get_reverse_relation`."""
 
@@ -225,6 +288,20 @@ class GetDissectedLookupTest(TestCase):
             }
         )
 
+    def test_cached_copy(self):
+        dissected = _get_dissected_lookup(Continent, 'countries__name')
+        dissected['relation'].append('cities')
+
+        self.assertDictEqual(
+            _get_dissected_lookup(Continent, 'countries__name'),
+            {
+                'relation': ['countries'],
+                'field': 'name',
+                'supplement': '',
+                'translatable': True,
+            }
+        )
+
 
 class GetRelationsHierarchyTest(TestCase):
     """Tests for `_get_relations_hierarchy`."""
@@ -487,27 +564,112 @@ class GetRelationsHierarchyTest(TestCase):
         )
 
 
-class GetEntityDetailsTest(TestCase):
-    """Tests for `_get_entity_details`."""
+class GetRelationsLookupsTest(TestCase):
+    """Tests for `_get_relations_lookups`."""
+
+    def test_level_0_relation(self):
+        self.assertTupleEqual(
+            _get_relations_lookups(Continent),
+            ([], [])
+        )
+
+    def test_forward_relation(self):
+        self.assertTupleEqual(
+            _get_relations_lookups(City, 'country'),
+            (['country'], [])
+        )
+
+    def test_nested_forward_relation(self):
+        self.assertTupleEqual(
+            _get_relations_lookups(City, 'country', 'country__continent'),
+            (['country', 'country__continent'], [])
+        )
+
+    def test_reverse_relation(self):
+        self.assertTupleEqual(
+            _get_relations_lookups(Continent, 'countries'),
+            ([], ['countries'])
+        )
+
+    def test_nested_reverse_relation(self):
+        self.assertTupleEqual(
+            _get_relations_lookups(
+                Continent, 'countries', 'countries__cities'
+            ),
+            ([], ['countries', 'countries__cities'])
+        )
+
+    def test_forward_and_reverse_relation(self):
+        self.assertTupleEqual(
+            _get_relations_lookups(City, 'country__continent__countries'),
+            (['country__continent'], ['country__continent__countries'])
+        )
+
+    def test_attribute_relation(self):
+        self.assertTupleEqual(
+            _get_relations_lookups(Continent, 'attribute'),
+            ([], [])
+        )
+
+    def test_nested_attribute_relation(self):
+        self.assertTupleEqual(
+            _get_relations_lookups(City, 'country__continent__attribute'),
+            (['country__continent'], [])
+        )
+
+    def test_reverse_attribute_relation(self):
+        self.assertTupleEqual(
+            _get_relations_lookups(Continent, 'countries__attribute'),
+            ([], [])
+        )
+
+
+class GetEntityGroupsTest(TestCase):
+    """Tests for `_get_entity_groups`."""
 
     def test_iterable(self):
         create_samples(continent_names=['europe', 'asia'])
 
-        continents = list(Continent.objects.all())
+        continents = list(Continent.objects.order_by('code'))
 
         self.assertEqual(
-            _get_entity_details(continents),
-            (True, Continent)
+            _get_entity_groups(continents),
+            {Continent: continents}
         )
 
     def test_queryset(self):
         create_samples(continent_names=['europe', 'asia'])
 
-        continents = Continent.objects.all()
+        continents = Continent.objects.order_by('code')
 
         self.assertEqual(
-            _get_entity_details(continents),
-            (True, Continent)
+            _get_entity_groups(continents),
+            {Continent: list(continents)}
+        )
+
+    def test_generator(self):
+        create_samples(continent_names=['europe', 'asia'])
+
+        continents = list(Continent.objects.order_by('code'))
+
+        self.assertEqual(
+            _get_entity_groups(obj for obj in continents),
+            {Continent: continents}
+        )
+
+    def test_heterogeneous_iterable(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany'],
+        )
+
+        europe = Continent.objects.get(code='EU')
+        asia = Continent.objects.get(code='AS')
+        germany = Country.objects.get(code='DE')
+
+        self.assertEqual(
+            _get_entity_groups([europe, germany, asia]),
+            {Continent: [europe, asia], Country: [germany]}
         )
 
     def test_instance(self):
@@ -516,22 +678,22 @@ class GetEntityDetailsTest(TestCase):
         europe = Continent.objects.get(code='EU')
 
         self.assertEqual(
-            _get_entity_details(europe),
-            (False, Continent)
+            _get_entity_groups(europe),
+            {Continent: [europe]}
         )
 
     def test_empty_iterable(self):
         self.assertEqual(
-            _get_entity_details([]),
-            (True, None)
+            _get_entity_groups([]),
+            {}
         )
 
     def test_empty_queryset(self):
         continents = Continent.objects.none()
 
         self.assertEqual(
-            _get_entity_details(continents),
-            (True, None)
+            _get_entity_groups(continents),
+            {}
         )
 
     def test_invalid_instance(self):
@@ -548,7 +710,7 @@ class GetEntityDetailsTest(TestCase):
         behzad = Person('Behzad')
 
         with self.assertRaises(TypeError) as error:
-            _get_entity_details(behzad)
+            _get_entity_groups(behzad)
 
         self.assertEqual(
             error.exception.args[0],
@@ -572,7 +734,7 @@ class GetEntityDetailsTest(TestCase):
         people.append(Person('Max'))
 
         with self.assertRaises(TypeError) as error:
-            _get_entity_details(people)
+            _get_entity_groups(people)
 
         self.assertEqual(
             error.exception.args[0],
@@ -1174,6 +1336,104 @@ class GetPurviewTest(TestCase):
             }
         )
 
+    def test_queryset_level_1_2_relation_query(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+            city_names=['cologne', 'seoul'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            city_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        lvl_1_2 = ('countries', 'countries__cities',)
+
+        continents = Continent.objects.all()
+        hierarchy = _get_relations_hierarchy(*lvl_1_2)
+
+        ct_continent = ContentType.objects.get_for_model(Continent)
+        ct_country = ContentType.objects.get_for_model(Country)
+        ct_city = ContentType.objects.get_for_model(City)
+
+        mapping, query = _get_purview(continents, hierarchy)
+
+        self.assertDictEqual(
+            query,
+            {
+                ct_continent.id: {'EU', 'AS'},
+                ct_country.id: {'DE', 'KR'},
+                ct_city.id: {
+                    str(city.pk) for city in City.objects.all()
+                },
+            }
+        )
+
+    def test_queryset_level_1_2_relation_queries_1_parents(self):
+        create_bulk_samples(1)
+
+        lvl_1_2 = ('countries', 'countries__cities',)
+
+        continents = Continent.objects.all()
+        hierarchy = _get_relations_hierarchy(*lvl_1_2)
+
+        # one query per level of the hierarchy
+        with self.assertNumQueries(3):
+            mapping, query = _get_purview(continents, hierarchy)
+
+        self.assertEqual(
+            [len(object_ids) for object_ids in query.values()],
+            [1, 1, 1]
+        )
+
+    def test_queryset_level_1_2_relation_queries_100_parents(self):
+        create_bulk_samples(100)
+
+        lvl_1_2 = ('countries', 'countries__cities',)
+
+        continents = Continent.objects.all()
+        hierarchy = _get_relations_hierarchy(*lvl_1_2)
+
+        # one query per level of the hierarchy
+        with self.assertNumQueries(3):
+            mapping, query = _get_purview(continents, hierarchy)
+
+        self.assertEqual(
+            [len(object_ids) for object_ids in query.values()],
+            [100, 100, 100]
+        )
+
+    def test_queryset_level_1_2_relation_queries_10000_parents(self):
+        create_bulk_samples(10000)
+
+        lvl_1_2 = ('countries', 'countries__cities',)
+
+        continents = Continent.objects.all()
+        hierarchy = _get_relations_hierarchy(*lvl_1_2)
+
+        # one query per level of the hierarchy
+        with self.assertNumQueries(3):
+            mapping, query = _get_purview(continents, hierarchy)
+
+        self.assertEqual(
+            [len(object_ids) for object_ids in query.values()],
+            [10000, 10000, 10000]
+        )
+
+    def test_instance_level_2_relation_queries(self):
+        create_bulk_samples(1)
+
+        lvl_2 = ('country__continent',)
+
+        city = City.objects.get()
+        hierarchy = _get_relations_hierarchy(*lvl_2)
+
+        # one query per level of the hierarchy
+        with self.assertNumQueries(2):
+            mapping, query = _get_purview(city, hierarchy)
+
+        self.assertEqual(len(query), 2)
+
     def test_invalid_instance(self):
         class Person:
             def __init__(self, name):
@@ -1220,6 +1480,49 @@ class GetPurviewTest(TestCase):
              ' model instances.')
         )
 
+    def test_deferred_fields(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        europe = Continent.objects.only('code', 'name').get(code='EU')
+        hierarchy = _get_relations_hierarchy()
+
+        with self.assertNumQueries(0):
+            _get_purview(europe, hierarchy)
+
+        self.assertDictEqual(
+            europe._default_translatable_fields,
+            {'name': 'Europe'}
+        )
+        self.assertSetEqual(europe.get_deferred_fields(), {'denonym'})
+
+    def test_cached_relations(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+        )
+
+        cities = list(City.objects.select_related('country__continent'))
+        hierarchy = _get_relations_hierarchy('country', 'country__continent')
+
+        with self.assertNumQueries(0):
+            mapping, query = _get_purview(cities, hierarchy)
+
+        self.assertDictEqual(
+            query,
+            {
+                ContentType.objects.get_for_model(City).id: {
+                    str(cities[0].pk)
+                },
+                ContentType.objects.get_for_model(Country).id: {'DE'},
+                ContentType.objects.get_for_model(Continent).id: {'EU'},
+            }
+        )
+
 
 class GetTranslationsTest(TestCase):
     """Tests for `_get_translations`."""
@@ -1240,7 +1543,7 @@ class GetTranslationsTest(TestCase):
         mapping, query = _get_purview(europe, hierarchy)
 
         self.assertQuerysetEqual(
-            _get_translations(query, 'de').order_by('id'),
+            sorted(_get_translations(query, 'de'), key=lambda x: x.id),
             [
                 '<Translation: Europe: Europa>',
                 '<Translation: European: Europäisch>',
@@ -1265,7 +1568,7 @@ class GetTranslationsTest(TestCase):
         mapping, query = _get_purview(europe, hierarchy)
 
         self.assertQuerysetEqual(
-            _get_translations(query, 'de').order_by('id'),
+            sorted(_get_translations(query, 'de'), key=lambda x: x.id),
             [
                 '<Translation: Europe: Europa>',
                 '<Translation: European: Europäisch>',
@@ -1292,7 +1595,7 @@ class GetTranslationsTest(TestCase):
         mapping, query = _get_purview(europe, hierarchy)
 
         self.assertQuerysetEqual(
-            _get_translations(query, 'de').order_by('id'),
+            sorted(_get_translations(query, 'de'), key=lambda x: x.id),
             [
                 '<Translation: Europe: Europa>',
                 '<Translation: European: Europäisch>',
@@ -1319,7 +1622,7 @@ class GetTranslationsTest(TestCase):
         mapping, query = _get_purview(europe, hierarchy)
 
         self.assertQuerysetEqual(
-            _get_translations(query, 'de').order_by('id'),
+            sorted(_get_translations(query, 'de'), key=lambda x: x.id),
             [
                 '<Translation: Europe: Europa>',
                 '<Translation: European: Europäisch>',
@@ -1346,7 +1649,7 @@ class GetTranslationsTest(TestCase):
         mapping, query = _get_purview(continents, hierarchy)
 
         self.assertQuerysetEqual(
-            _get_translations(query, 'de').order_by('id'),
+            sorted(_get_translations(query, 'de'), key=lambda x: x.id),
             [
                 '<Translation: Europe: Europa>',
                 '<Translation: European: Europäisch>',
@@ -1373,7 +1676,7 @@ class GetTranslationsTest(TestCase):
         mapping, query = _get_purview(continents, hierarchy)
 
         self.assertQuerysetEqual(
-            _get_translations(query, 'de').order_by('id'),
+            sorted(_get_translations(query, 'de'), key=lambda x: x.id),
             [
                 '<Translation: Europe: Europa>',
                 '<Translation: European: Europäisch>',
@@ -1404,7 +1707,7 @@ class GetTranslationsTest(TestCase):
         mapping, query = _get_purview(continents, hierarchy)
 
         self.assertQuerysetEqual(
-            _get_translations(query, 'de').order_by('id'),
+            sorted(_get_translations(query, 'de'), key=lambda x: x.id),
             [
                 '<Translation: Europe: Europa>',
                 '<Translation: European: Europäisch>',
@@ -1435,7 +1738,47 @@ class GetTranslationsTest(TestCase):
         mapping, query = _get_purview(continents, hierarchy)
 
         self.assertQuerysetEqual(
-            _get_translations(query, 'de').order_by('id'),
+            sorted(_get_translations(query, 'de'), key=lambda x: x.id),
+            [
+                '<Translation: Europe: Europa>',
+                '<Translation: European: Europäisch>',
+                '<Translation: Germany: Deutschland>',
+                '<Translation: German: Deutsche>',
+                '<Translation: Cologne: Köln>',
+                '<Translation: Cologner: Kölner>',
+                '<Translation: Asia: Asien>',
+                '<Translation: Asian: Asiatisch>',
+                '<Translation: South Korea: Südkorea>',
+                '<Translation: South Korean: Südkoreanisch>',
+                '<Translation: Seoul: Seül>',
+                '<Translation: Seouler: Seüler>',
+            ]
+        )
+
+    def test_chunked_queryset_level_1_2_relation_with_lang(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+            city_names=['cologne', 'seoul'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            city_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        lvl_1_2 = ('countries', 'countries__cities',)
+
+        continents = Continent.objects.all()
+        hierarchy = _get_relations_hierarchy(*lvl_1_2)
+        mapping, query = _get_purview(continents, hierarchy)
+
+        # the language, a content type and a single object id per query
+        with mock.patch.object(connection.features, 'max_query_params', 3):
+            with self.assertNumQueries(6):
+                translations = _get_translations(query, 'de')
+
+        self.assertQuerysetEqual(
+            sorted(translations, key=lambda x: x.id),
             [
                 '<Translation: Europe: Europa>',
                 '<Translation: European: Europäisch>',
@@ -1451,3 +1794,74 @@ class GetTranslationsTest(TestCase):
                 '<Translation: Seouler: Seüler>',
             ]
         )
+
+    def test_fields(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        europe = Continent.objects.get(code='EU')
+        hierarchy = _get_relations_hierarchy('countries')
+        mapping, query = _get_purview(europe, hierarchy)
+
+        ct_continent = ContentType.objects.get_for_model(Continent)
+
+        self.assertQuerysetEqual(
+            sorted(
+                _get_translations(query, 'de', fields={ct_continent.id: {
+                    'name',
+                }}),
+                key=lambda x: x.id
+            ),
+            [
+                '<Translation: Europe: Europa>',
+                '<Translation: Germany: Deutschland>',
+                '<Translation: German: Deutsche>',
+            ]
+        )
+
+    def test_fields_empty(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        europe = Continent.objects.get(code='EU')
+        hierarchy = _get_relations_hierarchy()
+        mapping, query = _get_purview(europe, hierarchy)
+
+        ct_continent = ContentType.objects.get_for_model(Continent)
+
+        with self.assertNumQueries(0):
+            translations = _get_translations(
+                query, 'de', fields={ct_continent.id: set()}
+            )
+
+        self.assertListEqual(translations, [])
+
+    def test_unchunked_queryset_level_1_2_relation_with_lang(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+            city_names=['cologne', 'seoul'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            city_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        lvl_1_2 = ('countries', 'countries__cities',)
+
+        continents = Continent.objects.all()
+        hierarchy = _get_relations_hierarchy(*lvl_1_2)
+        mapping, query = _get_purview(continents, hierarchy)
+
+        with self.assertNumQueries(1):
+            translations = _get_translations(query, 'de')
+
+        self.assertEqual(len(translations), 12)
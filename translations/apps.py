@@ -10,10 +10,44 @@ class TranslationsConfig(AppConfig):
     verbose_name = _('translations')
 
     def ready(self):
-        try:
-            # cache all content types at the start
-            from django.contrib.contenttypes.models import ContentType
-            models = [ct.model_class() for ct in ContentType.objects.all()]
-            ContentType.objects.get_for_models(*models)
-        except Exception:
-            pass
+        from django.core.signals import setting_changed
+        from django.db.models.signals import class_prepared, post_migrate
+        from translations.languages import _clear_languages_caches
+        from translations.query import _clear_query_caches
+        from translations.cache import _update_cache_receivers
+        from translations.utils import _clear_content_type_ids
+
+        # the cached language codes depend on the languages settings
+        setting_changed.connect(
+            _clear_languages_caches,
+            dispatch_uid='translations_clear_languages_caches',
+        )
+
+        # the cached lookups and getters refer to the models and their
+        # content types
+        class_prepared.connect(
+            _clear_query_caches,
+            dispatch_uid='translations_clear_query_caches',
+        )
+        post_migrate.connect(
+            _clear_query_caches,
+            dispatch_uid='translations_clear_query_caches',
+        )
+        setting_changed.connect(
+            _clear_query_caches,
+            dispatch_uid='translations_clear_query_caches',
+        )
+
+        # the content type ids are fetched on the first use and refetched
+        # after the content types may have changed
+        post_migrate.connect(
+            _clear_content_type_ids,
+            dispatch_uid='translations_clear_content_type_ids',
+        )
+
+        # the translations cache is opt-in
+        _update_cache_receivers()
+        setting_changed.connect(
+            _update_cache_receivers,
+            dispatch_uid='translations_update_cache_receivers',
+        )
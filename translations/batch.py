@@ -0,0 +1,202 @@
+"""This module contains the deferred translations for the Translations app."""
+
+from django.db.models.query import prefetch_related_objects
+from django.db.models.query_utils import DeferredAttribute
+
+import translations.models
+from translations.context import Context
+
+
+__docformat__ = 'restructuredtext'
+
+
+class _TranslationBatch:
+    """
+    A batch of instances whose translation is deferred until the first
+    access to any of their translatable fields.
+    """
+
+    def __init__(self, instances, lang, *relations, fields=None,
+                 related_fields=None):
+        """
+        Initialize a `_TranslationBatch` with some instances, a language,
+        some relations of them and optionally the fields to translate in them.
+        """
+        self.lang = lang
+        self.related_fields = related_fields
+        self.context = Context(
+            instances,
+            *relations,
+            fields=fields,
+            related_fields=related_fields,
+        )
+        self.pending = {}
+        self.loaded = set()
+
+        # hide the fields, so that accessing them reaches the descriptors
+        eager = False
+        for (ct_id, objs) in self.context.mapping.items():
+            names = self.context.fields[ct_id]
+            for obj in objs.values():
+                wrapped = _get_lazy_fields(type(obj))[0]
+                eager = eager or not wrapped.issuperset(names)
+                obj.__dict__['_trans_batch'] = self
+                self.pending[id(obj)] = {
+                    field: obj.__dict__.pop(field)
+                    for field in names
+                    if field in wrapped and field in obj.__dict__
+                }
+
+        # the fields which cannot be deferred are translated right away
+        if eager:
+            self.translate()
+
+    def translate(self):
+        """Translate all the instances of the `_TranslationBatch` at once."""
+        pending, self.pending = self.pending, {}
+        changed = []
+        for objs in self.context.mapping.values():
+            for obj in objs.values():
+                for (field, value) in pending[id(obj)].items():
+                    # the fields set in the meantime take precedence
+                    if field in obj.__dict__:
+                        changed.append((obj, field, obj.__dict__[field]))
+                    obj.__dict__[field] = value
+        self.context.read(self.lang)
+        for (obj, field, value) in changed:
+            obj.__dict__[field] = value
+        self.release()
+
+    def load(self, instance, relation):
+        r"""
+        Fetch a relation of all the `_TranslationBatch`\ 's instances of
+        the same model as an instance at once, deferring their translation
+        in a new `_TranslationBatch`.
+        """
+        model = type(instance)
+        self.loaded.add((model, relation))
+
+        instances = [
+            obj for objs in self.context.mapping.values()
+            for obj in objs.values() if type(obj) is model
+        ]
+        prefetch_related_objects(instances, relation)
+
+        field = model._meta.get_field(relation)
+        values = {}
+        for obj in instances:
+            value = field.get_cached_value(obj, None)
+            if value is not None and '_trans_batch' not in value.__dict__:
+                values[id(value)] = value
+        if values and issubclass(
+            field.related_model, translations.models.Translatable
+        ):
+            _TranslationBatch(
+                list(values.values()),
+                self.lang,
+                fields=self.related_fields,
+                related_fields=self.related_fields,
+            )
+        self.release()
+
+    def release(self):
+        r"""
+        Detach the `_TranslationBatch` from its instances which are translated
+        and whose relations are loaded, so that it is not kept alive by them.
+        """
+        if self.pending:
+            return
+        for objs in self.context.mapping.values():
+            for obj in objs.values():
+                if '_trans_batch' not in obj.__dict__:
+                    continue
+                model = type(obj)
+                if all(
+                    (model, field.name) in self.loaded or
+                    field.is_cached(obj)
+                    for field in _get_lazy_fields(model)[1]
+                ):
+                    del obj.__dict__['_trans_batch']
+
+
+class _TranslatableAttribute(DeferredAttribute):
+    """
+    The descriptor of the translatable fields which translates the deferred
+    batch of an instance on the first access.
+    """
+
+    def __get__(self, instance, cls=None):
+        if instance is not None:
+            batch = instance.__dict__.get('_trans_batch')
+            if batch is not None and batch.pending:
+                batch.translate()
+        return super(_TranslatableAttribute, self).__get__(instance, cls)
+
+
+class _TranslatableRelationMixin:
+    """
+    The mixin of the forward relation descriptors which fetches the relation
+    of the deferred batch of an instance on the first access.
+    """
+
+    def __get__(self, instance, cls=None):
+        if instance is not None:
+            batch = instance.__dict__.get('_trans_batch')
+            if batch is not None and \
+                    (type(instance), self.field.name) not in batch.loaded \
+                    and not self.is_cached(instance):
+                batch.load(instance, self.field.name)
+        return super(_TranslatableRelationMixin, self).__get__(instance, cls)
+
+
+def _get_descriptor(model, name):
+    """Return the descriptor of an attribute of a model or its parents."""
+    for cls in model.__mro__:
+        if name in cls.__dict__:
+            return cls.__dict__[name]
+    return None
+
+
+def _install_descriptors(model):
+    """
+    Install the deferred translation descriptors on a model and return the
+    names of the translatable fields and the forward relations they wrap.
+    """
+    fields = set()
+    for field in model.get_translatable_fields():
+        descriptor = _get_descriptor(model, field.attname)
+        # the custom descriptors are not wrapped
+        if type(descriptor) is DeferredAttribute:
+            setattr(model, field.attname, _TranslatableAttribute(field))
+        elif not isinstance(descriptor, _TranslatableAttribute):
+            continue
+        fields.add(field.name)
+
+    relations = []
+    for field in model._meta.concrete_fields:
+        if not (field.many_to_one or field.one_to_one):
+            continue
+        descriptor = _get_descriptor(model, field.name)
+        if descriptor is None:
+            continue
+        if not isinstance(descriptor, _TranslatableRelationMixin):
+            descriptor_class = type(
+                'Translatable{}'.format(type(descriptor).__name__),
+                (_TranslatableRelationMixin, type(descriptor)),
+                {},
+            )
+            setattr(model, field.name, descriptor_class(field))
+        relations.append(field)
+
+    return frozenset(fields), tuple(relations)
+
+
+def _get_lazy_fields(model):
+    """
+    Return the names of the translatable fields and the forward relations
+    of a model which can be deferred, installing their descriptors on the
+    first use.
+    """
+    if '_cached_lazy_fields' not in model.__dict__:
+        model._cached_lazy_fields = _install_descriptors(model)
+    return model._cached_lazy_fields
@@ -0,0 +1,190 @@
+"""This module contains the translations cache for the Translations app."""
+
+import contextvars
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db.models.signals import post_save, post_delete
+
+import translations.models
+from translations.utils import _get_translations
+
+
+__docformat__ = 'restructuredtext'
+
+
+# the request cache, a map of `(ct_id, object_id, lang)` to `{field: text}`
+# which only exists while `TranslationCacheMiddleware` handles a request
+_request_translations = contextvars.ContextVar(
+    'translations_request_translations',
+    default=None,
+)
+
+
+# the middleware which enables the request cache
+_MIDDLEWARE = 'translations.middleware.TranslationCacheMiddleware'
+
+
+def _get_cache():
+    """Return the translations cache or `None` if it is not enabled."""
+    alias = getattr(settings, 'TRANSLATIONS_CACHE', None)
+    if alias is None:
+        return None
+    return caches[alias]
+
+
+def _is_caching():
+    """Return whether the translations are cached at the moment."""
+    return _request_translations.get() is not None or _get_cache() is not None
+
+
+def _get_cache_key(content_type_id, object_id, lang):
+    """Return the cache key of an object's translations in a language."""
+    # the object ids may have any length or character
+    object_id = hashlib.md5(str(object_id).encode()).hexdigest()
+    return 'translations:{}:{}:{}'.format(content_type_id, object_id, lang)
+
+
+def _get_cached_translations(cache, query, lang):
+    """
+    Return the texts of a query's translations in some language(s), reading
+    them from the request cache, the cache and the database in order and
+    caching the missing ones.
+    """
+    langs = list(lang) if isinstance(lang, (list, tuple)) else [lang]
+    requested = _request_translations.get()
+
+    # the fields of each `(ct_id, object_id, lang)`
+    entries = {}
+    missing = set()
+    for (content_type_id, object_ids) in query.items():
+        for object_id in object_ids:
+            for lang in langs:
+                entry = (content_type_id, object_id, lang)
+                if requested is not None and entry in requested:
+                    entries[entry] = requested[entry]
+                else:
+                    missing.add(entry)
+
+    if missing and cache is not None:
+        keys = {_get_cache_key(*entry): entry for entry in missing}
+        cached = cache.get_many(list(keys))
+        for (key, entry) in keys.items():
+            if key in cached:
+                entries[entry] = cached[key]
+                missing.discard(entry)
+                if requested is not None:
+                    requested[entry] = cached[key]
+
+    if missing:
+        fetched = {entry: {} for entry in missing}
+        missing_query = {}
+        for (content_type_id, object_id, lang) in missing:
+            missing_query.setdefault(content_type_id, set()).add(object_id)
+        missing_langs = [x for x in langs if any(
+            entry[2] == x for entry in missing
+        )]
+        for translation in _get_translations(missing_query, missing_langs):
+            entry = (
+                translation.content_type_id,
+                translation.object_id,
+                translation.language,
+            )
+            if entry in fetched:
+                fetched[entry][translation.field] = translation.text
+        entries.update(fetched)
+        # the objects without translations are cached too
+        if cache is not None:
+            cache.set_many(
+                {
+                    _get_cache_key(*entry): fields
+                    for (entry, fields) in fetched.items()
+                },
+                timeout=getattr(
+                    settings, 'TRANSLATIONS_CACHE_TIMEOUT', DEFAULT_TIMEOUT
+                ),
+            )
+        if requested is not None:
+            requested.update(fetched)
+
+    # the languages with higher priorities are applied last
+    texts = {}
+    for (content_type_id, object_ids) in query.items():
+        for object_id in object_ids:
+            fields = {}
+            for lang in reversed(langs):
+                fields.update(entries[(content_type_id, object_id, lang)])
+            texts[(content_type_id, object_id)] = fields
+
+    return texts
+
+
+def _invalidate_entries(entries):
+    """
+    Invalidate the cached translations of some `(ct_id, object_id, lang)`.
+    """
+    entries = set(entries)
+    if not entries:
+        return
+
+    requested = _request_translations.get()
+    if requested is not None:
+        for entry in entries:
+            requested.pop(entry, None)
+
+    cache = _get_cache()
+    if cache is not None:
+        cache.delete_many([_get_cache_key(*entry) for entry in entries])
+
+
+def _invalidate_cached_translations(query, lang):
+    """Invalidate the cached translations of a query in a language."""
+    _invalidate_entries(
+        (content_type_id, object_id, lang)
+        for (content_type_id, object_ids) in query.items()
+        for object_id in object_ids
+    )
+
+
+def _invalidate_translations(objs):
+    """Invalidate the cached translations of some translations."""
+    _invalidate_entries(
+        (obj.content_type_id, str(obj.object_id), obj.language)
+        for obj in objs
+    )
+
+
+def _invalidate_translation(sender, instance, **kwargs):
+    """Invalidate the cached translations of a saved or deleted translation."""
+    _invalidate_translations([instance])
+
+
+def _update_cache_receivers(**kwargs):
+    """
+    Connect the invalidation receivers while the translations cache or the
+    request cache is enabled and disconnect them otherwise.
+    """
+    if kwargs.get('setting', 'TRANSLATIONS_CACHE') not in (
+        'TRANSLATIONS_CACHE',
+        'MIDDLEWARE',
+    ):
+        return
+
+    # the receivers stop the fast deletes, so they are only connected when
+    # they are needed
+    middleware = getattr(settings, 'MIDDLEWARE', None) or []
+    enabled = _get_cache() is not None or _MIDDLEWARE in middleware
+    for signal in (post_save, post_delete):
+        if not enabled:
+            signal.disconnect(
+                sender=translations.models.Translation,
+                dispatch_uid='translations_invalidate_translation',
+            )
+        else:
+            signal.connect(
+                _invalidate_translation,
+                sender=translations.models.Translation,
+                dispatch_uid='translations_invalidate_translation',
+            )
@@ -1,12 +1,17 @@
 """This module contains the context managers for the Translations app."""
 
-from django.db import models
+from asgiref.sync import sync_to_async
+
+from django.db import transaction, connections, router
 
 import translations.models
 from translations.languages import _get_default_language, \
-    _get_translate_language
+    _get_translate_language, _get_translation_languages, _get_language_chain
 from translations.utils import _get_relations_hierarchy, _get_purview, \
-    _get_translations
+    _get_entity_groups, _get_selected_fields, _get_translations, \
+    _get_translations_querysets, _get_batch_size, _get_object_id_int
+from translations.cache import _get_cache, _get_cached_translations, \
+    _invalidate_cached_translations, _request_translations
 
 
 __docformat__ = 'restructuredtext'
@@ -15,10 +20,41 @@ __docformat__ = 'restructuredtext'
 class Context:
     """A context manager which provides custom translation functionalities."""
 
-    def __init__(self, entity, *relations):
-        """Initialize a `Context` with an entity and some relations of it."""
+    def __init__(self, entity, *relations, fields=None, related_fields=None):
+        """
+        Initialize a `Context` with an entity, some relations of it and
+        optionally the fields to translate in them.
+        """
+        # the iterables (e.g. generators) are consumed only once
+        groups = _get_entity_groups(entity)
+        instances = [obj for objs in groups.values() for obj in objs]
+
         hierarchy = _get_relations_hierarchy(*relations)
-        self.mapping, self.query = _get_purview(entity, hierarchy)
+        self.mapping, self.query = _get_purview(
+            instances, hierarchy, fields, related_fields
+        )
+
+        # the names of the translatable fields to use in each content type
+        self.fields = {}
+        for (ct_id, objs) in self.mapping.items():
+            model = type(next(iter(objs.values())))
+            self.fields[ct_id] = frozenset(_get_selected_fields(
+                model, fields if model in groups else related_fields
+            ))
+
+    @classmethod
+    async def abuild(cls, entity, *relations, fields=None,
+                     related_fields=None):
+        """
+        Initialize a `Context` asynchronously, building its `purview` in
+        a thread.
+        """
+        return await sync_to_async(cls)(
+            entity,
+            *relations,
+            fields=fields,
+            related_fields=related_fields,
+        )
 
     def __enter__(self):
         return self
@@ -26,23 +62,70 @@ class Context:
     def __exit__(self, exc_type, exc_value, traceback):
         pass
 
+    def _get_objects(self):
+        r"""Yield the objects in the `Context`\ 's `purview`."""
+        for objs in self.mapping.values():
+            yield from objs.values()
+
+    def _discard_overlays(self, lang):
+        r"""
+        Discard the overlays of the `Context`\ 's `purview` in a language.
+        """
+        for obj in self._get_objects():
+            obj.__dict__.get('_trans_overlay', {}).pop(lang, None)
+
+    def _snapshot_fields(self):
+        r"""
+        Snapshot the translatable fields in the `Context`\ 's `purview` which
+        were loaded after it was initialized.
+        """
+        for (ct_id, objs) in self.mapping.items():
+            names = self.fields[ct_id]
+            for obj in objs.values():
+                values = obj.__dict__
+                defaults = values['_default_translatable_fields']
+                for field in names.difference(defaults):
+                    if field in values:
+                        defaults[field] = values[field]
+
+    def _get_loaded_fields(self):
+        r"""
+        Return the names of the selected and loaded translatable fields of
+        the content types in the `Context`\ 's `purview` which do not use
+        all of them.
+        """
+        fields = {}
+        for (ct_id, objs) in self.mapping.items():
+            names = self.fields[ct_id]
+            loaded = set()
+            for obj in objs.values():
+                loaded.update(names - obj.get_deferred_fields())
+            if loaded != type(obj)._get_translatable_fields_set():
+                fields[ct_id] = loaded
+        return fields
+
     def _get_changed_fields(self):
         r"""
         Yield the info about the changed fields in the `Context`\ 's `purview`.
         """
         for (ct_id, objs) in self.mapping.items():
+            names = self.fields[ct_id]
             for (obj_id, obj) in objs.items():
+                deferred = obj.get_deferred_fields()
                 for field in type(obj)._get_translatable_fields_names():
+                    if field not in names or field in deferred:
+                        continue
                     text = getattr(obj, field, None)
                     default = obj._default_translatable_fields.get(field, None)
                     if text and text != default:
                         yield ({
                             'content_type_id': ct_id,
                             'object_id': obj_id,
+                            'object_id_int': _get_object_id_int(obj_id),
                             'field': field,
                         }, text)
 
-    def create(self, lang=None):
+    def create(self, lang=None, batch_size=None):
         r"""
         Create the translations of the `Context`\ 's `purview` in a language.
         """
@@ -53,51 +136,248 @@ class Context:
                     language=lang, text=text, **address
                 ) for address, text in self._get_changed_fields()
             ]
-            translations.models.Translation.objects.bulk_create(_translations)
+            batch_size = _get_batch_size(
+                translations.models.Translation._meta.concrete_fields,
+                _translations,
+                batch_size,
+            )
+            # each batch is written on its own, so that the readers are not
+            # blocked, the written batches stay even if a later one fails
+            try:
+                for i in range(0, len(_translations), batch_size):
+                    translations.models.Translation.objects.bulk_create(
+                        _translations[i:i + batch_size]
+                    )
+            finally:
+                _invalidate_cached_translations(self.query, lang)
+                self._discard_overlays(lang)
 
     def read(self, lang=None):
         r"""
-        Read the translations of the `Context`\ 's `purview` in a language.
+        Read the translations of the `Context`\ 's `purview` in a language
+        and its fallbacks.
         """
         lang = _get_translate_language(lang)
+        self._snapshot_fields()
         if lang != _get_default_language():
-            _translations = _get_translations(self.query, lang)
-            for translation in _translations:
-                ct_id = translation.content_type.id
-                obj_id = translation.object_id
-                field = translation.field
-                text = translation.text
-                obj = self.mapping[ct_id][obj_id]
-                if field in type(obj)._get_translatable_fields_names():
-                    setattr(obj, field, text)
+            langs = _get_language_chain(lang)
+            cache = _get_cache()
+            if cache is None and _request_translations.get() is None:
+                # the languages with higher priorities are read last
+                _translations = sorted(
+                    _get_translations(
+                        self.query, langs, fields=self._get_loaded_fields()
+                    ),
+                    key=lambda x: langs.index(x.language),
+                    reverse=True,
+                )
+                for translation in _translations:
+                    ct_id = translation.content_type_id
+                    obj_id = translation.object_id
+                    field = translation.field
+                    text = translation.text
+                    obj = self.mapping[ct_id][obj_id]
+                    # the deferred fields are not in the instance's dict
+                    if field in self.fields[ct_id] and field in obj.__dict__:
+                        setattr(obj, field, text)
+            else:
+                texts = _get_cached_translations(cache, self.query, langs)
+                for ((ct_id, obj_id), fields) in texts.items():
+                    obj = self.mapping[ct_id][obj_id]
+                    names = self.fields[ct_id]
+                    for (field, text) in fields.items():
+                        if field in names and field in obj.__dict__:
+                            setattr(obj, field, text)
         else:
             self.reset()
 
-    def update(self, lang=None):
+    def read_many(self, langs=None):
+        r"""
+        Read the translations of the `Context`\ 's `purview` in some
+        languages at once and keep them as overlays.
+        """
+        if langs is None:
+            langs = _get_translation_languages()
+        default = _get_default_language()
+        langs = [
+            lang for lang in dict.fromkeys(
+                _get_translate_language(lang) for lang in langs
+            ) if lang != default
+        ]
+        if not langs:
+            return
+
+        self._snapshot_fields()
+        # the fields which are read without a translation are kept as `None`
+        for (ct_id, objs) in self.mapping.items():
+            names = self.fields[ct_id]
+            for obj in objs.values():
+                overlay = obj.__dict__.setdefault('_trans_overlay', {})
+                loaded = [field for field in names if field in obj.__dict__]
+                for lang in langs:
+                    texts = overlay.setdefault(lang, {})
+                    for field in loaded:
+                        texts[field] = None
+
+        for translation in _get_translations(
+            self.query, langs, fields=self._get_loaded_fields()
+        ):
+            ct_id = translation.content_type_id
+            obj_id = translation.object_id
+            field = translation.field
+            obj = self.mapping[ct_id][obj_id]
+            # the deferred fields are not in the instance's dict
+            if field in self.fields[ct_id] and field in obj.__dict__:
+                obj._trans_overlay[translation.language][field] = \
+                    translation.text
+
+    def switch(self, lang=None):
+        r"""
+        Switch the `Context`\ 's `purview` to a language and its fallbacks
+        using the overlays and reading the missing ones.
+        """
+        lang = _get_translate_language(lang)
+        self._snapshot_fields()
+        if lang == _get_default_language():
+            self.reset()
+            return
+
+        langs = _get_language_chain(lang)
+        if any(
+            field not in obj.__dict__.get('_trans_overlay', {}).get(x, {})
+            for (ct_id, objs) in self.mapping.items()
+            for obj in objs.values() for x in langs
+            for field in obj._default_translatable_fields
+            if field in self.fields[ct_id]
+        ):
+            self.read_many(langs)
+
+        for (ct_id, objs) in self.mapping.items():
+            names = self.fields[ct_id]
+            for obj in objs.values():
+                # the languages with higher priorities are applied last
+                texts = {}
+                for x in reversed(langs):
+                    texts.update(
+                        (field, text)
+                        for (field, text) in obj._trans_overlay[x].items()
+                        if text is not None
+                    )
+                for (field, value) in obj._default_translatable_fields.items():
+                    if field in names:
+                        setattr(obj, field, texts.get(field, value))
+
+    def update(self, lang=None, batch_size=None):
         r"""
         Update the translations of the `Context`\ 's `purview` in a language.
         """
         lang = _get_translate_language(lang)
         if lang != _get_default_language():
-            query = models.Q()
-            _translations = []
-            for address, text in self._get_changed_fields():
-                query |= models.Q(**address)
-                _translations.append(
-                    translations.models.Translation(
-                        language=lang, text=text, **address
+            _translations = [
+                translations.models.Translation(
+                    language=lang, text=text, **address
+                ) for address, text in self._get_changed_fields()
+            ]
+            if not _translations:
+                return
+
+            model = translations.models.Translation
+            connection = connections[router.db_for_write(model)]
+            features = connection.features
+            batch_size = _get_batch_size(
+                model._meta.concrete_fields,
+                _translations,
+                batch_size,
+            )
+
+            with transaction.atomic(using=connection.alias):
+                if getattr(
+                    features,
+                    'supports_update_conflicts_with_target',
+                    False,
+                ):
+                    model.objects.bulk_create(
+                        _translations,
+                        update_conflicts=True,
+                        unique_fields=[
+                            'content_type', 'object_id', 'field', 'language',
+                        ],
+                        update_fields=['text'],
+                        batch_size=batch_size,
                     )
-                )
-            _get_translations(query, lang).delete()
-            translations.models.Translation.objects.bulk_create(_translations)
+                elif getattr(features, 'supports_update_conflicts', False):
+                    model.objects.bulk_create(
+                        _translations,
+                        update_conflicts=True,
+                        update_fields=['text'],
+                        batch_size=batch_size,
+                    )
+                else:
+                    self._update_existing(_translations, lang, batch_size)
+            _invalidate_cached_translations(self.query, lang)
+            self._discard_overlays(lang)
+
+    def _update_existing(self, _translations, lang, batch_size):
+        """Update the existing translations and create the new ones."""
+        query = {}
+        for translation in _translations:
+            query.setdefault(
+                translation.content_type_id, set()
+            ).add(translation.object_id)
 
-    def delete(self, lang=None):
+        existing = {
+            (x.content_type_id, x.object_id, x.field): x.pk
+            for x in _get_translations(query, lang)
+        }
+
+        updates = []
+        creates = []
+        for translation in _translations:
+            pk = existing.get((
+                translation.content_type_id,
+                translation.object_id,
+                translation.field,
+            ))
+            if pk is None:
+                creates.append(translation)
+            else:
+                translation.pk = pk
+                updates.append(translation)
+
+        model = translations.models.Translation
+        if updates:
+            model.objects.bulk_update(updates, ['text'], batch_size=batch_size)
+        if creates:
+            model.objects.bulk_create(creates, batch_size=batch_size)
+
+    def delete(self, lang=None, batch_size=None):
         r"""
         Delete the translations of the `Context`\ 's `purview` in a language.
         """
         lang = _get_translate_language(lang)
         if lang != _get_default_language():
-            _get_translations(self.query, lang).delete()
+            object_ids = [
+                obj_id for objs in self.mapping.values() for obj_id in objs
+            ]
+            batch_size = _get_batch_size(
+                [translations.models.Translation._meta.get_field(
+                    'object_id'
+                )],
+                object_ids,
+                batch_size,
+            )
+            # each batch is deleted on its own, so that the readers are not
+            # blocked, the deleted batches stay even if a later one fails
+            try:
+                for queryset in _get_translations_querysets(
+                    self.query,
+                    lang,
+                    batch_size,
+                ):
+                    queryset.delete()
+            finally:
+                _invalidate_cached_translations(self.query, lang)
+                self._discard_overlays(lang)
 
     def reset(self):
         r"""
@@ -105,6 +385,36 @@ class Context:
         the `default language`.
         """
         for (ct_id, objs) in self.mapping.items():
+            names = self.fields[ct_id]
             for (obj_id, obj) in objs.items():
                 for (field, value) in obj._default_translatable_fields.items():
-                    setattr(obj, field, value)
+                    if field in names:
+                        setattr(obj, field, value)
+
+    async def acreate(self, lang=None, batch_size=None):
+        r"""
+        Create the translations of the `Context`\ 's `purview` in a language
+        asynchronously.
+        """
+        await sync_to_async(self.create)(lang, batch_size)
+
+    async def aread(self, lang=None):
+        r"""
+        Read the translations of the `Context`\ 's `purview` in a language
+        asynchronously.
+        """
+        await sync_to_async(self.read)(lang)
+
+    async def aupdate(self, lang=None, batch_size=None):
+        r"""
+        Update the translations of the `Context`\ 's `purview` in a language
+        asynchronously.
+        """
+        await sync_to_async(self.update)(lang, batch_size)
+
+    async def adelete(self, lang=None, batch_size=None):
+        r"""
+        Delete the translations of the `Context`\ 's `purview` in a language
+        asynchronously.
+        """
+        await sync_to_async(self.delete)(lang, batch_size)
@@ -1,5 +1,8 @@
 """This module contains the languages for the Translations app."""
 
+import functools
+import types
+
 from django.utils.translation import get_language
 from django.conf import settings
 
@@ -7,7 +10,8 @@ from django.conf import settings
 __docformat__ = 'restructuredtext'
 
 
-_supported_code = {}
+_languages_table = None
+_default_code = None
 
 _all_codes = None
 _all_choices = None
@@ -16,37 +20,76 @@ _translation_codes = {}
 _translation_choices = {}
 
 
+def _get_languages_table():
+    """Return the resolution table of the `supported language` codes."""
+    global _languages_table
+    if _languages_table is None:
+        table = {}
+        for (code, name) in settings.LANGUAGES:
+            # the lowercase and underscore variants resolve to the code too
+            for variant in (
+                code.lower().replace('_', '-'),
+                code.lower().replace('-', '_'),
+                code,
+            ):
+                table[variant] = code
+        _languages_table = types.MappingProxyType(table)
+    return _languages_table
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_language(lang):
+    """
+    Return the `supported language` code of a custom language code which is
+    not in the resolution table or `None` if it is not supported.
+    """
+    table = _get_languages_table()
+    normalized = lang.lower().replace('_', '-')
+    if normalized in table:
+        return table[normalized]
+    return table.get(normalized.split('-')[0])
+
+
 def _get_supported_language(lang):
     """Return the `supported language` code of a custom language code."""
-    if lang not in _supported_code:
-        code = lang.split('-')[0]
-
-        lang_exists = False
-        code_exists = False
-
-        # break when the lang is found but not when the code is found
-        # cause the code might come before lang and we may miss an accent
-        for choice in settings.LANGUAGES:
-            if lang == choice[0]:
-                lang_exists = True
-                break
-            if code == choice[0]:
-                code_exists = True
-
-        if lang_exists:
-            _supported_code[lang] = lang
-        elif code_exists:
-            _supported_code[lang] = code
-        else:
-            raise ValueError(
-                '`{}` is not a supported language.'.format(lang)
-            )
-    return _supported_code[lang]
+    table = _languages_table
+    if table is None:
+        table = _get_languages_table()
+    try:
+        return table[lang]
+    except KeyError:
+        pass
+    code = _resolve_language(lang)
+    if code is None:
+        raise ValueError(
+            '`{}` is not a supported language.'.format(lang)
+        )
+    return code
 
 
 def _get_default_language():
     """Return the `supported language` code of the `default language` code."""
-    return _get_supported_language(settings.LANGUAGE_CODE)
+    global _default_code
+    if _default_code is None:
+        _default_code = _get_supported_language(settings.LANGUAGE_CODE)
+    return _default_code
+
+
+def _clear_languages_caches(**kwargs):
+    """
+    Clear the cached language codes when the languages settings change.
+    """
+    global _languages_table, _default_code, _all_codes, _all_choices
+    if kwargs.get('setting') not in ('LANGUAGES', 'LANGUAGE_CODE'):
+        return
+
+    _languages_table = None
+    _default_code = None
+    _all_codes = None
+    _all_choices = None
+    _translation_codes.clear()
+    _translation_choices.clear()
+    _resolve_language.cache_clear()
 
 
 def _get_active_language():
@@ -98,6 +141,26 @@ def _get_translate_language(lang=None):
         return _get_supported_language(lang)
 
 
+def _get_language_chain(lang):
+    """
+    Return the `supported language` codes to read a `supported language`
+    code in, ordered by priority and without the `default language` code.
+    """
+    # the fallbacks are opt-in
+    fallbacks = getattr(settings, 'TRANSLATIONS_FALLBACKS', None)
+    if fallbacks is True:
+        # fall back to the language without the region
+        code = lang.split('-')[0]
+        chain = [code] if code != lang and code in _get_all_languages() else []
+    elif fallbacks:
+        chain = [_get_supported_language(x) for x in fallbacks.get(lang, [])]
+    else:
+        chain = []
+
+    default = _get_default_language()
+    return [x for x in dict.fromkeys([lang, *chain]) if x != default]
+
+
 def _get_probe_language(lang=None):
     """
     Return the `supported language` code(s) of some probe language code(s).
@@ -96,11 +96,14 @@ class Command(BaseCommand):
             if obsolete_translations:
                 changes = {}
                 for translation in obsolete_translations:
-                    app = apps.get_app_config(
-                        translation.content_type.app_label
+                    # the content types are cached instead of fetched per
+                    # translation
+                    content_type = ContentType.objects.get_for_id(
+                        translation.content_type_id
                     )
+                    app = apps.get_app_config(content_type.app_label)
                     app_name = app.name
-                    model = translation.content_type.model_class()
+                    model = content_type.model_class()
                     model_name = model.__name__
 
                     changes.setdefault(app_name, {})
@@ -0,0 +1,36 @@
+"""
+This module contains the warm_translations_cache command for the Translations
+app.
+"""
+
+from django.core.management.base import BaseCommand
+
+from translations.languages import _get_languages_table
+from translations.utils import _warm_content_type_ids
+
+
+__docformat__ = 'restructuredtext'
+
+
+class Command(BaseCommand):
+    """
+    The command which warms the caches of the Translations app in
+    the current process.
+    """
+
+    help = (
+        'Warm the content types of the translatable models and the languages '
+        'in the current process (e.g. before forking the workers).'
+    )
+
+    def handle(self, *args, **options):
+        """Run the `Command` with the configured arguments."""
+        count = _warm_content_type_ids()
+        _get_languages_table()
+
+        if options['verbosity'] >= 1:
+            self.stdout.write(
+                'Warmed the content types of {} translatable model(s).'.format(
+                    count
+                )
+            )
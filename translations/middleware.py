@@ -0,0 +1,55 @@
+"""This module contains the middleware for the Translations app."""
+
+import asyncio
+
+try:
+    from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+except ImportError:
+    from asyncio import iscoroutinefunction
+
+    def markcoroutinefunction(func):
+        func._is_coroutine = asyncio.coroutines._is_coroutine
+        return func
+
+from translations.cache import _request_translations
+
+
+__docformat__ = 'restructuredtext'
+
+
+class TranslationCacheMiddleware:
+    """
+    A middleware which caches the translations read in a request until the
+    request ends.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        """Initialize a `TranslationCacheMiddleware` with a response getter."""
+        self.get_response = get_response
+        # the async requests are handled without a thread
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        """Return the response of a request using a new request cache."""
+        if iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+
+        token = _request_translations.set({})
+        try:
+            return self.get_response(request)
+        finally:
+            _request_translations.reset(token)
+
+    async def __acall__(self, request):
+        """
+        Return the response of an async request using a new request cache.
+        """
+        token = _request_translations.set({})
+        try:
+            return await self.get_response(request)
+        finally:
+            _request_translations.reset(token)
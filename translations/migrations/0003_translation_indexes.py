@@ -0,0 +1,22 @@
+# Generated by Django 4.0.10 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('translations', '0002_auto_20180920_1245'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='translation',
+            index=models.Index(fields=['language', 'content_type', 'object_id'], name='translations_lang_ct_obj_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='translation',
+            index=models.Index(fields=['content_type', 'field', 'language'], name='translations_ct_field_lang_idx'),
+        ),
+    ]
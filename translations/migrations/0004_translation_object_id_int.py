@@ -0,0 +1,35 @@
+# Generated by Django 4.0.10 on 2026-10-18 20:40
+
+from django.db import migrations, models
+from django.db.models.functions import Cast
+
+
+def fill_object_id_int(apps, schema_editor):
+    """Fill the integer object ids of the existing translations."""
+    Translation = apps.get_model('translations', 'Translation')
+    Translation.objects.using(schema_editor.connection.alias).filter(
+        # only the canonical forms which fit in a big integer column
+        object_id__regex=r'^(0|-?[1-9][0-9]{0,17})$',
+    ).update(
+        object_id_int=Cast('object_id', output_field=models.BigIntegerField()),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('translations', '0003_translation_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='translation',
+            name='object_id_int',
+            field=models.BigIntegerField(blank=True, editable=False, help_text='the id of the object to translate as an integer', null=True, verbose_name='object id (integer)'),
+        ),
+        migrations.AddIndex(
+            model_name='translation',
+            index=models.Index(fields=['content_type', 'object_id_int'], name='translations_ct_obj_int_idx'),
+        ),
+        migrations.RunPython(fill_object_id_int, migrations.RunPython.noop),
+    ]
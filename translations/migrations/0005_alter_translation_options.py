@@ -0,0 +1,17 @@
+# Generated by Django 4.0.10 on 2026-10-18 21:48
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('translations', '0004_translation_object_id_int'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='translation',
+            options={'base_manager_name': 'objects', 'verbose_name': 'translation', 'verbose_name_plural': 'translations'},
+        ),
+    ]
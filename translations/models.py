@@ -1,8 +1,10 @@
 """This module contains the models for the Translations app."""
 
-from django.db import models
+from django.db import models, transaction
+from django.db.models.signals import class_prepared, pre_save
 from django.db.models.functions import Cast
 from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.contenttypes.fields import GenericForeignKey, \
     GenericRelation
@@ -12,11 +14,91 @@ except ImportError:
     from django.utils.translation import gettext_lazy as _
 
 from translations.querysets import TranslatableQuerySet
+from translations.context import Context
+from translations.utils import _is_integer_field, _get_object_id_int, \
+    _get_content_type_id
+from translations.cache import _is_caching, _invalidate_entries, \
+    _invalidate_translations
 
 
 __docformat__ = 'restructuredtext'
 
 
+# the fields which tell the cached translations of a translation apart
+_ADDRESS_FIELDS = {'content_type', 'content_type_id', 'object_id', 'language'}
+
+
+class _TranslationQuerySet(models.QuerySet):
+    """
+    Keep the integer object ids and the cache of the translations written
+    in bulk.
+    """
+
+    def bulk_create(self, objs, *args, **kwargs):
+        """Create the translations along with their integer object ids."""
+        objs = list(objs)
+        for obj in objs:
+            obj.object_id_int = _get_object_id_int(obj.object_id)
+        objs = super(_TranslationQuerySet, self).bulk_create(
+            objs, *args, **kwargs
+        )
+        if _is_caching():
+            _invalidate_translations(objs)
+        return objs
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        """Update the translations along with their integer object ids."""
+        # the cache is invalidated by `update`
+        objs = list(objs)
+        if 'object_id' in fields and 'object_id_int' not in fields:
+            for obj in objs:
+                obj.object_id_int = _get_object_id_int(obj.object_id)
+            fields = [*fields, 'object_id_int']
+        return super(_TranslationQuerySet, self).bulk_update(
+            objs, fields, *args, **kwargs
+        )
+
+    def update(self, **kwargs):
+        """Update the translations along with their integer object ids."""
+        if 'object_id' in kwargs and 'object_id_int' not in kwargs and \
+                not hasattr(kwargs['object_id'], 'resolve_expression'):
+            kwargs['object_id_int'] = _get_object_id_int(kwargs['object_id'])
+
+        # the values of the expressions are only known after the update
+        refill = 'object_id' in kwargs and 'object_id_int' not in kwargs
+        caching = _is_caching()
+        if not (refill or caching):
+            return super(_TranslationQuerySet, self).update(**kwargs)
+
+        address = ('pk', 'content_type_id', 'object_id', 'language')
+        manager = self.model._base_manager.db_manager(self.db)
+        with transaction.atomic(using=self.db, savepoint=False):
+            old = list(self.values_list(*address))
+            rows = super(_TranslationQuerySet, self).update(**kwargs)
+            new = []
+            if refill or _ADDRESS_FIELDS.intersection(kwargs):
+                new = list(manager.filter(
+                    pk__in=[row[0] for row in old]
+                ).values_list(*address))
+            if refill:
+                manager.bulk_update(
+                    [
+                        self.model(
+                            pk=row[0],
+                            object_id_int=_get_object_id_int(row[2]),
+                        )
+                        for row in new
+                    ],
+                    ['object_id_int'],
+                )
+
+        if caching:
+            _invalidate_entries(
+                (row[1], str(row[2]), row[3]) for row in old + new
+            )
+        return rows
+
+
 class Translation(models.Model):
     """The model which represents the translations."""
 
@@ -31,6 +113,13 @@ class Translation(models.Model):
         help_text=_('the id of the object to translate'),
         max_length=128,
     )
+    object_id_int = models.BigIntegerField(
+        verbose_name=_('object id (integer)'),
+        help_text=_('the id of the object to translate as an integer'),
+        null=True,
+        blank=True,
+        editable=False,
+    )
     content_object = GenericForeignKey(
         ct_field='content_type',
         fk_field='object_id',
@@ -51,6 +140,8 @@ class Translation(models.Model):
         help_text=_('the text of the translation'),
     )
 
+    objects = _TranslationQuerySet.as_manager()
+
     def __str__(self):
         """Return the representation of the translation."""
         return '{source}: {translation}'.format(
@@ -58,14 +149,62 @@ class Translation(models.Model):
             translation=self.text,
         )
 
+    def save(self, *args, **kwargs):
+        """Save the translation along with its integer object id."""
+        # the integer object id is filled by `_fill_object_id_int`
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'object_id' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'object_id_int'}
+        super(Translation, self).save(*args, **kwargs)
+
     class Meta:
+        # the generic relations update the translations using it
+        base_manager_name = 'objects'
         unique_together = ('content_type', 'object_id', 'field', 'language',)
+        indexes = [
+            # reading the translations of some objects in a language
+            models.Index(
+                fields=['language', 'content_type', 'object_id'],
+                name='translations_lang_ct_obj_idx',
+            ),
+            # filtering the objects by their translations
+            models.Index(
+                fields=['content_type', 'field', 'language'],
+                name='translations_ct_field_lang_idx',
+            ),
+            # joining the objects with integer primary keys
+            models.Index(
+                fields=['content_type', 'object_id_int'],
+                name='translations_ct_obj_int_idx',
+            ),
+        ]
         verbose_name = _('translation')
         verbose_name_plural = _('translations')
 
 
 class _CustomGenericRelation(GenericRelation):
-    "Add the Cast needed by PostgreSQL"
+    """
+    Join on the integer object id for integer primary keys and add the Cast
+    needed by PostgreSQL for the other mismatching ones.
+    """
+
+    def _get_joining_fields(self, lhs_field, rhs_field):
+        """Return the pair of fields to join a pair of related fields on."""
+        opts = self.remote_field.model._meta
+        object_id_field = opts.get_field(self.object_id_field_name)
+        object_id_int_field = opts.get_field('object_id_int')
+        if lhs_field is object_id_field and _is_integer_field(rhs_field):
+            return object_id_int_field, rhs_field
+        if rhs_field is object_id_field and _is_integer_field(lhs_field):
+            return lhs_field, object_id_int_field
+        return lhs_field, rhs_field
+
+    def _needs_cast(self, lhs_field, rhs_field):
+        """Return whether a pair of joining fields needs casting."""
+        return not (
+            lhs_field.get_internal_type() == rhs_field.get_internal_type() or
+            (_is_integer_field(lhs_field) and _is_integer_field(rhs_field))
+        )
 
     def get_joining_columns(self, reverse_join: bool = False):
         # Sort out whether these columns need casting.
@@ -73,7 +212,10 @@ class _CustomGenericRelation(GenericRelation):
                   else self.related_fields)
         columns = []
         for lhs_field, rhs_field in source:
-            if lhs_field.get_internal_type() == rhs_field.get_internal_type():
+            lhs_field, rhs_field = self._get_joining_fields(
+                lhs_field, rhs_field
+            )
+            if not self._needs_cast(lhs_field, rhs_field):
                 columns.append((lhs_field.column, rhs_field.column))
             # If the internal types do not match, they will be added in
             # get_extra_restriction.
@@ -83,7 +225,10 @@ class _CustomGenericRelation(GenericRelation):
         condition = super().get_extra_restriction(alias, remote_alias)
 
         for lhs_field, rhs_field in self.reverse_related_fields:
-            if lhs_field.get_internal_type() != rhs_field.get_internal_type():
+            lhs_field, rhs_field = self._get_joining_fields(
+                lhs_field, rhs_field
+            )
+            if self._needs_cast(lhs_field, rhs_field):
                 assert alias is not None
                 lookup = lhs_field.get_lookup("exact")(
                     Cast(lhs_field.get_col(alias),
@@ -115,40 +260,72 @@ class Translatable(models.Model):
 
         fields = None
 
+    def __getstate__(self):
+        """Return the state of the instance without its deferred batch."""
+        batch = self.__dict__.get('_trans_batch')
+        if batch is not None and batch.pending:
+            batch.translate()
+        state = super(Translatable, self).__getstate__()
+        state.pop('_trans_batch', None)
+        return state
+
+    @classmethod
+    def _prepare_translatable_fields(cls):
+        """Compute the metadata of the model's translatable fields."""
+        if cls.TranslatableMeta.fields is None:
+            fields = []
+            # only the forward fields, the reverse ones may not be ready yet
+            for field in cls._meta.fields:
+                if isinstance(
+                            field,
+                            (models.CharField, models.TextField,)
+                        ) and not isinstance(
+                            field,
+                            models.EmailField
+                        ) and not (
+                            hasattr(field, 'choices') and field.choices
+                        ):
+                    fields.append(field)
+        else:
+            fields = [
+                cls._meta.get_field(field_name)
+                for field_name in cls.TranslatableMeta.fields
+            ]
+        names = [field.name for field in fields]
+        # stored in the class itself, so that the subclasses do not share it
+        cls._cached_translatable_fields = fields
+        cls._cached_translatable_fields_names = names
+        cls._cached_translatable_fields_set = frozenset(names)
+
     @classmethod
     def get_translatable_fields(cls):
         """Return the model’s translatable fields."""
-        if not hasattr(cls, '_cached_translatable_fields'):
-            if cls.TranslatableMeta.fields is None:
-                fields = []
-                for field in cls._meta.get_fields():
-                    if isinstance(
-                                field,
-                                (models.CharField, models.TextField,)
-                            ) and not isinstance(
-                                field,
-                                models.EmailField
-                            ) and not (
-                                hasattr(field, 'choices') and field.choices
-                            ):
-                        fields.append(field)
-            else:
-                fields = [
-                    cls._meta.get_field(field_name)
-                    for field_name in cls.TranslatableMeta.fields
-                ]
-            cls._cached_translatable_fields = fields
+        if '_cached_translatable_fields' not in cls.__dict__:
+            cls._prepare_translatable_fields()
         return cls._cached_translatable_fields
 
     @classmethod
     def _get_translatable_fields_names(cls):
         """Return the names of the model's translatable fields."""
-        if not hasattr(cls, '_cached_translatable_fields_names'):
-            cls._cached_translatable_fields_names = [
-                field.name for field in cls.get_translatable_fields()
-            ]
+        if '_cached_translatable_fields' not in cls.__dict__:
+            cls._prepare_translatable_fields()
         return cls._cached_translatable_fields_names
 
+    @classmethod
+    def _get_translatable_fields_set(cls):
+        """Return the set of the names of the model's translatable fields."""
+        if '_cached_translatable_fields' not in cls.__dict__:
+            cls._prepare_translatable_fields()
+        return cls._cached_translatable_fields_set
+
+    @classmethod
+    def _get_content_type_id(cls):
+        """Return the model's content type id."""
+        # not inherited, the subclasses have their own content types
+        if '_cached_content_type_id' not in cls.__dict__:
+            cls._cached_content_type_id = _get_content_type_id(cls)
+        return cls._cached_content_type_id
+
     @classmethod
     def _get_translatable_fields_choices(cls):
         """Return the choices of the model's translatable fields."""
@@ -161,3 +338,44 @@ class Translatable(models.Model):
             choices.append(choice)
 
         return choices
+
+    def translated(self, lang=None):
+        """Switch the instance to a language using its overlays."""
+        with Context(self) as context:
+            context.switch(lang)
+        return self
+
+
+def _prepare_translatable(sender, **kwargs):
+    """
+    Compute the translatable fields of a translatable model once it is
+    prepared.
+    """
+    if issubclass(sender, Translatable):
+        try:
+            sender._prepare_translatable_fields()
+        except FieldDoesNotExist:
+            # the misconfigured fields raise on the first use instead
+            pass
+
+
+# the models are prepared before the app is ready
+class_prepared.connect(
+    _prepare_translatable,
+    dispatch_uid='translations_prepare_translatable',
+)
+
+
+def _fill_object_id_int(sender, instance, **kwargs):
+    """
+    Fill the integer object id of a translation before it is saved, even
+    by the raw saves of the fixtures.
+    """
+    instance.object_id_int = _get_object_id_int(instance.object_id)
+
+
+pre_save.connect(
+    _fill_object_id_int,
+    sender=Translation,
+    dispatch_uid='translations_fill_object_id_int',
+)
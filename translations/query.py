@@ -1,12 +1,14 @@
 """This module contains the query utilities for the Translations app."""
 
 import copy
+import functools
 
-from django.db.models import Q
+from django.db.models import Q, F, Exists, OuterRef, Subquery
 from django.db.models.constants import LOOKUP_SEP
 
+import translations.models
 from translations.languages import _get_default_language, _get_probe_language
-from translations.utils import _get_dissected_lookup
+from translations.utils import _dissect_lookup, _get_object_id_filter
 
 
 __docformat__ = 'restructuredtext'
@@ -17,7 +19,50 @@ def _fetch_translations_query_getter(model, lang):
     Return the translations query getter specialized for a model and some
     language(s).
     """
-    default = _get_default_language()
+    if isinstance(lang, list):
+        lang = tuple(lang)
+    return _get_translations_query_getter(model, lang, _get_default_language())
+
+
+@functools.lru_cache(maxsize=256)
+def _get_translations_query_getter(model, lang, default):
+    """
+    Build the translations query getter, caching it per model, language(s)
+    and default language.
+    """
+    if isinstance(lang, tuple):
+        query_default = default in lang
+        query_languages = [x for x in lang if x != default]
+        lang_supp = LOOKUP_SEP + 'in'
+    else:
+        query_default = lang == default
+        query_languages = None if query_default else lang
+        lang_supp = ''
+
+    @functools.lru_cache(maxsize=128)
+    def _get_translations_queryset(lookup):
+        """
+        Return the queryset of a translatable lookup's translations and
+        the lookup of their text.
+        """
+        dissected = _dissect_lookup(model, lookup)
+        relation = dissected['relation']
+        related_model = model
+        for part in relation:
+            related_model = related_model._meta.get_field(part).related_model
+        field_supp = (LOOKUP_SEP + dissected['supplement']) \
+            if dissected['supplement'] else ''
+
+        queryset = translations.models.Translation.objects.filter(
+            content_type_id=related_model._get_content_type_id(),
+            field=dissected['field'],
+            **{'language{}'.format(lang_supp): query_languages},
+            **_get_object_id_filter(
+                related_model,
+                OuterRef(LOOKUP_SEP.join(relation + ['pk']))
+            )
+        )
+        return (queryset, 'text{}'.format(field_supp))
 
     def _get_translations_query(*args, **kwargs):
         connector = kwargs.pop('_connector', None)
@@ -27,47 +72,24 @@ def _fetch_translations_query_getter(model, lang):
 
         for index, child in enumerate(children):
             if isinstance(child, tuple):
-                dissected = _get_dissected_lookup(model, child[0])
+                dissected = _dissect_lookup(model, child[0])
                 if dissected['translatable']:
-                    query_default = False
-                    query_languages = None
-                    if isinstance(lang, (list, tuple)):
-                        query_languages = []
-                        for x in lang:
-                            if x == default:
-                                query_default = True
-                            else:
-                                query_languages.append(x)
-                    else:
-                        if lang == default:
-                            query_default = True
-                            query_languages = None
-                        else:
-                            query_default = False
-                            query_languages = lang
-
                     q = Q()
 
                     if query_default:
                         q |= Q(**{child[0]: child[1]})
 
                     if query_languages:
-                        relation = LOOKUP_SEP.join(
-                            dissected['relation'] + ['translations'])
-                        field_supp = (LOOKUP_SEP + dissected['supplement']) \
-                            if dissected['supplement'] else ''
-                        lang_supp = (LOOKUP_SEP + 'in') \
-                            if isinstance(query_languages, (list, tuple)) \
-                            else ''
-
-                        q |= Q(**{
-                            '{}__field'.format(relation):
-                                dissected['field'],
-                            '{}__text{}'.format(relation, field_supp):
-                                child[1],
-                            '{}__language{}'.format(relation, lang_supp):
-                                query_languages
-                        })
+                        (queryset, text_lookup) = _get_translations_queryset(
+                            child[0]
+                        )
+                        # a semi-join per lookup, so that the lookups match
+                        # their own translations and rows are not multiplied
+                        q |= Q(Exists(
+                            queryset.filter(**{
+                                text_lookup: _get_outer_expression(child[1])
+                            })
+                        ))
                 else:
                     q = Q(**{child[0]: child[1]})
             elif isinstance(child, TQ):
@@ -93,6 +115,8 @@ def _fetch_translations_query_getter(model, lang):
                     _connector=child.connector,
                     _negated=child.negated
                 )
+            else:
+                q = child
             children[index] = q
 
         query = Q(*children, _connector=connector, _negated=negated)
@@ -102,6 +126,34 @@ def _fetch_translations_query_getter(model, lang):
     return _get_translations_query
 
 
+def _get_outer_expression(value):
+    """
+    Return a lookup value which refers to the queryset's model from inside
+    the translations subquery.
+    """
+    if isinstance(value, F):
+        if isinstance(value, OuterRef):
+            return OuterRef(value)
+        return OuterRef(value.name)
+    # the subqueries resolve their own references
+    if not hasattr(value, 'get_source_expressions') or \
+            isinstance(value, Subquery):
+        return value
+    value = value.copy()
+    value.set_source_expressions([
+        _get_outer_expression(expression)
+        for expression in value.get_source_expressions()
+    ])
+    return value
+
+
+def _clear_query_caches(**kwargs):
+    """Clear the cached lookups and getters when the models change."""
+    if kwargs.get('setting', 'INSTALLED_APPS') == 'INSTALLED_APPS':
+        _dissect_lookup.cache_clear()
+        _get_translations_query_getter.cache_clear()
+
+
 class TQ(Q):
     """
     Encapsulate translation queries as objects that can then be combined
@@ -1,11 +1,22 @@
 """This module contains the querysets for the Translations app."""
 
-from django.db.models import query
+import itertools
+
+from asgiref.sync import sync_to_async
+
+from django.db.models import query, F
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.utils import create_namedtuple_class
 
 from translations.languages import _get_default_language, \
-    _get_translate_language, _get_probe_language
+    _get_translate_language, _get_probe_language, \
+    _get_translation_languages, _get_language_chain
 from translations.query import _fetch_translations_query_getter
+from translations.utils import _get_relations_lookups, \
+    _get_translations_annotations, _get_translation_alias, \
+    _get_translations, _get_selected_fields
 from translations.context import Context
+from translations.batch import _TranslationBatch
 
 
 __docformat__ = 'restructuredtext'
@@ -17,9 +28,15 @@ class TranslatableQuerySet(query.QuerySet):
     def __init__(self, *args, **kwargs):
         """Initialize a `TranslatableQuerySet` with `QuerySet` arguments."""
         super(TranslatableQuerySet, self).__init__(*args, **kwargs)
-        self._trans_lang = _get_default_language()
-        self._trans_prob = _get_default_language()
+        default = _get_default_language()
+        self._trans_lang = default
+        self._trans_prob = default
         self._trans_rels = ()
+        self._trans_fields = None
+        self._trans_rels_fields = None
+        self._trans_langs = ()
+        self._trans_strategy = 'python'
+        self._trans_aliases = ()
         self._trans_cache = False
 
     def _chain(self, **kwargs):
@@ -30,6 +47,11 @@ class TranslatableQuerySet(query.QuerySet):
         clone._trans_lang = getattr(self, '_trans_lang')
         clone._trans_prob = getattr(self, '_trans_prob')
         clone._trans_rels = getattr(self, '_trans_rels')
+        clone._trans_fields = getattr(self, '_trans_fields')
+        clone._trans_rels_fields = getattr(self, '_trans_rels_fields')
+        clone._trans_langs = getattr(self, '_trans_langs')
+        clone._trans_strategy = getattr(self, '_trans_strategy')
+        clone._trans_aliases = getattr(self, '_trans_aliases')
 
         # reset cache on chaining
         clone._trans_cache = False
@@ -38,34 +60,388 @@ class TranslatableQuerySet(query.QuerySet):
 
     def _fetch_all(self):
         """Evaluate the `TranslatableQuerySet`."""
+        if self._result_cache is None and self._translates_values():
+            self._result_cache = list(self._translated_values())
+            self._trans_cache = True
+
+        if self._result_cache is None and self._translates_instances():
+            self._plan_relations()
+
         super(TranslatableQuerySet, self)._fetch_all()
 
-        if self._trans_lang == _get_default_language():
+        if not self._translates_instances():
             return
 
+        if not self._trans_cache:
+            self._translate_instances(self._result_cache)
+            self._trans_cache = True
+
+    def _translates_instances(self):
+        """
+        Return whether the `TranslatableQuerySet` instances must be
+        translated.
+        """
+        return self._iterable_class is query.ModelIterable and not (
+            self._trans_lang == _get_default_language() and
+            not self._trans_langs
+        )
+
+    def _plan_relations(self):
+        """
+        Plan fetching the translated relations along with the
+        `TranslatableQuerySet`.
+        """
+        # planned on evaluation, when the deferred fields are final
+        if not self._trans_rels:
+            return
+
+        select_lookups, prefetch_lookups = _get_relations_lookups(
+            self.model,
+            *self._trans_rels,
+            deferred_loading=self.query.deferred_loading
+        )
+
+        if select_lookups and self.query.select_related is not True:
+            self.query.add_select_related(select_lookups)
+
+        prefetched = set()
+        for lookup in self._prefetch_related_lookups:
+            lookup = getattr(lookup, 'prefetch_to', lookup)
+            parts = lookup.split(LOOKUP_SEP)
+            for index in range(len(parts)):
+                prefetched.add(LOOKUP_SEP.join(parts[:index + 1]))
+        prefetch_lookups = tuple(
+            lookup for lookup in prefetch_lookups
+            if lookup not in prefetched
+        )
+
+        if prefetch_lookups:
+            self._prefetch_related_lookups += prefetch_lookups
+
+    def _translate_instances(self, instances):
+        """Translate some instances of the `TranslatableQuerySet`."""
+        fields = {
+            'fields': self._trans_fields,
+            'related_fields': self._trans_rels_fields,
+        }
+
+        if self._trans_langs:
+            with Context(instances, *self._trans_rels, **fields) as context:
+                context.read_many((
+                    *self._trans_langs,
+                    *_get_language_chain(self._trans_lang),
+                ))
+                if self._trans_lang != _get_default_language():
+                    context.switch(self._trans_lang)
+            return
+
+        if self._trans_strategy == 'lazy':
+            if instances:
+                _TranslationBatch(
+                    instances, self._trans_lang, *self._trans_rels, **fields
+                )
+            return
+
+        if self._trans_strategy == 'sql':
+            names = _get_selected_fields(self.model, self._trans_fields)
+            for obj in instances:
+                # the deferred fields are not in the instance's dict
+                loaded = [field for field in names if field in obj.__dict__]
+                if not hasattr(obj, '_default_translatable_fields'):
+                    obj._default_translatable_fields = {
+                        field: getattr(obj, field) for field in loaded
+                    }
+                for field in loaded:
+                    alias = _get_translation_alias(field)
+                    if alias in obj.__dict__:
+                        setattr(obj, field, getattr(obj, alias))
+
+            if not self._trans_rels:
+                return
+
+        with Context(instances, *self._trans_rels, **fields) as context:
+            context.read(self._trans_lang)
+
+    def iterator(self, chunk_size=None):
+        """Iterate the `TranslatableQuerySet` translating it in chunks."""
+        if self._trans_lang == _get_default_language() and (
+            not self._trans_langs or
+            self._iterable_class is not query.ModelIterable
+        ):
+            if chunk_size is None:
+                return super(TranslatableQuerySet, self).iterator()
+            return super(TranslatableQuerySet, self).iterator(
+                chunk_size=chunk_size
+            )
+
+        if chunk_size is None:
+            chunk_size = 2000  # same as Django's
+
         if self._iterable_class is not query.ModelIterable:
-            raise TypeError(
-                'Translations does not support custom iteration (yet). ' +
-                'e.g. values, values_list, etc. ' +
-                'If necessary you can `decipher` and then do it.'
+            return self._translated_values(chunk_size)
+
+        self._plan_relations()
+        return self._translated_iterator(
+            super(TranslatableQuerySet, self).iterator(chunk_size=chunk_size),
+            chunk_size,
+        )
+
+    def _translated_iterator(self, iterable, chunk_size):
+        """Yield the instances of an iterable translated in chunks."""
+        iterable = iter(iterable)
+        while True:
+            chunk = list(itertools.islice(iterable, chunk_size))
+            if not chunk:
+                break
+            self._translate_instances(chunk)
+            yield from chunk
+
+    def __aiter__(self):
+        """Iterate the `TranslatableQuerySet` asynchronously translating it."""
+        # fetch and translate the results in one thread switch
+        async def generator():
+            await sync_to_async(self._fetch_all)()
+            for item in self._result_cache:
+                yield item
+
+        return generator()
+
+    async def aiterator(self, chunk_size=2000):
+        """
+        Iterate the `TranslatableQuerySet` asynchronously translating it in
+        chunks.
+        """
+        iterable = self.iterator(chunk_size=chunk_size)
+        # fetch and translate each chunk in one thread switch
+        fetch = sync_to_async(
+            lambda: list(itertools.islice(iterable, chunk_size))
+        )
+        while True:
+            chunk = await fetch()
+            if not chunk:
+                break
+            for item in chunk:
+                yield item
+
+    async def aget(self, *args, **kwargs):
+        """Get an object of the `TranslatableQuerySet` asynchronously."""
+        return await sync_to_async(self.get)(*args, **kwargs)
+
+    async def afirst(self):
+        """
+        Return the first object of the `TranslatableQuerySet` asynchronously.
+        """
+        return await sync_to_async(self.first)()
+
+    async def alast(self):
+        """
+        Return the last object of the `TranslatableQuerySet` asynchronously.
+        """
+        return await sync_to_async(self.last)()
+
+    def _translates_values(self):
+        """
+        Return whether the `TranslatableQuerySet` rows must be translated
+        without instantiating the model.
+        """
+        return (
+            self._iterable_class is not query.ModelIterable and
+            self._trans_lang != _get_default_language()
+        )
+
+    def _translated_values(self, chunk_size=None):
+        """
+        Yield the rows of a `values` or `values_list` `TranslatableQuerySet`
+        translated in chunks.
+        """
+        sql = self.query
+        iterable_class = self._iterable_class
+        dicts = iterable_class is query.ValuesIterable
+
+        # the names of the columns in the order of the rows
+        if self._fields and not dicts:
+            names = [
+                *self._fields,
+                *(x for x in sql.annotation_select if x not in self._fields),
+            ]
+        else:
+            names = [
+                *sql.extra_select,
+                *sql.values_select,
+                *sql.annotation_select,
+            ]
+        translatable = _get_selected_fields(self.model, self._trans_fields)
+        fields = [
+            (index, name) for (index, name) in enumerate(names)
+            if name in translatable
+        ]
+
+        # the sql strategy rows which select no translatable fields have
+        # their translated annotations already
+        strategy = self._trans_strategy
+        if strategy != 'sql' or fields:
+            if sql.group_by is not None or sql.distinct or sql.combinator:
+                raise TypeError(
+                    'Translations does not support grouped, distinct or ' +
+                    'combined values (yet). ' +
+                    'If necessary you can translate the instances instead.'
+                )
+
+        if iterable_class is query.NamedValuesListIterable:
+            tuple_class = create_namedtuple_class(*names)
+
+        # fetch the pk (or the translated annotations of the sql strategy)
+        # along with the rows as the last column(s)
+        clone = self._chain()
+        clone._trans_lang = _get_default_language()
+        if not dicts:
+            clone._iterable_class = query.ValuesListIterable
+        if fields and strategy == 'sql':
+            extras = [
+                ('_trans_{}'.format(name), name) for (_, name) in fields
+            ]
+            clone = clone.annotate(**{
+                extra: F(_get_translation_alias(name))
+                for (extra, name) in extras
+            })
+        elif fields:
+            clone = clone.annotate(_trans_pk=F('pk'))
+
+        if chunk_size is None:
+            chunks = [list(clone)]
+        else:
+            rows = iter(clone.iterator(chunk_size=chunk_size))
+            chunks = iter(
+                lambda: list(itertools.islice(rows, chunk_size)),
+                []
             )
 
-        if not self._trans_cache:
-            with Context(self._result_cache, *self._trans_rels) \
-                    as context:
-                context.read(self._trans_lang)
-            self._trans_cache = True
+        content_type_id = self.model._get_content_type_id()
+        langs = _get_language_chain(self._trans_lang)
 
-    def translate(self, lang=None):
+        for chunk in chunks:
+            if fields and strategy == 'sql':
+                count = len(extras)
+                if dicts:
+                    for row in chunk:
+                        for (extra, name) in extras:
+                            row[name] = row.pop(extra)
+                else:
+                    translated = []
+                    for row in chunk:
+                        texts = row[-count:]
+                        row = list(row[:-count])
+                        for ((index, _), text) in zip(fields, texts):
+                            row[index] = text
+                        translated.append(row)
+                    chunk = translated
+            elif fields:
+                if dicts:
+                    pks = [str(row.pop('_trans_pk')) for row in chunk]
+                else:
+                    pks = [str(row[-1]) for row in chunk]
+                    chunk = [list(row[:-1]) for row in chunk]
+
+                texts = {}
+                # the languages with higher priorities are read last
+                _translations = sorted(
+                    _get_translations(
+                        {content_type_id: set(pks)},
+                        langs,
+                        fields={
+                            content_type_id: {name for (_, name) in fields}
+                        },
+                    ),
+                    key=lambda x: langs.index(x.language),
+                    reverse=True,
+                )
+                for translation in _translations:
+                    address = (translation.object_id, translation.field)
+                    texts[address] = translation.text
+
+                for (pk, row) in zip(pks, chunk):
+                    for (index, name) in fields:
+                        key = name if dicts else index
+                        row[key] = texts.get((pk, name), row[key])
+
+            for row in chunk:
+                if iterable_class is query.FlatValuesListIterable:
+                    yield row[0]
+                elif iterable_class is query.NamedValuesListIterable:
+                    yield tuple_class(*row)
+                elif not dicts:
+                    yield tuple(row)
+                else:
+                    yield row
+
+    def translate(self, lang=None, strategy='python', fields=None):
         """Translate the `TranslatableQuerySet` in a language."""
+        if strategy not in ('python', 'sql', 'lazy'):
+            raise ValueError(
+                '`{}` is not a supported strategy.'.format(strategy)
+            )
+
+        if fields is not None:
+            fields = tuple(fields)
+            translatable = self.model._get_translatable_fields_set()
+            for field in fields:
+                if field not in translatable:
+                    raise ValueError(
+                        '`{}` is not a translatable field.'.format(field)
+                    )
+
         clone = self.all()
         clone._trans_lang = _get_translate_language(lang)
+        clone._trans_strategy = strategy
+        clone._trans_fields = fields
+
+        # the annotations of a previous translation are replaced
+        if clone._trans_aliases:
+            sql = clone.query
+            for alias in clone._trans_aliases:
+                sql.annotations.pop(alias, None)
+            if sql.annotation_select_mask is not None:
+                sql.set_annotation_mask(
+                    sql.annotation_select_mask - set(clone._trans_aliases)
+                )
+            else:
+                sql._annotation_select_cache = None
+            clone._trans_aliases = ()
+
+        if strategy == 'sql' and clone._trans_lang != _get_default_language():
+            annotations = _get_translations_annotations(
+                clone.model,
+                _get_language_chain(clone._trans_lang),
+                fields,
+            )
+            # the rows of `values` and `values_list` only select the fields
+            # which were asked for
+            if clone._fields is None:
+                clone = clone.annotate(**annotations)
+            else:
+                clone = clone.alias(**annotations)
+            clone._trans_aliases = tuple(annotations)
+
+        return clone
+
+    def translate_all(self, langs=None):
+        """
+        Translate the `TranslatableQuerySet` in some languages at once,
+        keeping them as overlays.
+        """
+        if langs is None:
+            langs = _get_translation_languages()
+        clone = self.all()
+        clone._trans_langs = tuple(
+            _get_translate_language(lang) for lang in langs
+        )
         return clone
 
-    def translate_related(self, *fields):
+    def translate_related(self, *relations, fields=None):
         """Translate some relations of the `TranslatableQuerySet`."""
         clone = self.all()
-        clone._trans_rels = () if fields == (None,) else fields
+        clone._trans_rels = () if relations == (None,) else relations
+        clone._trans_rels_fields = None if fields is None else tuple(fields)
         return clone
 
     def probe(self, lang=None):
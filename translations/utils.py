@@ -1,9 +1,14 @@
 """This module contains the utilities for the Translations app."""
 
-from django.db import models
+import functools
+import threading
+
+from django.apps import apps
+from django.db import models, connections, router
 from django.db.models.query import prefetch_related_objects
+from django.db.models.functions import Cast, Coalesce
 from django.db.models.constants import LOOKUP_SEP
-from django.core.exceptions import FieldError
+from django.core.exceptions import FieldError, FieldDoesNotExist
 from django.contrib.contenttypes.models import ContentType
 from django.utils.functional import SimpleLazyObject
 
@@ -13,6 +18,56 @@ import translations.models
 __docformat__ = 'restructuredtext'
 
 
+# the content type ids of the models, filled on the first use
+_content_type_ids = {}
+_content_type_ids_lock = threading.Lock()
+
+# the default size of the `Translation` write batches, some backends (like
+# PostgreSQL) do not limit the size of the batches by themselves
+_DEFAULT_BATCH_SIZE = 1000
+
+
+def _warm_content_type_ids():
+    """
+    Fetch the content type ids of all the translatable models at once and
+    return their number.
+    """
+    translatable = [
+        model for model in apps.get_models()
+        if issubclass(model, translations.models.Translatable)
+    ]
+    content_types = ContentType.objects.get_for_models(*translatable)
+    with _content_type_ids_lock:
+        for (model, content_type) in content_types.items():
+            _content_type_ids[model] = content_type.id
+    return len(content_types)
+
+
+def _get_content_type_id(model):
+    """Return the content type id of a model."""
+    try:
+        return _content_type_ids[model]
+    except KeyError:
+        pass
+
+    if not _content_type_ids:
+        _warm_content_type_ids()
+    if model not in _content_type_ids:
+        content_type_id = ContentType.objects.get_for_model(model).id
+        with _content_type_ids_lock:
+            _content_type_ids[model] = content_type_id
+    return _content_type_ids[model]
+
+
+def _clear_content_type_ids(**kwargs):
+    """Clear the content type ids when the content types may change."""
+    with _content_type_ids_lock:
+        _content_type_ids.clear()
+        for model in apps.get_models():
+            if '_cached_content_type_id' in model.__dict__:
+                del model._cached_content_type_id
+
+
 def _get_reverse_relation(model, relation):
     """Return the reverse of a model's relation."""
     parts = relation.split(LOOKUP_SEP)
@@ -39,6 +94,13 @@ def _get_reverse_relation(model, relation):
 
 def _get_dissected_lookup(model, lookup):
     """Return the dissected info of a lookup."""
+    dissected = _dissect_lookup(model, lookup)
+    return dict(dissected, relation=list(dissected['relation']))
+
+
+@functools.lru_cache(maxsize=1024)
+def _dissect_lookup(model, lookup):
+    """Dissect a lookup, caching the info per model and lookup."""
     dissected = {
         'relation': [],
         'field': '',
@@ -68,7 +130,7 @@ def _get_dissected_lookup(model, lookup):
             else:
                 dissected['field'] = root
                 if issubclass(model, translations.models.Translatable):
-                    if root in model._get_translatable_fields_names():
+                    if root in model._get_translatable_fields_set():
                         dissected['translatable'] = True
                 if nest:
                     if len(nest) == 1:
@@ -110,8 +172,78 @@ def _get_relations_hierarchy(*relations):
     return hierarchy
 
 
-def _get_entity_details(entity):
-    """Return the iteration and type details of an entity."""
+def _is_deferred_lookup(deferred_loading, lookup):
+    """
+    Return whether the last field of a lookup is deferred by `only()` or
+    `defer()`.
+    """
+    names, defer = deferred_loading
+    if defer:
+        return lookup in names
+
+    # `only()` loads all the fields of the models which it does not mention
+    prefix, _, field = lookup.rpartition(LOOKUP_SEP)
+    if prefix:
+        names = [
+            name[len(prefix) + len(LOOKUP_SEP):] for name in names
+            if name.startswith(prefix + LOOKUP_SEP)
+        ]
+    return bool(names) and not any(
+        name == field or name.startswith(field + LOOKUP_SEP)
+        for name in names
+    )
+
+
+def _get_relations_lookups(model, *relations, deferred_loading=None):
+    """
+    Return the `select_related` and `prefetch_related` lookups of some
+    relations of a model.
+    """
+    select_lookups = []
+    prefetch_lookups = []
+
+    for relation in relations:
+        parts = relation.split(LOOKUP_SEP)
+        forward = []
+        traversing = True
+
+        branch_model = model
+        for part in parts:
+            try:
+                field = branch_model._meta.get_field(part)
+            except FieldDoesNotExist:
+                # the plain attributes are left to the purview to fetch
+                break
+            if not (
+                (field.many_to_one or field.one_to_one) and
+                field.related_model
+            ):
+                traversing = False
+            # the deferred fields can not be traversed by `select_related`
+            elif deferred_loading is not None and _is_deferred_lookup(
+                deferred_loading, LOOKUP_SEP.join(forward + [part])
+            ):
+                traversing = False
+            if traversing:
+                forward.append(part)
+            branch_model = field.related_model
+            if branch_model is None:
+                break
+        else:
+            if len(forward) < len(parts):
+                prefetch_lookups.append(relation)
+
+        if forward:
+            select_lookups.append(LOOKUP_SEP.join(forward))
+
+    return select_lookups, prefetch_lookups
+
+
+def _get_entity_groups(entity):
+    """
+    Return the instances of an entity grouped by their models, iterating
+    the entity only once.
+    """
 
     error_message = SimpleLazyObject(
         lambda: '`{}` is neither {} nor {}.'.format(
@@ -122,94 +254,256 @@ def _get_entity_details(entity):
     )
 
     if isinstance(entity, models.Model):
-        model = type(entity)
-        iterable = False
-    elif hasattr(entity, '__iter__'):
-        if len(entity) > 0:
-            if isinstance(entity[0], models.Model):
-                model = type(entity[0])
-            else:
-                raise TypeError(error_message)
-        else:
-            model = None
-        iterable = True
-    else:
+        return {type(entity): [entity]}
+    if not hasattr(entity, '__iter__'):
         raise TypeError(error_message)
 
-    return (iterable, model)
+    groups = {}
+    model = objs = None
+    for obj in entity:
+        # the consecutive instances are usually of the same model
+        if type(obj) is not model:
+            if not isinstance(obj, models.Model):
+                raise TypeError(error_message)
+            model = type(obj)
+            objs = groups.setdefault(model, [])
+        objs.append(obj)
 
+    return groups
 
-def _get_purview(entity, hierarchy):
-    """Return the purview of an entity and a relations hierarchy of it."""
-    mapping = {}
-    query = models.Q()
 
-    def _fill_entity(entity, hierarchy, included=True):
-        iterable, model = _get_entity_details(entity)
+def _get_selected_fields(model, fields=None):
+    """Return the names of a model's translatable fields which are selected."""
+    names = model._get_translatable_fields_names()
+    if fields is None:
+        return names
+    return [name for name in names if name in fields]
 
-        if model is None:
-            return
 
-        content_type_id = ContentType.objects.get_for_model(model).id
+def _get_purview(entity, hierarchy, fields=None, related_fields=None):
+    """Return the purview of an entity and a relations hierarchy of it."""
+    mapping = {}
+    query = {}
 
+    def _fill_objects(model, objs, hierarchy, included=True):
         if included:
-            instances = mapping.setdefault(content_type_id, {})
             if not issubclass(model, translations.models.Translatable):
                 raise TypeError('`{}` is not Translatable!'.format(model))
-
-        def _fill_obj(obj):
-            if included:
-                if not hasattr(obj, '_default_translatable_fields'):
-                    obj._default_translatable_fields = {
-                        field: getattr(obj, field) for field in
-                        type(obj)._get_translatable_fields_names()
-                    }
+            content_type_id = model._get_content_type_id()
+            instances = mapping.setdefault(content_type_id, {})
+            object_ids = query.setdefault(content_type_id, set())
+            names = _get_selected_fields(
+                model, fields if model in roots else related_fields
+            )
+            for obj in objs:
+                values = obj.__dict__
+                defaults = values.setdefault(
+                    '_default_translatable_fields', {}
+                )
+                # the deferred fields are not loaded to be snapshotted
+                for field in names:
+                    if field not in defaults and field in values:
+                        defaults[field] = values[field]
                 object_id = str(obj.pk)
                 instances[object_id] = obj
-                nonlocal query
-                query |= models.Q(
-                    content_type__id=content_type_id,
-                    object_id=object_id,
-                )
+                object_ids.add(object_id)
+
+        if hierarchy:
+            for (relation, detail) in hierarchy.items():
+                try:
+                    field = model._meta.get_field(relation)
+                except FieldDoesNotExist:
+                    field = None
+
+                values = []
+                if field is not None and (
+                    field.many_to_one or field.one_to_one
+                ):
+                    # fetch the relation of the objects in this level which
+                    # do not have it cached yet at once
+                    missing = [obj for obj in objs if not field.is_cached(obj)]
+                    if missing:
+                        prefetch_related_objects(missing, relation)
+                    for obj in objs:
+                        value = field.get_cached_value(obj, None)
+                        if value is not None:
+                            values.append(value)
+                else:
+                    if field is not None and field.is_relation:
+                        prefetch_related_objects(objs, relation)
+                    for obj in objs:
+                        value = getattr(obj, relation, None)
+                        if value is not None:
+                            if isinstance(value, models.Manager):
+                                values.extend(value.all())
+                            else:
+                                values.append(value)
+
+                # the generic relations may point to several models
+                for (value_model, value_objs) in \
+                        _get_entity_groups(values).items():
+                    _fill_objects(
+                        value_model,
+                        value_objs,
+                        hierarchy=detail['relations'],
+                        included=detail['included'],
+                    )
+
+    # the entity's models use the fields and the other models the related ones
+    groups = _get_entity_groups(entity)
+    roots = frozenset(groups)
+    for (model, objs) in groups.items():
+        _fill_objects(model, objs, hierarchy)
 
-            if hierarchy:
-                for (relation, detail) in hierarchy.items():
-                    value = getattr(obj, relation, None)
-
-                    if value is not None:
-                        if isinstance(value, models.Manager):
-                            if not (
-                                hasattr(obj, '_prefetched_objects_cache') and
-                                relation in obj._prefetched_objects_cache
-                            ):
-                                prefetch_related_objects([obj], relation)
-                            value = value.all()
-                        _fill_entity(
-                            entity=value,
-                            hierarchy=detail['relations'],
-                            included=detail['included'],
-                        )
+    return mapping, query
 
-        if iterable:
-            for obj in entity:
-                _fill_obj(obj)
-        else:
-            _fill_obj(entity)
 
-    _fill_entity(entity, hierarchy)
+def _is_integer_field(field):
+    """Return whether a field's values are stored as integers."""
+    while field.is_relation:
+        field = field.target_field
+    return isinstance(field, models.IntegerField)
+
+
+def _get_object_id_int(object_id):
+    """Return the integer form of an object id or `None` if it has none."""
+    try:
+        object_id_int = int(object_id)
+    except (TypeError, ValueError):
+        return None
+    # only the canonical forms fit in a big integer column
+    if str(object_id_int) != str(object_id) or \
+            not -2 ** 63 <= object_id_int < 2 ** 63:
+        return None
+    return object_id_int
+
+
+def _get_batch_size(fields, objs, batch_size=None):
+    """Return the size of the `Translation` write batches of some objects."""
+    model = translations.models.Translation
+    connection = connections[router.db_for_write(model)]
+    max_batch_size = max(connection.ops.bulk_batch_size(fields, objs), 1)
+    return min(batch_size or _DEFAULT_BATCH_SIZE, max_batch_size)
 
-    return mapping, query
 
+def _get_translations_querysets(query, lang, batch_size=None, fields=None):
+    """Yield the `Translation` querysets of a query in some language(s)."""
+    model = translations.models.Translation
+    connection = connections[router.db_for_read(model)]
+    max_params = connection.features.max_query_params
 
-def _get_translations(query, lang):
-    """Return the `Translation` queryset of a query in a language."""
-    if (query):
-        queryset = translations.models.Translation.objects.filter(
-            language=lang,
-        ).filter(
-            query,
-        ).select_related('content_type')
+    if isinstance(lang, (list, tuple)) and len(lang) == 1:
+        lang = lang[0]
 
-        return queryset
+    if isinstance(lang, (list, tuple)):
+        languages = {'language__in': list(lang)}
+        langs_params = len(lang)
     else:
-        return translations.models.Translation.objects.none()
+        languages = {'language': lang}
+        langs_params = 1
+
+    conditions = models.Q()
+    params = langs_params
+
+    for (content_type_id, object_ids) in sorted(query.items()):
+        # the content types without some fields read only the others
+        names = {}
+        if fields is not None and content_type_id in fields:
+            if not fields[content_type_id]:
+                continue
+            names = {'field__in': sorted(fields[content_type_id])}
+        names_params = len(names.get('field__in', ()))
+
+        object_ids = sorted(object_ids)
+        while object_ids:
+            if max_params is None:
+                size = len(object_ids)
+            else:
+                # the content type, the fields and at least one object id
+                # must fit
+                size = max_params - params - 1 - names_params
+                if size < 1:
+                    yield model.objects.filter(**languages).filter(
+                        conditions
+                    )
+                    conditions = models.Q()
+                    params = langs_params
+                    continue
+            if batch_size is not None:
+                size = min(size, batch_size)
+            chunk, object_ids = object_ids[:size], object_ids[size:]
+            conditions |= models.Q(
+                content_type_id=content_type_id,
+                object_id__in=chunk,
+                **names
+            )
+            params += 1 + names_params + len(chunk)
+
+            # each batch is queried on its own
+            if batch_size is not None:
+                yield model.objects.filter(**languages).filter(conditions)
+                conditions = models.Q()
+                params = langs_params
+
+    if conditions:
+        yield model.objects.filter(**languages).filter(conditions)
+
+
+def _get_translations(query, lang, fields=None):
+    """Return the `Translation` instances of a query in some language(s)."""
+    return [
+        translation
+        for queryset in _get_translations_querysets(query, lang, fields=fields)
+        for translation in queryset
+    ]
+
+
+def _get_translation_alias(field):
+    """Return the alias of a field's translation annotation."""
+    return 'translated_{}'.format(field)
+
+
+def _get_object_id_filter(model, ref):
+    """
+    Return the filter which matches the object ids of the translations with
+    the primary keys of a model.
+    """
+    object_id_field = translations.models.Translation._meta.get_field(
+        'object_id'
+    )
+
+    if _is_integer_field(model._meta.pk):
+        return {'object_id_int': ref}
+    if model._meta.pk.get_internal_type() != \
+            object_id_field.get_internal_type():
+        ref = Cast(ref, output_field=models.TextField())
+    return {'object_id': ref}
+
+
+def _get_translations_annotations(model, lang, fields=None):
+    """Return the translation annotations of a model in some language(s)."""
+    content_type_id = model._get_content_type_id()
+    object_id_filter = _get_object_id_filter(model, models.OuterRef('pk'))
+    langs = lang if isinstance(lang, (list, tuple)) else [lang]
+
+    annotations = {}
+    for field in _get_selected_fields(model, fields):
+        # the first language which has a translation wins
+        subqueries = [
+            models.Subquery(
+                translations.models.Translation.objects.filter(
+                    content_type_id=content_type_id,
+                    field=field,
+                    language=lang,
+                    **object_id_filter
+                ).values('text')[:1]
+            )
+            for lang in langs
+        ]
+        annotations[_get_translation_alias(field)] = Coalesce(
+            *subqueries,
+            models.F(field),
+            output_field=models.TextField(),
+        )
+
+    return annotations